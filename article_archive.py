@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 기사 아카이브
+수집한 기사(메타데이터 + 정제된 본문)를 SQLite에 저장하고 FTS5 전문 검색 제공
+
+사용법:
+    python article_archive.py search 인공지능 --since 2025-01-01 --until 2025-03-31
+    python article_archive.py stats
+"""
+
+import os
+import sqlite3
+import logging
+import argparse
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from state_store import get_state_path
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DB_FILE = 'articles.db'
+PUBLISHED_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    source TEXT,
+    published TEXT NOT NULL,
+    collected_at TEXT NOT NULL,
+    keywords TEXT,
+    summary TEXT,
+    content TEXT,
+    content_length INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published);
+"""
+
+# 외부 콘텐츠 FTS5 테이블 (본문은 articles에만 저장, 트리거로 색인 동기화)
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, keywords, content,
+    content='articles', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, keywords, content)
+    VALUES (new.id, new.title, new.keywords, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, keywords, content)
+    VALUES ('delete', old.id, old.title, old.keywords, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts (articles_fts, rowid, title, keywords, content)
+    VALUES ('delete', old.id, old.title, old.keywords, old.content);
+    INSERT INTO articles_fts (rowid, title, keywords, content)
+    VALUES (new.id, new.title, new.keywords, new.content);
+END;
+"""
+
+UPSERT_SQL = """
+INSERT INTO articles (url, title, source, published, collected_at, keywords, summary, content, content_length)
+VALUES (:url, :title, :source, :published, :collected_at, :keywords, :summary, :content, :content_length)
+ON CONFLICT(url) DO UPDATE SET
+    title = excluded.title,
+    source = excluded.source,
+    published = excluded.published,
+    collected_at = excluded.collected_at,
+    keywords = excluded.keywords,
+    summary = excluded.summary,
+    content = excluded.content,
+    content_length = excluded.content_length
+"""
+
+
+class ArticleArchive:
+    """SQLite + FTS5 기사 아카이브"""
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or os.getenv('ARCHIVE_DB_PATH') or get_state_path(ARCHIVE_DB_FILE)
+        self.fts_available = True
+        self._initialize()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _initialize(self):
+        """테이블/색인 생성 (FTS5 미지원 SQLite면 LIKE 검색으로 대체)"""
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(SCHEMA)
+            try:
+                conn.executescript(FTS_SCHEMA)
+            except sqlite3.OperationalError as e:
+                self.fts_available = False
+                logger.warning(f"SQLite FTS5를 사용할 수 없어 LIKE 검색으로 대체합니다: {e}")
+        conn.close()
+
+    def save_articles(self, articles: List[Dict]) -> int:
+        """기사 목록을 트랜잭션 1회로 저장 (URL 기준 upsert) → 저장 건수"""
+        collected_at = datetime.now().strftime(PUBLISHED_FORMAT)
+        rows = []
+        for article in articles:
+            if not article.get('url'):
+                continue
+
+            published = article.get('published')
+            if isinstance(published, datetime):
+                published = published.strftime(PUBLISHED_FORMAT)
+
+            rows.append({
+                'url': article['url'],
+                'title': article.get('title', ''),
+                'source': article.get('source', ''),
+                'published': published or collected_at,
+                'collected_at': collected_at,
+                'keywords': ', '.join(article.get('found_keywords', [])),
+                'summary': article.get('summary', ''),
+                'content': article.get('content', ''),
+                'content_length': article.get('content_length', len(article.get('content', '')))
+            })
+
+        if not rows:
+            return 0
+
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(UPSERT_SQL, rows)
+        finally:
+            conn.close()
+
+        logger.info(f"기사 아카이브 저장: {len(rows)}개 ({self.db_path})")
+        return len(rows)
+
+    def search(self, query: Optional[str] = None, since: Optional[str] = None, until: Optional[str] = None,
+               source: Optional[str] = None, limit: int = 20) -> List[Dict]:
+        """
+        키워드/기간/언론사 조건 검색
+
+        Args:
+            query: 검색어 (공백으로 구분한 단어 모두 포함, 단어 뒤 조사는 접두어 검색으로 허용)
+            since: 시작일 (YYYY-MM-DD, 포함)
+            until: 종료일 (YYYY-MM-DD, 포함)
+            source: 언론사
+            limit: 최대 결과 수
+        """
+        conditions = []
+        params = []
+
+        if since:
+            conditions.append('a.published >= ?')
+            params.append(since)
+        if until:
+            next_day = datetime.strptime(until, '%Y-%m-%d') + timedelta(days=1)
+            conditions.append('a.published < ?')
+            params.append(next_day.strftime('%Y-%m-%d'))
+        if source:
+            conditions.append('a.source = ?')
+            params.append(source)
+
+        terms = (query or '').split()
+        if terms and self.fts_available:
+            # "단어"* 형식: 특수문자는 그대로 검색, "인공지능이" 같은 조사 붙은 형태도 매치
+            match = ' '.join('"{}"*'.format(term.replace('"', '""')) for term in terms)
+            sql = (
+                "SELECT a.*, snippet(articles_fts, 2, '[', ']', '…', 12) AS snippet "
+                "FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+                "WHERE articles_fts MATCH ?"
+            )
+            params.insert(0, match)
+            order = 'ORDER BY bm25(articles_fts), a.published DESC'
+        else:
+            sql = "SELECT a.*, substr(a.content, 1, 80) AS snippet FROM articles a WHERE 1=1"
+            for term in terms:
+                conditions.append('(a.title LIKE ? OR a.content LIKE ? OR a.keywords LIKE ?)')
+                params.extend([f'%{term}%'] * 3)
+            order = 'ORDER BY a.published DESC'
+
+        if conditions:
+            sql += ' AND ' + ' AND '.join(conditions)
+        sql += f' {order} LIMIT ?'
+        params.append(limit)
+
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+
+    def get_stats(self) -> Dict:
+        """저장 기사 수와 기간"""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                'SELECT COUNT(*) AS total, MIN(published) AS oldest, MAX(published) AS newest, '
+                'COUNT(DISTINCT source) AS sources FROM articles'
+            ).fetchone()
+            return dict(row)
+        finally:
+            conn.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """아카이브 검색 CLI"""
+    parser = argparse.ArgumentParser(prog='article_archive.py', description='로컬 기사 아카이브 검색')
+    subparsers = parser.add_subparsers(dest='command')
+
+    search_parser = subparsers.add_parser('search', help='키워드/기간 검색')
+    search_parser.add_argument('query', nargs='*', help='검색어 (생략 시 기간 조건만)')
+    search_parser.add_argument('--since', help='시작일 YYYY-MM-DD')
+    search_parser.add_argument('--until', help='종료일 YYYY-MM-DD')
+    search_parser.add_argument('--source', help='언론사')
+    search_parser.add_argument('--limit', type=int, default=20, help='최대 결과 수')
+
+    subparsers.add_parser('stats', help='아카이브 통계')
+
+    args = parser.parse_args(argv)
+    archive = ArticleArchive()
+
+    if args.command == 'search':
+        try:
+            for value in filter(None, (args.since, args.until)):
+                datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            print("❌ 날짜는 YYYY-MM-DD 형식으로 입력하세요 (예: 2025-01-15)")
+            return 1
+
+        started = time.perf_counter()
+        results = archive.search(' '.join(args.query), args.since, args.until, args.source, args.limit)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        print(f"🔍 검색 결과: {len(results)}개 ({elapsed_ms:.1f}ms)")
+        print("=" * 50)
+        for i, article in enumerate(results, 1):
+            print(f"{i}. {article['title']}")
+            print(f"   📰 {article['source']} | ⏰ {article['published']} | 🏷️ {article['keywords']}")
+            if article.get('snippet'):
+                print(f"   💡 {article['snippet']}")
+            print(f"   🔗 {article['url']}")
+        return 0
+
+    if args.command == 'stats':
+        stats = archive.get_stats()
+        print("📚 기사 아카이브")
+        print("=" * 50)
+        print(f"📄 기사: {stats['total']}개 (언론사 {stats['sources']}곳)")
+        print(f"📅 기간: {stats['oldest'] or '-'} ~ {stats['newest'] or '-'}")
+        print(f"🔎 전문 검색: {'FTS5' if archive.fts_available else 'LIKE (FTS5 미지원)'}")
+        print(f"💾 경로: {archive.db_path}")
+        return 0
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+기사 직렬화
+기사 목록을 JSON으로 저장/복원 (전송 대기함, 일별 보관소 등 디스크 기록에 공통 사용)
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+
+def encode_articles(articles: List[Dict]) -> List[Dict]:
+    """기사 목록을 JSON으로 저장 가능한 형태로 변환 (datetime → ISO 문자열)"""
+    encoded = []
+    for article in articles:
+        item = dict(article)
+        if isinstance(item.get('published'), datetime):
+            item['published'] = item['published'].isoformat()
+        encoded.append(item)
+    return encoded
+
+
+def decode_articles(items: List[Dict]) -> List[Dict]:
+    """encode_articles 결과를 기사 목록으로 복원"""
+    articles = []
+    for item in items:
+        article = dict(item)
+        if isinstance(article.get('published'), str):
+            try:
+                article['published'] = datetime.fromisoformat(article['published'])
+            except ValueError:
+                article['published'] = datetime.now()
+        articles.append(article)
+    return articles
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+KeywordManager Sheets API 호출 벤치마크
+가짜 Sheets 백엔드로 수집 1회(기사 N개 × 키워드 매치 M개)를 재현하고
+API 호출 수와 소요 시간을 측정 (인증 정보/네트워크 불필요)
+
+사용법:
+    python benchmark_keywords.py --articles 100 --hits 3 --latency-ms 50
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='KeywordManager Sheets API 호출 벤치마크')
+    parser.add_argument('--articles', type=int, default=100, help='수집 기사 수 (N)')
+    parser.add_argument('--hits', type=int, default=3, help='기사당 매치 키워드 수 (M)')
+    parser.add_argument('--latency-ms', type=float, default=50, help='가짜 API 호출당 지연 (ms)')
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help='429 오류 주입 비율 (0~1)')
+    parser.add_argument('--rpm', type=float, default=6000, help='분당 요청 한도 (SHEETS_REQUESTS_PER_MINUTE)')
+    parser.add_argument('--runs', type=int, default=1, help='같은 프로세스에서 반복할 수집 횟수')
+    return parser.parse_args()
+
+
+def configure_environment(args, data_dir: str):
+    """KeywordManager import 전에 가짜 백엔드와 임시 상태 디렉토리 설정"""
+    os.environ['KEYWORD_SHEETS_BACKEND'] = 'fake'
+    os.environ['NEWS_AGENT_DATA_DIR'] = data_dir
+    os.environ['FAKE_SHEETS_LATENCY_MS'] = str(args.latency_ms)
+    os.environ['FAKE_SHEETS_QUOTA_ERROR_RATE'] = str(args.quota_error_rate)
+    os.environ['SHEETS_REQUESTS_PER_MINUTE'] = str(args.rpm)
+    # 측정 구간에는 주기 기록 없이 flush_usage 1회로만 반영
+    os.environ['KEYWORD_WRITER_FLUSH_INTERVAL'] = '3600'
+    os.environ.pop('GOOGLE_SHEETS_SPREADSHEET_ID', None)
+
+
+def print_calls(title: str, stats: dict):
+    print(f"\n📡 {title}: 총 {stats['total_calls']}회")
+    for method, count in sorted(stats['calls'].items(), key=lambda item: -item[1]):
+        print(f"  • {method}: {count}회")
+    if stats.get('coalesced'):
+        print(f"  • 병합된 읽기: {stats['coalesced']}회")
+    if stats.get('quota_errors'):
+        print(f"  • 429 재시도: {stats['quota_errors']}회 (대기 {stats['throttled_seconds']}초)")
+
+
+def run_collection(manager, articles: int, hits: int) -> dict:
+    """수집 1회 재현 (키워드 로드 → 기사별 매치 통계 → 종료 시 일괄 기록)"""
+    started = time.perf_counter()
+
+    keywords = manager.get_search_keywords()
+    if not keywords:
+        raise RuntimeError("키워드를 불러오지 못했습니다")
+
+    for i in range(articles):
+        for j in range(hits):
+            keyword = keywords[(i * hits + j) % len(keywords)]
+            manager.update_usage(keyword, 1)
+    enqueued = time.perf_counter()
+
+    manager.flush_usage()
+    finished = time.perf_counter()
+
+    return {
+        'events': articles * hits,
+        'enqueue_seconds': enqueued - started,
+        'flush_seconds': finished - enqueued,
+        'total_seconds': finished - started
+    }
+
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory(prefix='keyword-bench-') as data_dir:
+        configure_environment(args, data_dir)
+
+        from keyword_manager import KeywordManager
+
+        print("⏱️ KeywordManager Sheets API 벤치마크")
+        print("=" * 50)
+        print(f"기사 {args.articles}개 × 키워드 {args.hits}개, 호출 지연 {args.latency_ms}ms, "
+              f"429 비율 {args.quota_error_rate}, 분당 한도 {args.rpm:g}")
+
+        setup_started = time.perf_counter()
+        manager = KeywordManager()
+        if not manager.wait_until_ready() or not manager.sheets_available:
+            print("❌ 가짜 Sheets 백엔드 초기화 실패")
+            return 1
+
+        print(f"\n🔧 초기화 (시트 생성 + 키워드 로드): {time.perf_counter() - setup_started:.2f}초")
+        print_calls("초기화 API 호출", manager.get_api_stats())
+
+        for run in range(1, args.runs + 1):
+            manager.sheets_client.reset_stats()
+            result = run_collection(manager, args.articles, args.hits)
+
+            print(f"\n📊 수집 {run}회차")
+            print(f"  • 사용 이벤트: {result['events']}개")
+            print(f"  • 이벤트 적재: {result['enqueue_seconds'] * 1000:.1f}ms")
+            print(f"  • 일괄 기록: {result['flush_seconds']:.2f}초")
+            print(f"  • 전체: {result['total_seconds']:.2f}초")
+            print_calls("API 호출", manager.get_api_stats())
+
+        manager.shutdown()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Notion 저장 경로 처리량 벤치마크
+로컬 Notion 대역 서버(notion_stub_server.py)에 StorageManager로 기사 N개를 저장하고
+저장 모드별 pages/s, blocks/s, 요청 수를 측정 (인증 정보/네트워크 불필요)
+
+클라이언트 요청 한도는 기본적으로 운영 설정(NOTION_REQUESTS_PER_SECOND, 기본 3/s)을 따르므로
+결과는 실제 저장 속도에 가깝고, --unpaced를 주면 한도 없는 측정도 함께 출력
+
+사용법:
+    python benchmark_storage.py --sizes 10,100,1000 --latency-ms 100 --rate-limit 3
+    python benchmark_storage.py --sizes 10,100 --unpaced
+"""
+
+import os
+import sys
+import time
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Notion 저장 경로 처리량 벤치마크')
+    parser.add_argument('--sizes', default='10,100,1000', help='기사 수 목록 (쉼표 구분)')
+    parser.add_argument('--modes', default='page,daily,rows', help='저장 모드 목록 (NOTION_STORAGE_MODE)')
+    parser.add_argument('--layout', default='standard', help='페이지 레이아웃 (NOTION_PAGE_LAYOUT)')
+    parser.add_argument('--latency-ms', type=float, default=50, help='대역 서버 요청당 지연 (ms)')
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help='무작위 429 비율 (0~1)')
+    parser.add_argument('--rate-limit', type=float, default=0, help='서버 측 초당 요청 한도 (0이면 제한 없음)')
+    parser.add_argument('--rps', type=float, default=float(os.getenv('NOTION_REQUESTS_PER_SECOND', '3')),
+                        help='클라이언트 초당 요청 한도 (기본: NOTION_REQUESTS_PER_SECOND 또는 3)')
+    parser.add_argument('--unpaced', action='store_true', help='클라이언트 한도 없는 측정도 함께 출력')
+    parser.add_argument('--workers', type=int, default=3, help='행 모드 동시 요청 수 (NOTION_WRITE_WORKERS)')
+    return parser.parse_args()
+
+
+# 한도 없는 측정에 쓰는 클라이언트 초당 요청 수 (토큰 버킷이 사실상 대기하지 않는 값)
+UNPACED_RPS = 1_000_000
+
+
+def configure_environment(args, base_url: str, data_dir: str, mode: str, rps: float):
+    """StorageManager 생성 전에 대역 서버와 임시 상태 디렉토리 설정"""
+    os.environ.update({
+        'NOTION_API_BASE_URL': base_url,
+        'NOTION_API_KEY': 'stub-secret',
+        'NOTION_DATABASE_ID': '00000000-0000-0000-0000-000000000001',
+        'NOTION_ARTICLES_DATABASE_ID': '00000000-0000-0000-0000-000000000002',
+        'NOTION_STORAGE_MODE': mode,
+        'NOTION_PAGE_LAYOUT': args.layout,
+        'NOTION_REQUESTS_PER_SECOND': str(rps),
+        'NOTION_WRITE_WORKERS': str(args.workers),
+        'NEWS_AGENT_DATA_DIR': data_dir,
+        'ARCHIVE_ENABLED': 'false'
+    })
+
+
+def make_articles(count: int) -> list:
+    """벤치마크용 기사 생성 (URL은 모두 다름)"""
+    now = datetime.now()
+    body = "인공지능 모델과 반도체 시장 동향에 관한 기사 본문입니다. " * 20
+    return [
+        {
+            'title': f'벤치마크 기사 {i}',
+            'source': f'언론사{i % 5}',
+            'published': now - timedelta(minutes=i),
+            'url': f'https://example.com/news/{i}',
+            'summary': body[:300],
+            'content': body,
+            'content_length': len(body),
+            'found_keywords': ['AI', 'LLM']
+        }
+        for i in range(count)
+    ]
+
+
+def run_once(args, server, mode: str, count: int, rps: float) -> dict:
+    """저장 1회 실행 후 처리량 집계"""
+    with tempfile.TemporaryDirectory(prefix='storage-bench-') as data_dir:
+        configure_environment(args, server.base_url, data_dir, mode, rps)
+
+        from storage_manager import StorageManager
+        storage = StorageManager()
+        server.state.reset_stats()
+
+        started = time.perf_counter()
+        page_url = storage.save_news_to_notion(make_articles(count))
+        elapsed = time.perf_counter() - started
+
+        stub_stats = server.state.get_stats()
+        client_stats = storage.get_api_stats()
+        storage.notion.close()
+
+    pages = stub_stats['pages_created'] + stub_stats['pages_updated']
+    blocks = stub_stats['blocks_created'] + stub_stats['blocks_updated']
+    return {
+        'success': page_url is not None,
+        'seconds': elapsed,
+        'pages': pages,
+        'blocks': blocks,
+        'pages_per_second': pages / elapsed if elapsed else 0,
+        'blocks_per_second': blocks / elapsed if elapsed else 0,
+        'requests': stub_stats['requests'],
+        'rate_limited': stub_stats['rate_limited'] + stub_stats['injected_errors'],
+        'retries': client_stats['retries']
+    }
+
+
+def main():
+    args = parse_args()
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+
+    from notion_stub_server import NotionStubServer
+
+    print("⏱️ Notion 저장 경로 벤치마크 (로컬 대역 서버)")
+    print("=" * 50)
+    print(f"요청 지연 {args.latency_ms}ms, 429 비율 {args.quota_error_rate}, 서버 한도 {args.rate_limit or '없음'}, "
+          f"클라이언트 한도 {args.rps:g}/s, 레이아웃 {args.layout}")
+
+    pacings = [('한도 적용', args.rps)]
+    if args.unpaced:
+        pacings.append(('한도 없음', UNPACED_RPS))
+
+    failed = False
+    with NotionStubServer(latency_ms=args.latency_ms, quota_error_rate=args.quota_error_rate,
+                          rate_limit=args.rate_limit, retry_after=0.2) as server:
+        for mode in modes:
+            for label, rps in pacings:
+                pacing = f"{label}, {rps:g}/s" if rps != UNPACED_RPS else label
+                print(f"\n📄 저장 모드: {mode} ({pacing})")
+                if not print_table(args, server, mode, sizes, rps):
+                    failed = True
+
+    return 1 if failed else 0
+
+
+def print_table(args, server, mode: str, sizes: list, rps: float) -> bool:
+    """기사 수별 처리량 표 출력 → 모두 저장 성공 여부"""
+    success = True
+    print(f"  {'기사':>6} {'시간(s)':>8} {'페이지':>6} {'블록':>7} {'pages/s':>8} {'blocks/s':>9} {'요청':>6} {'429':>5}")
+    for count in sizes:
+        result = run_once(args, server, mode, count, rps)
+        success = success and result['success']
+        mark = '' if result['success'] else '  ❌ 저장 실패'
+        print(f"  {count:>6} {result['seconds']:>8.2f} {result['pages']:>6} {result['blocks']:>7} "
+              f"{result['pages_per_second']:>8.1f} {result['blocks_per_second']:>9.1f} "
+              f"{result['requests']:>6} {result['rate_limited']:>5}{mark}")
+    return success
+
+
+if __name__ == "__main__":
+    sys.exit(main())
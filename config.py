@@ -9,12 +9,25 @@ import os
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
+_ENV_LOADED = False
+
+
+def load_env():
+    """.env 파일 로드 (프로세스당 1회, 여러 모듈에서 호출해도 다시 읽지 않음)"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
+
+    env_path = os.path.join(os.getcwd(), '.env')
+    if os.path.exists(env_path):
+        load_dotenv(env_path)
+    else:
+        print("⚠️ .env 파일을 찾을 수 없습니다. 환경 변수를 직접 확인합니다.")
+
+
 # .env 파일 로드
-env_path = os.path.join(os.getcwd(), '.env')
-if os.path.exists(env_path):
-    load_dotenv(env_path)
-else:
-    print("⚠️ .env 파일을 찾을 수 없습니다. 환경 변수를 직접 확인합니다.")
+load_env()
 
 class Config:
     """간소화된 Google News AI 시스템 설정"""
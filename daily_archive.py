@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+일별 압축 기사 보관소
+하루치 기사 레코드를 건별로 압축(zstd, 미설치 시 zlib)해 .dat 파일에 이어 붙이고,
+URL 해시 → 위치를 담은 고정 폭 인덱스(.idx)를 mmap으로 열어 전체 압축 해제 없이 1건씩 조회
+
+파일 형식:
+    YYYY-MM-DD.dat  헤더(매직 4B, 버전 1B, 코덱 1B) + [압축 레코드]...
+    YYYY-MM-DD.idx  헤더(매직 4B, 버전 1B, 예약 3B, 슬롯 수 4B, 레코드 수 4B)
+                    + 슬롯 × (URL 해시 8B, 오프셋 8B, 길이 4B, 원본 길이 4B)
+    인덱스는 선형 탐사 오픈 어드레싱 해시 테이블 (적재율 50% 이하, 해시 0 = 빈 슬롯)
+
+사용법:
+    python daily_archive.py stats 2025-01-15
+    python daily_archive.py get https://example.com/article --date 2025-01-15
+"""
+
+import os
+import sys
+import mmap
+import json
+import zlib
+import struct
+import hashlib
+import logging
+import argparse
+import importlib.util
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Union
+
+from state_store import get_state_path
+from article_codec import encode_articles, decode_articles
+
+logger = logging.getLogger(__name__)
+
+ZSTD_AVAILABLE = importlib.util.find_spec('zstandard') is not None
+
+DAILY_ARCHIVE_DIR = 'daily_archive'
+FORMAT_VERSION = 1
+
+DATA_MAGIC = b'NADA'
+DATA_HEADER = struct.Struct('<4sBB')
+INDEX_MAGIC = b'NADX'
+INDEX_HEADER = struct.Struct('<4sB3xII')
+INDEX_SLOT = struct.Struct('<QQII')
+
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+CODEC_NAMES = {CODEC_ZLIB: 'zlib', CODEC_ZSTD: 'zstd'}
+
+
+def url_hash(url: str) -> int:
+    """URL의 64비트 해시 (0은 빈 슬롯 표시용이므로 1로 치환)"""
+    value = int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little')
+    return value or 1
+
+
+def get_archive_dir() -> str:
+    """보관소 디렉토리 경로 반환 (없으면 생성)"""
+    archive_dir = os.getenv('DAILY_ARCHIVE_DIR') or get_state_path(DAILY_ARCHIVE_DIR)
+    os.makedirs(archive_dir, exist_ok=True)
+    return archive_dir
+
+
+def _day_paths(day: Union[str, date, None], archive_dir: Optional[str] = None):
+    if day is None:
+        day = date.today()
+    if isinstance(day, (date, datetime)):
+        day = day.strftime('%Y-%m-%d')
+    base = os.path.join(archive_dir or get_archive_dir(), day)
+    return f'{base}.dat', f'{base}.idx'
+
+
+class _Codec:
+    """레코드 단위 압축/해제 (zstd 우선, 없으면 zlib)"""
+
+    def __init__(self, codec_id: int, level: Optional[int] = None):
+        self.codec_id = codec_id
+
+        if codec_id == CODEC_ZSTD:
+            if not ZSTD_AVAILABLE:
+                raise RuntimeError("zstd로 압축된 보관 파일입니다. pip install zstandard 후 다시 시도하세요")
+            import zstandard
+            self._compressor = zstandard.ZstdCompressor(level=level or 10)
+            self._decompressor = zstandard.ZstdDecompressor()
+        elif codec_id == CODEC_ZLIB:
+            self.level = level or 9
+        else:
+            raise ValueError(f"알 수 없는 압축 코덱: {codec_id}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.codec_id == CODEC_ZSTD:
+            return self._compressor.compress(data)
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes, size: int) -> bytes:
+        if self.codec_id == CODEC_ZSTD:
+            return self._decompressor.decompress(data, max_output_size=size)
+        return zlib.decompress(data)
+
+
+def _build_index(entries: List[tuple]) -> bytes:
+    """(해시, 오프셋, 길이, 원본 길이) 목록 → 인덱스 파일 바이트"""
+    slot_count = 16
+    while slot_count < len(entries) * 2:
+        slot_count *= 2
+
+    slots = [None] * slot_count
+    mask = slot_count - 1
+    for entry in entries:
+        slot = entry[0] & mask
+        while slots[slot] is not None:
+            slot = (slot + 1) & mask
+        slots[slot] = entry
+
+    empty = INDEX_SLOT.pack(0, 0, 0, 0)
+    body = b''.join(INDEX_SLOT.pack(*entry) if entry else empty for entry in slots)
+    return INDEX_HEADER.pack(INDEX_MAGIC, FORMAT_VERSION, slot_count, len(entries)) + body
+
+
+class DailyArchiveReader:
+    """하루치 보관 파일 조회 (인덱스/데이터 모두 mmap, 조회 시 해당 레코드만 압축 해제)"""
+
+    def __init__(self, day: Union[str, date, None] = None, archive_dir: Optional[str] = None):
+        self.data_path, self.index_path = _day_paths(day, archive_dir)
+
+        with open(self.index_path, 'rb') as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with open(self.data_path, 'rb') as f:
+            self._data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.slot_count, self.record_count = INDEX_HEADER.unpack_from(self._index, 0)
+        if magic != INDEX_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"보관 인덱스 형식이 올바르지 않습니다: {self.index_path}")
+
+        magic, version, codec_id = DATA_HEADER.unpack_from(self._data, 0)
+        if magic != DATA_MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"보관 파일 형식이 올바르지 않습니다: {self.data_path}")
+        self.codec = CODEC_NAMES.get(codec_id, str(codec_id))
+        self._codec = _Codec(codec_id)
+
+    def _slot(self, index: int) -> tuple:
+        return INDEX_SLOT.unpack_from(self._index, INDEX_HEADER.size + index * INDEX_SLOT.size)
+
+    def _read(self, offset: int, length: int, raw_length: int) -> Dict:
+        raw = self._codec.decompress(self._data[offset:offset + length], raw_length)
+        return decode_articles([json.loads(raw)])[0]
+
+    def get(self, url: str) -> Optional[Dict]:
+        """URL로 기사 1건 조회 (없으면 None)"""
+        target = url_hash(url)
+        mask = self.slot_count - 1
+        slot = target & mask
+
+        for _ in range(self.slot_count):
+            hashed, offset, length, raw_length = self._slot(slot)
+            if hashed == 0:
+                return None
+            if hashed == target:
+                article = self._read(offset, length, raw_length)
+                if article.get('url') == url:  # 64비트 해시 충돌 대비
+                    return article
+            slot = (slot + 1) & mask
+        return None
+
+    def __contains__(self, url: str) -> bool:
+        return self.get(url) is not None
+
+    def __len__(self) -> int:
+        return self.record_count
+
+    def entries(self) -> List[tuple]:
+        """인덱스의 (해시, 오프셋, 길이, 원본 길이) 목록 (저장 순서)"""
+        entries = [self._slot(i) for i in range(self.slot_count)]
+        return sorted((entry for entry in entries if entry[0]), key=lambda entry: entry[1])
+
+    def __iter__(self) -> Iterator[Dict]:
+        for _, offset, length, raw_length in self.entries():
+            yield self._read(offset, length, raw_length)
+
+    def get_stats(self) -> Dict:
+        """레코드 수, 압축 전/후 크기"""
+        entries = self.entries()
+        return {
+            'records': len(entries),
+            'codec': self.codec,
+            'raw_bytes': sum(entry[3] for entry in entries),
+            'compressed_bytes': sum(entry[2] for entry in entries),
+            'data_file_bytes': len(self._data),
+            'index_file_bytes': len(self._index)
+        }
+
+    def close(self):
+        self._index.close()
+        self._data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def write_daily_archive(articles: List[Dict], day: Union[str, date, None] = None,
+                        archive_dir: Optional[str] = None) -> int:
+    """
+    기사 목록을 해당 날짜 보관 파일에 추가 (이미 있는 URL은 건너뜀) → 추가 건수
+
+    같은 날 여러 번 실행되면 .dat에 이어 쓰고 .idx는 전체를 다시 만들어 교체
+    """
+    data_path, index_path = _day_paths(day, archive_dir)
+    entries = []
+    known = set()
+
+    if os.path.exists(data_path) and os.path.exists(index_path):
+        with DailyArchiveReader(day, archive_dir) as reader:
+            codec = _Codec(reader._codec.codec_id)
+            for entry in reader.entries():
+                entries.append(entry)
+                known.add(entry[0])
+        existing = True
+    else:
+        if not ZSTD_AVAILABLE:
+            logger.warning("zstandard 패키지가 없어 zlib으로 압축합니다 (pip install -r requirements.txt)")
+        codec = _Codec(CODEC_ZSTD if ZSTD_AVAILABLE else CODEC_ZLIB)
+        existing = False
+
+    added = 0
+    with open(data_path, 'r+b' if existing else 'wb') as f:
+        if not existing:
+            f.write(DATA_HEADER.pack(DATA_MAGIC, FORMAT_VERSION, codec.codec_id))
+        else:
+            # 인덱스 교체 전에 중단된 쓰기가 남긴 꼬리 데이터 제거
+            f.truncate(max(entry[1] + entry[2] for entry in entries) if entries else DATA_HEADER.size)
+            f.seek(0, os.SEEK_END)
+
+        for article in encode_articles(articles):
+            url = article.get('url')
+            if not url:
+                continue
+            hashed = url_hash(url)
+            if hashed in known:
+                continue
+
+            raw = json.dumps(article, ensure_ascii=False, default=str).encode('utf-8')
+            compressed = codec.compress(raw)
+            entries.append((hashed, f.tell(), len(compressed), len(raw)))
+            f.write(compressed)
+            known.add(hashed)
+            added += 1
+
+    tmp_path = f'{index_path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(_build_index(entries))
+    os.replace(tmp_path, index_path)
+
+    logger.info(f"일별 기사 보관: {added}개 추가 ({data_path}, {CODEC_NAMES[codec.codec_id]})")
+    return added
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """보관 파일 조회 CLI"""
+    parser = argparse.ArgumentParser(prog='daily_archive.py', description='일별 압축 기사 보관소 조회')
+    subparsers = parser.add_subparsers(dest='command')
+
+    stats_parser = subparsers.add_parser('stats', help='날짜별 레코드 수와 압축률')
+    stats_parser.add_argument('date', nargs='?', help='YYYY-MM-DD (생략 시 오늘)')
+
+    get_parser = subparsers.add_parser('get', help='URL로 기사 1건 조회')
+    get_parser.add_argument('url')
+    get_parser.add_argument('--date', help='YYYY-MM-DD (생략 시 오늘)')
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'stats':
+            with DailyArchiveReader(args.date) as reader:
+                stats = reader.get_stats()
+            ratio = stats['raw_bytes'] / stats['compressed_bytes'] if stats['compressed_bytes'] else 0
+            print(f"📦 일별 기사 보관소 ({args.date or date.today()})")
+            print("=" * 50)
+            print(f"📄 레코드: {stats['records']}개 ({stats['codec']})")
+            print(f"🗜️ 원본 {stats['raw_bytes']:,}B → 압축 {stats['compressed_bytes']:,}B ({ratio:.1f}배)")
+            print(f"🗂️ 인덱스: {stats['index_file_bytes']:,}B")
+            return 0
+
+        if args.command == 'get':
+            with DailyArchiveReader(args.date) as reader:
+                article = reader.get(args.url)
+            if not article:
+                print("❌ 보관된 기사가 없습니다")
+                return 1
+            print(json.dumps(encode_articles([article])[0], ensure_ascii=False, indent=2, default=str))
+            return 0
+
+    except FileNotFoundError:
+        print("❌ 해당 날짜의 보관 파일이 없습니다")
+        return 1
+
+    parser.print_help()
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
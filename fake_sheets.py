@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+메모리 기반 가짜 Google Sheets 백엔드
+KeywordManager가 사용하는 gspread API를 흉내내어 인증 정보 없이 성능 측정/회귀 확인
+(KEYWORD_SHEETS_BACKEND=fake 로 선택)
+"""
+
+import os
+import re
+import sys
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class SpreadsheetNotFound(Exception):
+    """스프레드시트를 찾을 수 없음 (gspread.SpreadsheetNotFound 대응)"""
+
+
+class WorksheetNotFound(Exception):
+    """워크시트를 찾을 수 없음 (gspread.WorksheetNotFound 대응)"""
+
+
+CELL_PATTERN = re.compile(r'^([A-Z]+)(\d*)$')
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class FakeQuotaError(Exception):
+    """주입된 429 한도 초과 오류 (gspread APIError처럼 response.status_code 제공)"""
+
+    def __init__(self, method: str):
+        super().__init__(f"429 RESOURCE_EXHAUSTED: Quota exceeded (fake {method})")
+        self.response = _FakeResponse(429)
+        self.code = 429
+
+
+def _column_index(letters: str) -> int:
+    """열 문자(A, B, ..., AA)를 1부터 시작하는 번호로 변환"""
+    index = 0
+    for ch in letters:
+        index = index * 26 + (ord(ch) - ord('A') + 1)
+    return index
+
+
+def _parse_range(range_name: str) -> Tuple[Optional[str], int, int, int, int]:
+    """'시트'!A1:C3 형식 범위를 (시트 이름, 시작 행, 시작 열, 끝 행, 끝 열)로 변환"""
+    sheet_name = None
+    if '!' in range_name:
+        sheet_name, range_name = range_name.rsplit('!', 1)
+        sheet_name = sheet_name.strip("'")
+
+    start, _, end = range_name.partition(':')
+    start_match = CELL_PATTERN.match(start.strip().upper())
+    end_match = CELL_PATTERN.match((end or start).strip().upper())
+    if not start_match or not end_match:
+        raise ValueError(f"지원하지 않는 범위 형식: {range_name}")
+
+    # 'A:B'처럼 행 번호가 없으면 시트 끝까지
+    return (
+        sheet_name,
+        int(start_match.group(2) or 1), _column_index(start_match.group(1)),
+        int(end_match.group(2) or sys.maxsize), _column_index(end_match.group(1))
+    )
+
+
+def _numericise(value: Any) -> Any:
+    """gspread get_all_records처럼 숫자 문자열을 숫자로 변환"""
+    if not isinstance(value, str) or value == '':
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+class FakeBackend:
+    """가짜 API 호출 공통 처리 (지연 시간, 429 주입, 호출 수 집계)"""
+
+    def __init__(self, latency_ms: Optional[float] = None, quota_error_rate: Optional[float] = None,
+                 seed: Optional[int] = None):
+        self.latency = float(latency_ms if latency_ms is not None else os.getenv('FAKE_SHEETS_LATENCY_MS', '0')) / 1000
+        self.quota_error_rate = float(quota_error_rate if quota_error_rate is not None
+                                      else os.getenv('FAKE_SHEETS_QUOTA_ERROR_RATE', '0'))
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = {}
+        self.quota_errors = 0
+
+    def api_call(self, method: str):
+        """API 1회 호출 비용 흉내 (지연 후 확률적으로 429)"""
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            fail = self._random.random() < self.quota_error_rate
+            if fail:
+                self.quota_errors += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise FakeQuotaError(method)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'calls': dict(self.calls),
+                'total_calls': sum(self.calls.values()),
+                'quota_errors': self.quota_errors
+            }
+
+
+class FakeWorksheet:
+    """메모리 워크시트 (행 목록을 2차원 리스트로 보관)"""
+
+    def __init__(self, spreadsheet: 'FakeSpreadsheet', title: str, sheet_id: int,
+                 rows: int = 1000, cols: int = 26):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self._rows = []
+
+    def _call(self, method: str):
+        self.spreadsheet.backend.api_call(method)
+
+    def _write_cell(self, row: int, col: int, value: Any):
+        while len(self._rows) < row:
+            self._rows.append([])
+        cells = self._rows[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = value
+
+    def _read_range(self, start_row: int, start_col: int, end_row: int, end_col: int) -> List[List[Any]]:
+        values = []
+        for row in range(start_row, min(end_row, len(self._rows)) + 1):
+            cells = self._rows[row - 1]
+            values.append(list(cells[start_col - 1:end_col]))
+        return values
+
+    def _update_range(self, range_name: str, values: List[List[Any]]):
+        _, start_row, start_col, _, _ = _parse_range(range_name)
+        for row_offset, row_values in enumerate(values):
+            for col_offset, value in enumerate(row_values):
+                self._write_cell(start_row + row_offset, start_col + col_offset, value)
+
+    def get_all_values(self) -> List[List[Any]]:
+        self._call('get_all_values')
+        with self.spreadsheet.lock:
+            return [list(cells) for cells in self._rows]
+
+    def get_all_records(self) -> List[Dict[str, Any]]:
+        self._call('get_all_records')
+        with self.spreadsheet.lock:
+            if not self._rows:
+                return []
+            headers = self._rows[0]
+            return [
+                {header: _numericise(cells[i]) if i < len(cells) else '' for i, header in enumerate(headers)}
+                for cells in self._rows[1:]
+            ]
+
+    def get(self, range_name: str) -> List[List[Any]]:
+        self._call('get')
+        with self.spreadsheet.lock:
+            return self._read_range(*_parse_range(range_name)[1:])
+
+    def batch_get(self, ranges: List[str], **kwargs) -> List[List[List[Any]]]:
+        self._call('batch_get')
+        with self.spreadsheet.lock:
+            return [self._read_range(*_parse_range(range_name)[1:]) for range_name in ranges]
+
+    def update(self, range_name: str, values: List[List[Any]], **kwargs) -> Dict:
+        self._call('update')
+        with self.spreadsheet.lock:
+            self._update_range(range_name, values)
+            self.spreadsheet.touch()
+        return {'updatedRange': f"'{self.title}'!{range_name}"}
+
+    def batch_update(self, data: List[Dict], **kwargs) -> Dict:
+        self._call('batch_update')
+        with self.spreadsheet.lock:
+            for item in data:
+                self._update_range(item['range'], item['values'])
+            self.spreadsheet.touch()
+        return {'totalUpdatedRanges': len(data)}
+
+    def append_rows(self, values: List[List[Any]], **kwargs) -> Dict:
+        self._call('append_rows')
+        with self.spreadsheet.lock:
+            start = len(self._rows) + 1
+            self._rows.extend([list(row) for row in values])
+            self.spreadsheet.touch()
+            end = len(self._rows)
+        return {'updates': {'updatedRange': f"'{self.title}'!A{start}:H{end}", 'updatedRows': len(values)}}
+
+    def append_row(self, values: List[Any], **kwargs) -> Dict:
+        self._call('append_row')
+        with self.spreadsheet.lock:
+            self._rows.append(list(values))
+            self.spreadsheet.touch()
+            row = len(self._rows)
+        return {'updates': {'updatedRange': f"'{self.title}'!A{row}", 'updatedRows': 1}}
+
+    def clear(self):
+        self._call('clear')
+        with self.spreadsheet.lock:
+            self._rows = []
+            self.spreadsheet.touch()
+
+
+class FakeSpreadsheet:
+    """메모리 스프레드시트"""
+
+    def __init__(self, backend: FakeBackend, title: str):
+        self.backend = backend
+        self.title = title
+        self.id = uuid.uuid4().hex
+        self.url = f"fake://spreadsheets/{self.id}"
+        self.lock = threading.RLock()
+        self._worksheets = []
+        self._next_sheet_id = 0
+        self._last_update = datetime.now(timezone.utc)
+        self._new_worksheet('Sheet1')
+
+    def touch(self):
+        """수정 시각 갱신 (Drive lastUpdateTime 흉내)"""
+        self._last_update = datetime.now(timezone.utc)
+
+    def _new_worksheet(self, title: str, rows: int = 1000, cols: int = 26) -> FakeWorksheet:
+        worksheet = FakeWorksheet(self, title, self._next_sheet_id, rows, cols)
+        self._next_sheet_id += 1
+        self._worksheets.append(worksheet)
+        return worksheet
+
+    @property
+    def sheet1(self) -> FakeWorksheet:
+        # gspread처럼 읽을 때마다 메타데이터 조회 1회
+        self.backend.api_call('sheet1')
+        with self.lock:
+            if not self._worksheets:
+                raise WorksheetNotFound('sheet1')
+            return self._worksheets[0]
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self.backend.api_call('worksheets')
+        with self.lock:
+            return list(self._worksheets)
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.backend.api_call('worksheet')
+        with self.lock:
+            for worksheet in self._worksheets:
+                if worksheet.title == title:
+                    return worksheet
+        raise WorksheetNotFound(title)
+
+    def add_worksheet(self, title: str, rows: int = 1000, cols: int = 26, **kwargs) -> FakeWorksheet:
+        self.backend.api_call('add_worksheet')
+        with self.lock:
+            worksheet = self._new_worksheet(title, int(rows), int(cols))
+            self.touch()
+            return worksheet
+
+    def del_worksheet(self, worksheet: Any):
+        self.backend.api_call('del_worksheet')
+        worksheet = getattr(worksheet, 'unwrapped', worksheet)
+        with self.lock:
+            self._worksheets = [ws for ws in self._worksheets if ws.id != worksheet.id]
+            self.touch()
+
+    def values_get(self, range_name: str, **kwargs) -> Dict:
+        self.backend.api_call('values_get')
+        sheet_name, *bounds = _parse_range(range_name)
+        with self.lock:
+            worksheet = self._worksheets[0]
+            if sheet_name:
+                matches = [ws for ws in self._worksheets if ws.title == sheet_name]
+                if not matches:
+                    raise WorksheetNotFound(sheet_name)
+                worksheet = matches[0]
+            return {'range': range_name, 'values': worksheet._read_range(*bounds)}
+
+    def get_lastUpdateTime(self) -> str:
+        self.backend.api_call('get_lastUpdateTime')
+        with self.lock:
+            return self._last_update.strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+
+
+class FakeSheetsClient:
+    """gspread.Client 대체 (같은 프로세스 안에서 스프레드시트 공유)"""
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, backend: Optional[FakeBackend] = None):
+        self.backend = backend or FakeBackend()
+
+    def open_by_key(self, key: str) -> FakeSpreadsheet:
+        self.backend.api_call('open_by_key')
+        with self._registry_lock:
+            for spreadsheet in self._registry.values():
+                if key in (spreadsheet.id, spreadsheet.title):
+                    return self._attach(spreadsheet)
+        raise SpreadsheetNotFound(key)
+
+    def open(self, title: str) -> FakeSpreadsheet:
+        self.backend.api_call('open')
+        with self._registry_lock:
+            if title in self._registry:
+                return self._attach(self._registry[title])
+        raise SpreadsheetNotFound(title)
+
+    def create(self, title: str, **kwargs) -> FakeSpreadsheet:
+        self.backend.api_call('create')
+        with self._registry_lock:
+            spreadsheet = FakeSpreadsheet(self.backend, title)
+            self._registry[title] = spreadsheet
+            return spreadsheet
+
+    def _attach(self, spreadsheet: FakeSpreadsheet) -> FakeSpreadsheet:
+        # 나중에 연결한 클라이언트의 지연/오류 설정과 호출 집계를 사용
+        spreadsheet.backend = self.backend
+        return spreadsheet
+
+    @classmethod
+    def reset(cls):
+        """공유 스프레드시트 모두 제거"""
+        with cls._registry_lock:
+            cls._registry.clear()
+
+
+def test_fake_sheets():
+    """가짜 백엔드 기본 동작 확인"""
+    print("🧪 가짜 Google Sheets 백엔드 테스트")
+    print("=" * 50)
+
+    client = FakeSheetsClient(FakeBackend(latency_ms=0, quota_error_rate=0))
+    spreadsheet = client.create('테스트')
+    worksheet = spreadsheet.add_worksheet(title='키워드목록', rows=10, cols=10)
+    worksheet.append_row(['키워드', '사용횟수'])
+    response = worksheet.append_rows([['AI', '1'], ['LLM', 2]])
+    worksheet.batch_update([{'range': 'B2:B2', 'values': [[5]]}])
+
+    print(f"✅ 레코드: {worksheet.get_all_records()}")
+    print(f"✅ 추가 범위: {response['updates']['updatedRange']}")
+    print(f"✅ 셀 조회: {spreadsheet.values_get('키워드목록!A3')['values']}")
+    print(f"📡 호출 통계: {client.backend.get_stats()}")
+
+
+if __name__ == "__main__":
+    test_fake_sheets()
@@ -6,20 +6,193 @@ Google Sheets 기반 키워드 관리자
 """
 
 import os
+import re
+import queue
+import importlib.util
 import logging
+import threading
 import time
+from bisect import bisect_left
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
-try:
+from sheets_client import SheetsQuotaClient
+from state_store import load_state, save_state, update_state
+
+logger = logging.getLogger(__name__)
+
+
+def _module_available(name: str) -> bool:
+    """모듈을 import하지 않고 설치 여부만 확인"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+# Google 클라이언트 라이브러리는 실제 Sheets 연결 시점에 import (설치 여부만 먼저 확인)
+GSPREAD_AVAILABLE = all(_module_available(name) for name in ('gspread', 'google.auth', 'google.oauth2'))
+
+
+def _import_google_stack():
+    """gspread/google-auth 지연 import (첫 Sheets 연결 시 1회)"""
     import gspread
-    from google.auth.exceptions import RefreshError, GoogleAuthError
+    from google.auth.exceptions import GoogleAuthError
     from google.oauth2.service_account import Credentials
-    GSPREAD_AVAILABLE = True
-except ImportError:
-    GSPREAD_AVAILABLE = False
+    return gspread, GoogleAuthError, Credentials
+
+
+KEYWORD_SNAPSHOT_FILE = 'keyword_snapshot.json'
+KEYWORD_STATS_FILE = 'keyword_stats.json'
+
+
+def read_snapshot_age() -> Optional[float]:
+    """로컬 키워드 스냅샷의 나이 (초) - KeywordManager 생성 없이 상태 확인용"""
+    snapshot = load_state(KEYWORD_SNAPSHOT_FILE)
+    try:
+        return (datetime.now() - datetime.fromisoformat(snapshot['saved_at'])).total_seconds()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class KeywordTable:
+    """활성 키워드 테이블과 카테고리/우선순위 인덱스 (읽기 전용, 통째로 교체하여 갱신)"""
+
+    def __init__(self, rows: Optional[List[Dict]] = None):
+        self.rows = rows or []  # 시트 순서 유지
+
+        # 카테고리별 행 위치 (시트 순서)
+        self.by_category = {}
+        for position, row in enumerate(self.rows):
+            self.by_category.setdefault(row['category'], []).append(position)
+
+        # 우선순위 오름차순 행 위치 (최소 우선순위 조회는 이분 탐색)
+        self._priority_order = sorted(range(len(self.rows)), key=lambda p: self.rows[p]['priority'])
+        self._priorities = [self.rows[p]['priority'] for p in self._priority_order]
+
+        # 조회 조건별 결과 (테이블과 함께 교체되므로 별도 만료 관리 불필요)
+        self._views = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def select(self, category: Optional[str] = None, min_priority: int = 1) -> List[str]:
+        """카테고리/최소 우선순위 조건의 키워드 목록 (시트 순서, 호출자가 수정해도 되는 복사본)"""
+        view_key = (category, min_priority)
+        if view_key in self._views:
+            return list(self._views[view_key])
+
+        if category:
+            positions = [
+                p for p in self.by_category.get(category, [])
+                if self.rows[p]['priority'] >= min_priority
+            ]
+        else:
+            start = bisect_left(self._priorities, min_priority)
+            positions = sorted(self._priority_order[start:])
+
+        keywords = tuple(self.rows[p]['keyword'] for p in positions)
+        self._views[view_key] = keywords
+        return list(keywords)
+
+    def categories(self) -> List[str]:
+        """테이블에 존재하는 카테고리 목록"""
+        return list(self.by_category)
+
+
+class KeywordStatsStore:
+    """키워드 통계 일별 롤업 로컬 저장소 (N일 조회는 N개 일자 항목만 확인)"""
+
+    def __init__(self, filename: str = KEYWORD_STATS_FILE, retention_days: int = 365):
+        self.filename = filename
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+
+        data = load_state(filename, {}) or {}
+        self.daily = data.get('daily', {})            # {날짜: {키워드: {'searches', 'articles'}}}
+        self.sheet_rows = data.get('sheet_rows', {})  # {'날짜|키워드': 통계 시트 행 번호}
+
+        # 아직 파일에 반영하지 않은 증가분/행 위치 (저장 시 파일 내용에 병합)
+        self._unsaved_daily = {}
+        self._unsaved_rows = {}
+
+    def add(self, statistics: Dict[Tuple[str, str], Dict[str, int]]):
+        """(날짜, 키워드)별 증가분 합산 후 저장"""
+        with self._lock:
+            for (date, keyword), counts in statistics.items():
+                for daily in (self.daily, self._unsaved_daily):
+                    totals = daily.setdefault(date, {}).setdefault(keyword, {'searches': 0, 'articles': 0})
+                    totals['searches'] += counts['searches']
+                    totals['articles'] += counts['articles']
+
+            self._prune()
+            self._save()
+
+    def get(self, date: str, keyword: str) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.daily.get(date, {}).get(keyword, {'searches': 0, 'articles': 0}))
+
+    def query(self, days: int) -> Dict[str, Dict[str, int]]:
+        """최근 N일(오늘 포함) 키워드별 합계"""
+        today = datetime.now().date()
+        keyword_stats = {}
+
+        with self._lock:
+            for offset in range(days):
+                date = (today - timedelta(days=offset)).strftime('%Y-%m-%d')
+                for keyword, counts in self.daily.get(date, {}).items():
+                    totals = keyword_stats.setdefault(keyword, {'searches': 0, 'articles': 0})
+                    totals['searches'] += counts['searches']
+                    totals['articles'] += counts['articles']
+
+        return keyword_stats
+
+    def get_sheet_row(self, date: str, keyword: str) -> Optional[int]:
+        with self._lock:
+            return self.sheet_rows.get(f"{date}|{keyword}")
+
+    def set_sheet_rows(self, rows: Dict[Tuple[str, str], int]):
+        """통계 시트에 기록된 일별 집계 행 위치 저장"""
+        with self._lock:
+            for (date, keyword), row in rows.items():
+                self.sheet_rows[f"{date}|{keyword}"] = row
+                self._unsaved_rows[f"{date}|{keyword}"] = row
+            self._save()
+
+    def _prune(self):
+        """보관 기간이 지난 일자 제거"""
+        cutoff = (datetime.now().date() - timedelta(days=self.retention_days)).strftime('%Y-%m-%d')
+        for date in [d for d in self.daily if d < cutoff]:
+            del self.daily[date]
+        for key in [k for k in self.sheet_rows if k.split('|', 1)[0] < cutoff]:
+            del self.sheet_rows[key]
+
+    def _save(self):
+        """
+        파일 잠금 후 최신 파일 내용에 미반영 증가분을 더해 저장
+
+        스케줄러와 test 실행처럼 여러 프로세스가 같은 파일을 갱신해도 서로의 롤업을 덮어쓰지 않습니다.
+        """
+        def merge(data):
+            data = data or {}
+            daily = data.get('daily', {})
+            for date, keywords in self._unsaved_daily.items():
+                for keyword, counts in keywords.items():
+                    totals = daily.setdefault(date, {}).setdefault(keyword, {'searches': 0, 'articles': 0})
+                    totals['searches'] += counts['searches']
+                    totals['articles'] += counts['articles']
+
+            sheet_rows = data.get('sheet_rows', {})
+            sheet_rows.update(self._unsaved_rows)
+
+            self.daily, self.sheet_rows = daily, sheet_rows
+            self._prune()
+            return {'daily': self.daily, 'sheet_rows': self.sheet_rows}
+
+        if update_state(self.filename, merge, {}):
+            self._unsaved_daily = {}
+            self._unsaved_rows = {}
 
-logger = logging.getLogger(__name__)
 
 class KeywordManager:
     """Google Sheets 기반 동적 키워드 관리자"""
@@ -41,7 +214,6 @@ class KeywordManager:
 
         # 캐시 설정
         self.cache_duration = int(os.getenv('KEYWORD_CACHE_DURATION', '300'))  # 5분
-        self._cached_keywords = {}
         self._cache_expiry = None
 
         # 기본 키워드 (Fallback용)
@@ -51,11 +223,17 @@ class KeywordManager:
             '클로바', '바드', 'Bard', '구글AI', 'OpenAI', 'Claude', '알렉사', '시리'
         ]
 
-        # Google Sheets 클라이언트
+        # Google Sheets 클라이언트 (모든 API 호출은 한도 관리 래퍼를 거침)
+        self.sheets_backend = os.getenv('KEYWORD_SHEETS_BACKEND', 'gspread').strip().lower()
+        self.sheets_client = SheetsQuotaClient()
         self.gc = None
         self.spreadsheet = None
         self.sheets_available = False
 
+        # 백엔드별 "찾을 수 없음" 예외 (클라이언트 생성 시 지정)
+        self._spreadsheet_not_found = LookupError
+        self._worksheet_not_found = LookupError
+
         # 워크시트 이름들
         self.SHEET_NAMES = {
             'keywords': '키워드목록',
@@ -67,31 +245,90 @@ class KeywordManager:
         # 통계 데이터
         self.usage_stats = {}
 
-        # 초기화 시도
-        self._initialize_sheets_client()
+        # 실행 중 누적된 사용량 (flush_usage에서 일괄 기록)
+        self._usage_lock = threading.Lock()
+        self._pending_usage_counts = {}   # 키워드 시트 사용횟수 증가분
+        self._pending_statistics = {}     # (날짜, 키워드)별 통계 증가분
+        self._dirty_stat_keys = set()     # 통계 시트에 아직 반영되지 않은 (날짜, 키워드)
+        self._pending_rollup = {}         # 로컬 일별 롤업에 아직 반영되지 않은 (날짜, 키워드)별 증가분
+
+        # 일별 통계 롤업 로컬 저장소
+        self.stats_store = KeywordStatsStore(
+            retention_days=int(os.getenv('KEYWORD_STATS_RETENTION_DAYS', '365'))
+        )
+        self._worksheets = {}
+
+        # 키워드 → 행 번호 인덱스 (캐시 주기마다 1회 구성, 로컬 쓰기 시 갱신)
+        self._index_lock = threading.RLock()
+        self._row_index = {}              # {키워드: {'row': 행 번호, 'usage': 사용횟수}}
+        self._row_count = 0               # 헤더 제외 데이터 행 수
+        self._row_index_expiry = None
+
+        # 백그라운드 통계 기록 스레드 설정
+        self.writer_flush_interval = float(os.getenv('KEYWORD_WRITER_FLUSH_INTERVAL', '30'))
+        self.writer_max_retries = int(os.getenv('KEYWORD_WRITER_MAX_RETRIES', '3'))
+        self._event_queue = queue.Queue(maxsize=int(os.getenv('KEYWORD_WRITER_QUEUE_SIZE', '1000')))
+        self._writer_thread = None
+        self._oldest_pending_at = None
+        self._last_flush_at = None
+        self._failed_flushes = 0
+
+        # 마지막으로 성공한 키워드 테이블 (로컬 스냅샷에서 즉시 시작, 백그라운드 갱신)
+        self.startup_timeout = float(os.getenv('KEYWORD_STARTUP_TIMEOUT', '30'))
+        self._keyword_table = KeywordTable()
+        self._keyword_table_source = None
+        self._keyword_table_loaded_at = None
+        self._refresh_lock = threading.Lock()
+        self._ready = threading.Event()
+
+        # 변경 감지 신호 (체크섬 셀 지정 시 해당 셀, 아니면 스프레드시트 수정 시각)
+        self.change_check_cell = os.getenv('KEYWORD_CHANGE_CHECK_CELL', '').strip()
+        self._change_token = None
+        self.refresh_stats = {'checks': 0, 'full_loads': 0, 'skipped_loads': 0}
+        self._load_snapshot()
+
+        # 초기화 시도 (스냅샷이 있으면 인증/로드를 백그라운드로)
+        if self._keyword_table:
+            threading.Thread(target=self._startup, name='keyword-startup', daemon=True).start()
+        else:
+            self._startup()
+
+    def _startup(self):
+        """Google Sheets 연결 및 최신 키워드 테이블 로드"""
+        try:
+            self._initialize_sheets_client()
+
+            if self.sheets_available:
+                self._start_writer()
+                self._refresh_keyword_table()
+        finally:
+            self._ready.set()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """백그라운드 초기화 완료 대기"""
+        return self._ready.wait(self.startup_timeout if timeout is None else timeout)
+
+    def _sheets_ready(self) -> bool:
+        """초기화 완료를 기다린 뒤 Sheets 사용 가능 여부 반환"""
+        self.wait_until_ready()
+        return bool(self.spreadsheet and self.sheets_available)
 
     def _initialize_sheets_client(self):
         """Google Sheets 클라이언트 초기화"""
-        if not GSPREAD_AVAILABLE:
-            logger.warning("gspread 라이브러리가 설치되지 않았습니다")
-            return False
+        if self.sheets_backend == 'fake':
+            import fake_sheets
+            client = fake_sheets.FakeSheetsClient()
+            self._spreadsheet_not_found = fake_sheets.SpreadsheetNotFound
+            self._worksheet_not_found = fake_sheets.WorksheetNotFound
+            logger.info("가짜 Google Sheets 백엔드 사용 (메모리)")
+        else:
+            client = self._authorize_gspread()
 
-        if not os.path.exists(self.credentials_file):
-            logger.warning(f"Google Sheets 인증 파일을 찾을 수 없습니다: {self.credentials_file}")
+        if client is None:
             return False
 
         try:
-            # Service Account 인증
-            scopes = [
-                'https://www.googleapis.com/auth/spreadsheets',
-                'https://www.googleapis.com/auth/drive'
-            ]
-
-            credentials = Credentials.from_service_account_file(
-                self.credentials_file, scopes=scopes
-            )
-
-            self.gc = gspread.authorize(credentials)
+            self.gc = self.sheets_client.wrap(client)
 
             # 스프레드시트 열기 또는 생성
             try:
@@ -101,7 +338,7 @@ class KeywordManager:
                     self.spreadsheet = self.gc.open(self.spreadsheet_name)
 
                 logger.info(f"기존 스프레드시트 열기: {self.spreadsheet.title}")
-            except gspread.SpreadsheetNotFound:
+            except self._spreadsheet_not_found:
                 logger.info(f"스프레드시트 생성 중: {self.spreadsheet_name}")
                 self.spreadsheet = self.gc.create(self.spreadsheet_name)
                 self._setup_default_sheets()
@@ -110,14 +347,47 @@ class KeywordManager:
             logger.info("✅ Google Sheets 클라이언트 초기화 성공")
             return True
 
+        except Exception as e:
+            logger.error(f"Google Sheets 클라이언트 초기화 실패: {e}")
+            self.sheets_available = False
+            return False
+
+    def _authorize_gspread(self):
+        """Service Account 인증으로 gspread 클라이언트 생성 (실패 시 None)"""
+        if not GSPREAD_AVAILABLE:
+            logger.warning("gspread 라이브러리가 설치되지 않았습니다")
+            return None
+
+        if not os.path.exists(self.credentials_file):
+            logger.warning(f"Google Sheets 인증 파일을 찾을 수 없습니다: {self.credentials_file}")
+            return None
+
+        # 인증 파일이 있을 때만 Google 라이브러리 로드
+        gspread, GoogleAuthError, Credentials = _import_google_stack()
+        self._spreadsheet_not_found = gspread.SpreadsheetNotFound
+        self._worksheet_not_found = gspread.WorksheetNotFound
+
+        try:
+            # Service Account 인증
+            scopes = [
+                'https://www.googleapis.com/auth/spreadsheets',
+                'https://www.googleapis.com/auth/drive'
+            ]
+
+            credentials = Credentials.from_service_account_file(
+                self.credentials_file, scopes=scopes
+            )
+
+            return gspread.authorize(credentials)
+
         except GoogleAuthError as e:
             logger.error(f"Google 인증 오류: {e}")
             self.sheets_available = False
-            return False
+            return None
         except Exception as e:
             logger.error(f"Google Sheets 클라이언트 초기화 실패: {e}")
             self.sheets_available = False
-            return False
+            return None
 
     def _setup_default_sheets(self):
         """기본 워크시트 구조 설정"""
@@ -211,61 +481,179 @@ class KeywordManager:
         """
         활성화된 키워드 목록 가져오기
 
+        모든 조회는 한 번 로드한 키워드 테이블의 인덱스에서 계산되며,
+        캐시가 만료되면 현재 테이블을 그대로 반환하고 백그라운드에서 갱신합니다.
+
         Args:
             category: 특정 카테고리 키워드만 가져오기 (None=전체)
             min_priority: 최소 우선순위 (1-10)
-            force_refresh: 캐시 무시하고 강제 새로고침
+            force_refresh: 캐시 무시하고 강제 새로고침 (완료까지 대기)
 
         Returns:
             키워드 리스트
         """
         try:
-            # 캐시 확인
-            cache_key = f"{category}_{min_priority}"
+            if force_refresh:
+                if self._sheets_ready():
+                    self._refresh_keyword_table(force=True)
+            elif not self._is_cache_valid() and self._ready.is_set():
+                self._schedule_refresh()
 
-            if not force_refresh and self._is_cache_valid() and cache_key in self._cached_keywords:
-                logger.debug(f"캐시에서 키워드 반환: {len(self._cached_keywords[cache_key])}개")
-                return self._cached_keywords[cache_key]
-
-            # Google Sheets에서 키워드 로드
-            keywords = self._load_keywords_from_sheets(category, min_priority)
+            keywords = self._keyword_table.select(category, min_priority)
 
             if keywords:
-                # 캐시 업데이트
-                self._cached_keywords[cache_key] = keywords
-                self._cache_expiry = datetime.now() + timedelta(seconds=self.cache_duration)
-
-                logger.info(f"Google Sheets에서 키워드 로드: {len(keywords)}개")
                 return keywords
             else:
                 # 폴백: 기본 키워드 사용
                 logger.warning("Google Sheets에서 키워드를 가져올 수 없어 기본 키워드 사용")
-                return self.default_keywords
+                return list(self.default_keywords)
 
         except Exception as e:
             logger.error(f"키워드 가져오기 실패: {e}")
-            return self.default_keywords
+            return list(self.default_keywords)
+
+    def _schedule_refresh(self):
+        """백그라운드 키워드 테이블 갱신 (이미 진행 중이면 생략)"""
+        if self._refresh_lock.locked():
+            return
+        threading.Thread(target=self._refresh_keyword_table, name='keyword-refresh', daemon=True).start()
+
+    def _refresh_keyword_table(self, force: bool = False) -> bool:
+        """
+        Google Sheets에서 키워드 테이블을 읽어 원자적으로 교체하고 스냅샷 저장
+
+        변경 신호가 마지막 로드 때와 같으면 전체 레코드를 다시 받지 않고
+        현재 테이블의 유효기간만 연장합니다.
+        """
+        with self._refresh_lock:
+            token = self._get_change_token()
+            self.refresh_stats['checks'] += 1
+
+            if not force and token is not None and token == self._change_token:
+                now = datetime.now()
+                self._keyword_table_source = 'sheets'
+                self._keyword_table_loaded_at = now
+                self._cache_expiry = now + timedelta(seconds=self.cache_duration)
+                with self._index_lock:
+                    if self._row_index_expiry:
+                        self._row_index_expiry = now + timedelta(seconds=self.cache_duration)
+
+                self.refresh_stats['skipped_loads'] += 1
+                logger.debug("키워드 시트 변경 없음 - 전체 로드 생략")
+                self._save_snapshot()
+                return True
+
+            table = self._load_keywords_from_sheets()
+            self.refresh_stats['full_loads'] += 1
+            if not table:
+                return False
+
+            # 인덱스를 포함한 새 테이블을 참조 교체로 한 번에 반영
+            self._keyword_table = KeywordTable(table)
+            self._change_token = token
+            self._keyword_table_source = 'sheets'
+            self._keyword_table_loaded_at = datetime.now()
+            self._cache_expiry = datetime.now() + timedelta(seconds=self.cache_duration)
+
+            logger.info(f"Google Sheets에서 키워드 로드: {len(table)}개")
+            self._save_snapshot()
+            return True
+
+    def _get_change_token(self) -> Optional[str]:
+        """키워드 시트 변경 여부를 판단할 가벼운 신호 (실패 시 None → 전체 로드)"""
+        if not self.spreadsheet or not self.sheets_available:
+            return None
+
+        try:
+            if self.change_check_cell:
+                # 예: 설정!B10 셀에 =SUMPRODUCT(LEN(키워드목록!B2:E)) 같은 체크섬 수식
+                result = self.spreadsheet.values_get(self.change_check_cell)
+                values = result.get('values', [[None]])
+                return f"cell:{values[0][0] if values and values[0] else ''}"
+
+            # Drive 메타데이터의 수정 시각 (조회 API가 없는 구버전 gspread는 None → 매번 전체 로드)
+            modified = self.spreadsheet.get_lastUpdateTime()
+            return f"modified:{modified}" if modified else None
+
+        except Exception as e:
+            logger.debug(f"키워드 시트 변경 신호 조회 실패: {e}")
+            return None
+
+    def _needs_write_absorb(self) -> bool:
+        """
+        기록 전후로 수정 시각을 조회해야 하는지 여부
+
+        조정에는 Drive 메타데이터 조회가 기록마다 2회 필요하므로, 수정 시각 신호를
+        실제로 쓰고 있을 때(체크섬 셀 미사용, 신호 확보됨)만 수행합니다.
+        """
+        return not self.change_check_cell and self._change_token is not None
+
+    def _absorb_own_write(self, token_before: Optional[str]):
+        """
+        자체 통계 기록으로 바뀐 수정 시각을 변경 없음으로 간주
+
+        기록 직전 신호가 마지막 로드 때와 같았던 경우에만 기록 후 신호를 채택합니다.
+        체크섬 셀 방식은 통계 열(G:H)을 포함하지 않으므로 조정이 필요 없습니다.
+        """
+        if token_before is None or not self._needs_write_absorb():
+            return
+        if token_before == self._change_token:
+            self._change_token = self._get_change_token()
 
-    def _load_keywords_from_sheets(self, category: Optional[str], min_priority: int) -> List[str]:
-        """Google Sheets에서 키워드 로드"""
+    def _load_snapshot(self):
+        """로컬 키워드 스냅샷 로드"""
+        snapshot = load_state(KEYWORD_SNAPSHOT_FILE)
+        if not snapshot or not snapshot.get('keywords'):
+            return
+
+        try:
+            self._keyword_table = KeywordTable([
+                {'keyword': row['keyword'], 'category': row.get('category', ''), 'priority': int(row.get('priority', 0))}
+                for row in snapshot['keywords']
+            ])
+            self._keyword_table_source = 'snapshot'
+            self._keyword_table_loaded_at = datetime.fromisoformat(snapshot['saved_at'])
+            self._change_token = snapshot.get('change_token')
+            logger.info(f"키워드 스냅샷 로드: {len(self._keyword_table)}개 ({snapshot['saved_at']})")
+        except (KeyError, ValueError, TypeError) as e:
+            logger.warning(f"키워드 스냅샷 파싱 실패: {e}")
+            self._keyword_table = KeywordTable()
+
+    def _save_snapshot(self):
+        """현재 키워드 테이블을 로컬 스냅샷으로 저장"""
+        save_state(KEYWORD_SNAPSHOT_FILE, {
+            'saved_at': self._keyword_table_loaded_at.isoformat(),
+            'change_token': self._change_token,
+            'keywords': self._keyword_table.rows
+        })
+
+    def get_snapshot_age(self) -> Optional[float]:
+        """현재 키워드 테이블의 나이 (초)"""
+        if not self._keyword_table_loaded_at:
+            return None
+        return (datetime.now() - self._keyword_table_loaded_at).total_seconds()
+
+    def _load_keywords_from_sheets(self) -> List[Dict]:
+        """Google Sheets에서 활성 키워드 테이블 로드"""
         try:
             if not self.spreadsheet or not self.sheets_available:
                 return []
 
             # 키워드 시트 가져오기
             try:
-                keywords_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['keywords'])
-            except gspread.WorksheetNotFound:
+                keywords_sheet = self._get_worksheet('keywords')
+            except self._worksheet_not_found:
                 logger.error(f"키워드 워크시트를 찾을 수 없습니다: {self.SHEET_NAMES['keywords']}")
                 return []
 
-            # 모든 데이터 가져오기
+            # 모든 데이터 가져오기 (행 인덱스도 같은 데이터로 갱신)
             records = keywords_sheet.get_all_records()
+            self._build_row_index(records)
 
             if not records:
                 return []
 
-            keywords = []
+            table = []
 
             for record in records:
                 try:
@@ -273,24 +661,19 @@ class KeywordManager:
                     if str(record.get('활성화', '')).upper() != 'TRUE':
                         continue
 
-                    # 우선순위 확인
-                    priority = int(record.get('우선순위', 0))
-                    if priority < min_priority:
-                        continue
-
-                    # 카테고리 필터
-                    if category and record.get('카테고리', '') != category:
-                        continue
-
-                    keyword = record.get('키워드', '').strip()
+                    keyword = str(record.get('키워드', '')).strip()
                     if keyword:
-                        keywords.append(keyword)
+                        table.append({
+                            'keyword': keyword,
+                            'category': record.get('카테고리', ''),
+                            'priority': int(record.get('우선순위', 0))
+                        })
 
                 except (ValueError, TypeError) as e:
                     logger.warning(f"키워드 레코드 파싱 실패: {e}")
                     continue
 
-            return keywords
+            return table
 
         except Exception as e:
             logger.error(f"Sheets에서 키워드 로드 실패: {e}")
@@ -315,21 +698,22 @@ class KeywordManager:
             성공 여부
         """
         try:
-            if not self.spreadsheet or not self.sheets_available:
+            if not self._sheets_ready():
                 logger.error("Google Sheets 연결이 없습니다")
                 return False
 
-            keywords_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['keywords'])
+            keywords_sheet = self._get_worksheet('keywords')
 
-            # 중복 확인
-            existing_keywords = [record.get('키워드', '') for record in keywords_sheet.get_all_records()]
-            if keyword in existing_keywords:
-                logger.warning(f"키워드가 이미 존재합니다: {keyword}")
-                return False
+            with self._index_lock:
+                row_index = self._get_row_index()
 
-            # 새 ID 생성
-            records = keywords_sheet.get_all_records()
-            next_id = len(records) + 1
+                # 중복 확인
+                if keyword in row_index:
+                    logger.warning(f"키워드가 이미 존재합니다: {keyword}")
+                    return False
+
+                # 새 ID 생성
+                next_id = self._row_count + 1
 
             # 새 키워드 추가
             new_row = [
@@ -341,6 +725,11 @@ class KeywordManager:
 
             keywords_sheet.append_row(new_row)
 
+            # 행 인덱스에 새 행 반영 (다시 읽지 않음)
+            with self._index_lock:
+                self._row_count += 1
+                self._row_index[keyword] = {'row': self._row_count + 1, 'usage': 0}
+
             # 캐시 무효화
             self._clear_cache()
 
@@ -353,7 +742,7 @@ class KeywordManager:
 
     def update_keyword_usage(self, keyword: str, matched_articles: int = 1) -> bool:
         """
-        키워드 사용 통계 업데이트
+        키워드 사용 통계 업데이트 (백그라운드 기록 스레드가 모아서 Sheets 반영)
 
         Args:
             keyword: 키워드
@@ -363,18 +752,25 @@ class KeywordManager:
             성공 여부
         """
         try:
-            if not self.spreadsheet or not self.sheets_available:
-                return False
+            with self._usage_lock:
+                # 로컬 통계 업데이트
+                if keyword not in self.usage_stats:
+                    self.usage_stats[keyword] = {'usage_count': 0, 'matched_articles': 0}
 
-            # 로컬 통계 업데이트
-            if keyword not in self.usage_stats:
-                self.usage_stats[keyword] = {'usage_count': 0, 'matched_articles': 0}
+                self.usage_stats[keyword]['usage_count'] += 1
+                self.usage_stats[keyword]['matched_articles'] += matched_articles
 
-            self.usage_stats[keyword]['usage_count'] += 1
-            self.usage_stats[keyword]['matched_articles'] += matched_articles
+            # 초기화 후 Sheets를 쓸 수 없으면 로컬 롤업에만 누적 (flush_usage/shutdown 시 저장)
+            if self._ready.is_set() and not (self.spreadsheet and self.sheets_available):
+                self._add_rollup(time.time(), keyword, matched_articles)
+                return True
 
-            # Google Sheets 업데이트 (비동기적으로)
-            self._update_sheets_statistics(keyword, matched_articles)
+            # 초기화 전에는 큐에 쌓아 두고 초기화 결과에 따라 기록 스레드 또는 flush_usage에서 반영
+            try:
+                self._event_queue.put_nowait(('usage', time.time(), keyword, matched_articles))
+            except queue.Full:
+                # 큐가 가득 차면 호출 스레드에서 바로 누적 (유실 방지)
+                self._coalesce_usage(time.time(), keyword, matched_articles)
 
             return True
 
@@ -382,46 +778,449 @@ class KeywordManager:
             logger.error(f"키워드 사용 통계 업데이트 실패: {e}")
             return False
 
-    def _update_sheets_statistics(self, keyword: str, matched_articles: int):
-        """Google Sheets 통계 업데이트 (백그라운드)"""
-        try:
-            # 키워드 시트에서 사용횟수 업데이트
-            keywords_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['keywords'])
-            records = keywords_sheet.get_all_records()
+    def _coalesce_usage(self, event_time: float, keyword: str, matched_articles: int):
+        """사용 이벤트를 로컬 롤업/Sheets 반영 대기분에 합산"""
+        self._add_rollup(event_time, keyword, matched_articles)
+
+        with self._usage_lock:
+            self._pending_usage_counts[keyword] = self._pending_usage_counts.get(keyword, 0) + 1
+
+            date = datetime.fromtimestamp(event_time).strftime('%Y-%m-%d')
+            pending = self._pending_statistics.setdefault((date, keyword), {'searches': 0, 'articles': 0})
+            pending['searches'] += 1
+            pending['articles'] += matched_articles
+
+            if self._oldest_pending_at is None:
+                self._oldest_pending_at = event_time
+
+    def _add_rollup(self, event_time: float, keyword: str, matched_articles: int):
+        """사용 이벤트를 로컬 일별 롤업 반영 대기분에 합산 (Sheets 사용 여부와 무관)"""
+        date = datetime.fromtimestamp(event_time).strftime('%Y-%m-%d')
+        with self._usage_lock:
+            pending = self._pending_rollup.setdefault((date, keyword), {'searches': 0, 'articles': 0})
+            pending['searches'] += 1
+            pending['articles'] += matched_articles
+
+    def _flush_rollup(self):
+        """누적된 증가분을 로컬 일별 롤업 파일에 저장"""
+        with self._usage_lock:
+            rollup = self._pending_rollup
+            self._pending_rollup = {}
+
+        if rollup:
+            self.stats_store.add(rollup)
+
+    def _has_pending_usage(self) -> bool:
+        with self._usage_lock:
+            return bool(self._pending_usage_counts or self._pending_statistics or self._dirty_stat_keys)
+
+    def _start_writer(self):
+        """백그라운드 통계 기록 스레드 시작"""
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name='keyword-sheets-writer', daemon=True
+        )
+        self._writer_thread.start()
+
+    def _writer_loop(self):
+        """큐의 통계 이벤트를 모아 주기적으로 Sheets에 기록"""
+        next_flush_at = time.monotonic() + self.writer_flush_interval
+        backoff = self.writer_flush_interval
+
+        while True:
+            timeout = max(0.0, next_flush_at - time.monotonic())
+            try:
+                event = self._event_queue.get(timeout=timeout)
+            except queue.Empty:
+                event = None
+
+            if event and event[0] == 'usage':
+                self._coalesce_usage(*event[1:])
+                continue
+
+            if event and event[0] in ('flush', 'stop'):
+                # 요청 시점까지 쌓인 이벤트를 모두 반영한 뒤 재시도 포함 기록
+                waiters = [event] + self._drain_queue()
+                success = self._flush_with_retries()
+                for command, waiter in waiters:
+                    waiter['success'] = success
+                    waiter['done'].set()
+
+                if any(command == 'stop' for command, _ in waiters):
+                    return
+                next_flush_at = time.monotonic() + self.writer_flush_interval
+                continue
+
+            # 주기적 기록 (실패 시 간격을 늘려 재시도)
+            if self._has_pending_usage():
+                if self._flush_pending():
+                    backoff = self.writer_flush_interval
+                else:
+                    backoff = min(backoff * 2, 300)
+                next_flush_at = time.monotonic() + backoff
+            else:
+                next_flush_at = time.monotonic() + self.writer_flush_interval
 
-            for i, record in enumerate(records, 2):  # 2부터 시작 (헤더 제외)
-                if record.get('키워드') == keyword:
-                    current_usage = int(record.get('사용횟수', 0))
-                    new_usage = current_usage + 1
+    def _drain_queue(self) -> list:
+        """큐에 남은 사용 이벤트를 모두 합산하고 함께 들어온 제어 요청 반환"""
+        waiters = []
+        while True:
+            try:
+                event = self._event_queue.get_nowait()
+            except queue.Empty:
+                return waiters
+            if event[0] == 'usage':
+                self._coalesce_usage(*event[1:])
+            else:
+                waiters.append(event)
+
+    def _flush_with_retries(self) -> bool:
+        """재시도(지수 백오프)를 포함한 기록"""
+        for attempt in range(self.writer_max_retries):
+            if self._flush_pending():
+                return True
+            if attempt < self.writer_max_retries - 1:
+                time.sleep(2 ** attempt)
+        return False
+
+    def _request_writer(self, command: str, timeout: float) -> bool:
+        """기록 스레드에 제어 요청을 보내고 완료 대기"""
+        if not self._writer_thread or not self._writer_thread.is_alive():
+            return False
 
-                    # 사용횟수와 수정일 업데이트
-                    keywords_sheet.update(f'H{i}', new_usage)  # 사용횟수 컬럼
-                    keywords_sheet.update(f'G{i}', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))  # 수정일
-                    break
+        request = {'done': threading.Event(), 'success': False}
+        self._event_queue.put((command, request))
+
+        if not request['done'].wait(timeout):
+            logger.warning(f"키워드 통계 기록 대기 시간 초과 ({timeout}초)")
+            return False
+        return request['success']
+
+    def flush_usage(self, timeout: float = 60) -> bool:
+        """
+        누적된 사용 통계를 즉시 Google Sheets에 기록하고 완료까지 대기
+
+        Args:
+            timeout: 최대 대기 시간 (초)
 
-            # 통계 시트에 기록 추가
-            stats_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['statistics'])
+        Returns:
+            모든 기록 성공 여부 (Sheets를 쓸 수 없으면 로컬 롤업만 저장하고 False)
+        """
+        if not self._sheets_ready():
+            self._flush_local_only()
+            return False
+        return self._request_writer('flush', timeout)
+
+    def _flush_local_only(self):
+        """기록 스레드 없이 큐에 남은 이벤트를 로컬 롤업에만 반영 (Sheets 미사용 시)"""
+        self._drain_queue()
+        with self._usage_lock:
+            self._pending_usage_counts = {}
+            self._pending_statistics = {}
+            self._oldest_pending_at = None
+        self._flush_rollup()
+
+    def shutdown(self, timeout: float = 30) -> bool:
+        """남은 통계를 기록하고 백그라운드 기록 스레드 종료"""
+        if not self._writer_thread or not self._writer_thread.is_alive():
+            self._flush_local_only()
+            return True
+
+        logger.info("키워드 통계 기록 스레드 종료 중...")
+        success = self._request_writer('stop', timeout)
+        self._writer_thread.join(timeout)
+        return success
+
+    def get_api_stats(self) -> Dict:
+        """Google Sheets API 호출 통계 (메서드별 호출 수, 한도 대기)"""
+        return self.sheets_client.get_stats()
+
+    def get_writer_status(self) -> Dict:
+        """백그라운드 기록 상태 (큐 깊이, 지연) 반환"""
+        with self._usage_lock:
+            lag = time.time() - self._oldest_pending_at if self._oldest_pending_at else 0.0
+            pending_keywords = len(self._pending_usage_counts)
+            unsent_rows = len(self._dirty_stat_keys)
+
+        return {
+            'running': bool(self._writer_thread and self._writer_thread.is_alive()),
+            'queue_depth': self._event_queue.qsize(),
+            'pending_keywords': pending_keywords,
+            'unsent_stat_rows': unsent_rows,
+            'lag_seconds': round(lag, 1),
+            'last_flush': self._last_flush_at.strftime('%Y-%m-%d %H:%M:%S') if self._last_flush_at else None,
+            'failed_flushes': self._failed_flushes
+        }
+
+    def _flush_pending(self) -> bool:
+        """
+        누적된 사용 통계를 로컬 롤업과 Google Sheets에 일괄 기록 (기록 스레드 전용)
 
-            stats_row = [
-                datetime.now().strftime('%Y-%m-%d'),
+        키워드 시트는 batch_update 1회, 통계 시트는 (날짜, 키워드)별 일별 합계를
+        batch_update/append_rows로 기록합니다. 통계 시트에는 증가분이 아닌
+        로컬 롤업의 합계를 쓰므로 실패한 부분은 다음 기록에서 그대로 재시도됩니다.
+
+        Returns:
+            모든 기록 성공 여부
+        """
+        with self._usage_lock:
+            usage_counts = self._pending_usage_counts
+            statistics = self._pending_statistics
+            self._pending_usage_counts = {}
+            self._pending_statistics = {}
+
+            self._dirty_stat_keys.update(statistics)
+            stat_keys = set(self._dirty_stat_keys)
+
+        # 로컬 롤업은 Sheets 성공 여부와 무관하게 먼저 반영
+        self._flush_rollup()
+
+        token_before = None
+        if (usage_counts or stat_keys) and self._needs_write_absorb():
+            token_before = self._get_change_token()
+        success = True
+
+        if usage_counts:
+            try:
+                self._write_usage_counts(usage_counts)
+            except Exception as e:
+                logger.warning(f"키워드 사용횟수 일괄 업데이트 실패 (다음 기록에서 재시도): {e}")
+                with self._usage_lock:
+                    for keyword, count in usage_counts.items():
+                        self._pending_usage_counts[keyword] = self._pending_usage_counts.get(keyword, 0) + count
+                success = False
+
+        if stat_keys:
+            try:
+                self._write_daily_statistics(stat_keys)
+                with self._usage_lock:
+                    self._dirty_stat_keys -= stat_keys
+            except Exception as e:
+                logger.warning(f"통계 시트 기록 실패 (다음 기록에서 재시도): {e}")
+                success = False
+
+        if usage_counts or stat_keys:
+            self._absorb_own_write(token_before)
+
+        with self._usage_lock:
+            if success:
+                self._oldest_pending_at = None
+                self._last_flush_at = datetime.now()
+            else:
+                self._failed_flushes += 1
+
+        if success and (usage_counts or stat_keys):
+            logger.info(f"키워드 사용 통계 반영 완료: 키워드 {len(usage_counts)}개, 일별 통계 {len(stat_keys)}행")
+
+        return success
+
+    def _write_daily_statistics(self, stat_keys: set):
+        """통계 시트의 (날짜, 키워드)별 일별 합계 행 갱신/추가"""
+        stats_sheet = self._get_worksheet('statistics')
+        now = datetime.now().strftime('%H:%M:%S')
+
+        updates = []
+        new_keys = []
+        new_rows = []
+        for date, keyword in sorted(stat_keys):
+            totals = self.stats_store.get(date, keyword)
+            values = [
+                date,
                 keyword,
-                1,  # 검색횟수
-                matched_articles,
+                totals['searches'],  # 검색횟수
+                totals['articles'],
                 0,  # 평균관련도 (추후 구현)
                 0,  # 최고관련도 (추후 구현)
                 '',  # 카테고리
-                f'자동 업데이트 - {datetime.now().strftime("%H:%M:%S")}'
+                f'일별 집계 - {now}'
             ]
 
-            stats_sheet.append_row(stats_row)
+            row = self.stats_store.get_sheet_row(date, keyword)
+            if row:
+                updates.append(((date, keyword), row, values))
+            else:
+                new_keys.append((date, keyword))
+                new_rows.append(values)
+
+        if updates:
+            # 시트가 정렬/필터/삭제되어 저장한 행 위치가 달라졌을 수 있으므로 날짜·키워드 열로 확인
+            located = self._locate_statistics_rows(stats_sheet)
+            moved = {}
+            verified = []
+            for key, row, values in updates:
+                if located.get(row) != key:
+                    row = next((r for r, k in located.items() if k == key), None)
+                    if row is None:
+                        new_keys.append(key)
+                        new_rows.append(values)
+                        continue
+                    moved[key] = row
+                verified.append({'range': f'A{row}:H{row}', 'values': [values]})
+
+            if moved:
+                logger.info(f"통계 시트 행 위치 변경 감지: {len(moved)}개 재확인")
+                self.stats_store.set_sheet_rows(moved)
+            updates = verified
+
+        if updates:
+            stats_sheet.batch_update(updates)
+
+        if new_rows:
+            response = stats_sheet.append_rows(new_rows, value_input_option='USER_ENTERED')
+            first_row = self._parse_first_row(response)
+            if first_row:
+                self.stats_store.set_sheet_rows({
+                    key: first_row + offset for offset, key in enumerate(new_keys)
+                })
+            else:
+                logger.warning("통계 시트 추가 행 위치를 확인할 수 없습니다 (다음 기록 시 새 행으로 추가될 수 있음)")
+
+    @staticmethod
+    def _locate_statistics_rows(stats_sheet) -> Dict[int, Tuple[str, str]]:
+        """통계 시트 날짜/키워드 열(A:B)을 읽어 {행 번호: (날짜, 키워드)} 반환 (API 1회)"""
+        located = {}
+        for row, cells in enumerate(stats_sheet.get('A:B'), start=1):
+            if len(cells) < 2 or not cells[0]:
+                continue
+            # USER_ENTERED로 기록한 날짜는 로캘 형식(예: 2025. 1. 5)으로 읽힐 수 있어 숫자만 비교
+            numbers = [int(part) for part in re.findall(r'\d+', str(cells[0]))]
+            if len(numbers) != 3:
+                continue
+            located[row] = (f"{numbers[0]:04d}-{numbers[1]:02d}-{numbers[2]:02d}", str(cells[1]))
+        return located
+
+    @staticmethod
+    def _parse_first_row(response) -> Optional[int]:
+        """append 응답의 updatedRange(예: '통계'!A15:H17)에서 첫 행 번호 추출"""
+        try:
+            updated_range = response['updates']['updatedRange']
+            start = updated_range.split('!')[-1].split(':')[0]
+            return int(''.join(ch for ch in start if ch.isdigit()))
+        except (KeyError, TypeError, ValueError, IndexError):
+            return None
+
+    def _get_worksheet(self, sheet_key: str):
+        """워크시트 객체 반환 (메타데이터 조회 1회 후 재사용)"""
+        if sheet_key not in self._worksheets:
+            self._worksheets[sheet_key] = self.spreadsheet.worksheet(self.SHEET_NAMES[sheet_key])
+        return self._worksheets[sheet_key]
+
+    def _build_row_index(self, records: List[Dict]):
+        """get_all_records 결과로 키워드 행 인덱스 구성"""
+        row_index = {}
+        for i, record in enumerate(records, 2):  # 2부터 시작 (헤더 제외)
+            keyword = str(record.get('키워드', '')).strip()
+            if keyword and keyword not in row_index:
+                try:
+                    usage = int(record.get('사용횟수') or 0)
+                except (ValueError, TypeError):
+                    usage = 0
+                row_index[keyword] = {'row': i, 'usage': usage}
+
+        with self._index_lock:
+            self._row_index = row_index
+            self._row_count = len(records)
+            self._row_index_expiry = datetime.now() + timedelta(seconds=self.cache_duration)
+
+    def _get_row_index(self, force_refresh: bool = False) -> Dict[str, Dict[str, int]]:
+        """키워드 행 인덱스 반환 (캐시 주기 내에는 시트를 다시 읽지 않음)"""
+        with self._index_lock:
+            if not force_refresh and self._row_index_expiry and datetime.now() < self._row_index_expiry:
+                return self._row_index
+
+            records = self._get_worksheet('keywords').get_all_records()
+            self._build_row_index(records)
+            return self._row_index
+
+    def _invalidate_row_index(self):
+        """행 인덱스 무효화 (시트 구조가 바뀌었을 수 있을 때)"""
+        with self._index_lock:
+            self._row_index_expiry = None
+
+    def _write_usage_counts(self, usage_counts: Dict[str, int]):
+        """
+        키워드 시트의 사용횟수/수정일을 batch_update 1회로 갱신 (행 인덱스 사용)
+
+        다른 프로세스가 그사이 기록한 증가분을 덮어쓰지 않도록, 쓰기 직전에 대상 행의
+        현재 사용횟수를 batch_get 1회로 다시 읽어 그 값에 증가분을 더합니다.
+        """
+        keywords_sheet = self._get_worksheet('keywords')
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        with self._index_lock:
+            row_index = self._get_row_index()
+
+            # 인덱스에 없는 키워드가 있으면 시트가 바뀐 것으로 보고 1회 재구성
+            if any(keyword not in row_index for keyword in usage_counts):
+                row_index = self._get_row_index(force_refresh=True)
+
+            rows = {keyword: row_index[keyword]['row'] for keyword in usage_counts if keyword in row_index}
+            current = self._read_usage_cells(keywords_sheet, rows)
+
+            # 행 위치가 바뀌었으면 인덱스를 다시 구성하고 1회 재확인
+            if any(usage is None for usage in current.values()):
+                row_index = self._get_row_index(force_refresh=True)
+                rows = {keyword: row_index[keyword]['row'] for keyword in usage_counts if keyword in row_index}
+                current = self._read_usage_cells(keywords_sheet, rows)
+
+            updates = []
+            new_usage = {}
+            for keyword, count in usage_counts.items():
+                if current.get(keyword) is None:
+                    logger.warning(f"키워드 시트에서 행을 찾을 수 없습니다: {keyword}")
+                    continue
 
-        except Exception as e:
-            logger.warning(f"Google Sheets 통계 업데이트 실패: {e}")
+                row = rows[keyword]
+                new_usage[keyword] = current[keyword] + count
+                # G: 수정일, H: 사용횟수
+                updates.append({'range': f"G{row}:H{row}", 'values': [[now, new_usage[keyword]]]})
+
+        if not updates:
+            return
+
+        try:
+            keywords_sheet.batch_update(updates)
+        except Exception:
+            # 행 위치가 어긋났을 수 있으므로 다음 기록 전에 인덱스를 다시 구성
+            self._invalidate_row_index()
+            raise
+
+        with self._index_lock:
+            for keyword, usage in new_usage.items():
+                if keyword in self._row_index:
+                    self._row_index[keyword]['usage'] = usage
+
+    @staticmethod
+    def _read_usage_cells(keywords_sheet, rows: Dict[str, int]) -> Dict[str, Optional[int]]:
+        """
+        키워드 행의 키워드(B)~사용횟수(H) 열을 batch_get 1회로 읽어 {키워드: 현재 사용횟수} 반환
+
+        행의 키워드가 달라졌으면(시트 정렬/삭제) 해당 키워드는 None
+        """
+        if not rows:
+            return {}
+
+        keywords = list(rows)
+        value_ranges = keywords_sheet.batch_get([f"B{rows[keyword]}:H{rows[keyword]}" for keyword in keywords])
+
+        current = {}
+        for keyword, values in zip(keywords, value_ranges):
+            cells = values[0] if values else []
+            if not cells or str(cells[0]).strip() != keyword:
+                current[keyword] = None
+                continue
+            try:
+                current[keyword] = int(cells[6]) if len(cells) > 6 and cells[6] != '' else 0
+            except (ValueError, TypeError):
+                current[keyword] = 0
+        return current
 
     def get_keyword_categories(self) -> List[Dict[str, str]]:
         """활성화된 카테고리 목록 가져오기"""
         try:
-            if not self.spreadsheet or not self.sheets_available:
+            if not self._sheets_ready():
                 return []
 
             categories_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['categories'])
@@ -447,14 +1246,14 @@ class KeywordManager:
         return self._cache_expiry and datetime.now() < self._cache_expiry
 
     def _clear_cache(self):
-        """캐시 무효화"""
-        self._cached_keywords.clear()
+        """캐시 무효화 (다음 조회 시 백그라운드 갱신)"""
         self._cache_expiry = None
 
     def refresh_cache(self):
         """키워드 캐시 강제 갱신"""
         logger.info("키워드 캐시 강제 갱신")
         self._clear_cache()
+        self._invalidate_row_index()
         return self.get_keywords(force_refresh=True)
 
     def get_priority_keywords(self, max_count: int = 5) -> List[str]:
@@ -462,42 +1261,14 @@ class KeywordManager:
         return self.get_keywords(min_priority=8, force_refresh=False)[:max_count]
 
     def get_statistics(self, days: int = 7) -> Dict:
-        """키워드 사용 통계 가져오기"""
+        """키워드 사용 통계 가져오기 (로컬 일별 롤업에서 최근 N일 집계)"""
         try:
-            if not self.spreadsheet or not self.sheets_available:
+            keyword_stats = self.stats_store.query(days)
+            if not keyword_stats and self.usage_stats:
                 return self._get_local_statistics()
 
-            stats_sheet = self.spreadsheet.worksheet(self.SHEET_NAMES['statistics'])
-            records = stats_sheet.get_all_records()
-
-            # 최근 N일 데이터 필터링
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            keyword_stats = {}
-            total_searches = 0
-            total_articles = 0
-
-            for record in records:
-                try:
-                    record_date = datetime.strptime(record.get('날짜', ''), '%Y-%m-%d')
-                    if record_date < cutoff_date:
-                        continue
-
-                    keyword = record.get('키워드', '')
-                    searches = int(record.get('검색횟수', 0))
-                    articles = int(record.get('매치된기사수', 0))
-
-                    if keyword not in keyword_stats:
-                        keyword_stats[keyword] = {'searches': 0, 'articles': 0}
-
-                    keyword_stats[keyword]['searches'] += searches
-                    keyword_stats[keyword]['articles'] += articles
-
-                    total_searches += searches
-                    total_articles += articles
-
-                except (ValueError, TypeError):
-                    continue
+            total_searches = sum(stat['searches'] for stat in keyword_stats.values())
+            total_articles = sum(stat['articles'] for stat in keyword_stats.values())
 
             # 상위 키워드 정렬
             top_keywords = sorted(
@@ -513,7 +1284,7 @@ class KeywordManager:
                 'unique_keywords': len(keyword_stats),
                 'top_keywords': top_keywords,
                 'average_articles_per_keyword': total_articles / len(keyword_stats) if keyword_stats else 0,
-                'sheets_connected': True
+                'sheets_connected': bool(self.spreadsheet and self.sheets_available)
             }
 
         except Exception as e:
@@ -544,7 +1315,7 @@ class KeywordManager:
     def test_connection(self) -> bool:
         """Google Sheets 연결 테스트"""
         try:
-            if not self.spreadsheet or not self.sheets_available:
+            if not self._sheets_ready():
                 logger.error("Google Sheets 연결이 없습니다")
                 return False
 
@@ -565,7 +1336,13 @@ class KeywordManager:
         print("=" * 50)
 
         try:
-            if not self.spreadsheet:
+            # 키워드 스냅샷 상태
+            snapshot_age = self.get_snapshot_age()
+            if snapshot_age is not None:
+                source = 'Google Sheets' if self._keyword_table_source == 'sheets' else '로컬 스냅샷'
+                print(f"🗂️ 키워드 테이블: {len(self._keyword_table)}개 ({source}, {snapshot_age / 60:.0f}분 전)")
+
+            if not self._sheets_ready():
                 print("❌ Google Sheets 연결 없음")
                 print(f"📋 기본 키워드 사용: {len(self.default_keywords)}개")
                 return
@@ -584,6 +1361,13 @@ class KeywordManager:
             # 캐시 상태
             cache_status = "유효" if self._is_cache_valid() else "만료됨"
             print(f"💾 캐시 상태: {cache_status}")
+            api_stats = self.get_api_stats()
+            print(f"📡 Sheets API 호출: {api_stats['total_calls']}회 (병합 {api_stats['coalesced']}회, 429 {api_stats['quota_errors']}회, 대기 {api_stats['throttled_seconds']}초)")
+            print(f"🔍 변경 확인: {self.refresh_stats['checks']}회 (전체 로드 {self.refresh_stats['full_loads']}회, 생략 {self.refresh_stats['skipped_loads']}회)")
+
+            # 백그라운드 통계 기록 상태
+            writer = self.get_writer_status()
+            print(f"✍️ 통계 기록: 큐 {writer['queue_depth']}건, 대기 키워드 {writer['pending_keywords']}개, 지연 {writer['lag_seconds']}초")
 
             # 최근 통계
             stats = self.get_statistics(days=7)
@@ -689,6 +1473,7 @@ def create_sample_spreadsheet():
 
     try:
         manager = KeywordManager()
+        manager.wait_until_ready()
 
         if not manager.sheets_available:
             print("❌ Google Sheets가 설정되지 않았습니다")
@@ -5,9 +5,11 @@ Google News AI Agent v2.0 - 통합 실행기
 간소화된 뉴스 수집 → Notion 저장 → Telegram 알림
 """
 
+import os
 import sys
 import time
 import logging
+import subprocess
 import schedule
 from datetime import datetime, timedelta
 from typing import Optional
@@ -15,9 +17,10 @@ from typing import Optional
 # 로컬 모듈 import
 try:
     from config import Config
-    from news_collector import NewsCollector
     from storage_manager import StorageManager
     from notifier import Notifier
+    from outbox import Outbox
+    from article_codec import encode_articles, decode_articles
 except ImportError as e:
     print(f"❌ 모듈 import 오류: {e}")
     print("💡 필요한 모듈들이 있는지 확인하세요")
@@ -40,16 +43,61 @@ class NewsAgent:
 
     def __init__(self):
         self.config = Config
-        self.collector = NewsCollector(max_articles=self.config.MAX_ARTICLES)
+        self._collector = None  # 수집 시점에 생성 (status/config 명령은 크롤러/Google 라이브러리 로드 안 함)
         self.storage = StorageManager()
         self.notifier = Notifier()
 
+        # 전송 대기함 (Notion 저장/Telegram 알림을 디스크에 기록 후 전송, 실패 시 다음 점검에서 재시도)
+        self.outbox = Outbox()
+        self.outbox.register('notion', self._deliver_notion)
+        self.outbox.register('telegram', self._deliver_telegram)
+        self.last_notion_url = None
+        self.last_telegram_success = False
+
         # 실행 상태
         self.is_running = False
         self.last_execution = None
         self.execution_count = 0
         self.success_count = 0
 
+    @property
+    def collector(self):
+        """뉴스 수집기 (첫 사용 시 생성)"""
+        if self._collector is None:
+            from news_collector import NewsCollector
+            self._collector = NewsCollector(max_articles=self.config.MAX_ARTICLES)
+        return self._collector
+
+    def _deliver_notion(self, payload: dict) -> bool:
+        """전송 대기함 Notion 항목 전송 (성공 시 Telegram 알림을 이어서 기록/전송)"""
+        articles = decode_articles(payload['articles'])
+        notion_url = self.storage.save_news_to_notion(articles, resume=payload.get('checkpoint'))
+        if not notion_url:
+            # 페이지는 만들어졌다면 재전송 때 새 페이지 대신 같은 페이지에 이어서 추가
+            if self.storage.last_checkpoint:
+                payload['checkpoint'] = self.storage.last_checkpoint
+            return False
+
+        self.last_notion_url = notion_url
+        self.last_telegram_success = False
+        if self.notifier.is_configured():
+            message = self.notifier.build_success_message(articles, notion_url)
+            telegram_id = self.outbox.enqueue('telegram', {'message': message})
+            self.last_telegram_success = self.outbox.deliver(telegram_id)
+        return True
+
+    def _deliver_telegram(self, payload: dict) -> bool:
+        """전송 대기함 Telegram 항목 전송"""
+        return self.notifier.send_message(payload['message'])
+
+    def replay_outbox(self) -> dict:
+        """재시도 시각이 지난 전송 대기 항목 재전송 (스케줄러 점검마다 호출)"""
+        try:
+            return self.outbox.replay()
+        except Exception as e:
+            logger.error(f"전송 대기함 재전송 오류: {e}")
+            return {'delivered': 0, 'failed': 0}
+
     def run_collection(self) -> bool:
         """뉴스 수집 메인 실행"""
         if self.is_running:
@@ -76,6 +124,11 @@ class NewsAgent:
             self.config.validate_config()
             print("✅ 설정 검증 완료")
 
+            # 이전 실행에서 밀린 전송 먼저 처리
+            replayed = self.replay_outbox()
+            if replayed['delivered'] or replayed['failed']:
+                print(f"📮 밀린 전송 재시도: 성공 {replayed['delivered']}건, 실패 {replayed['failed']}건")
+
             # 2단계: 뉴스 수집
             print(f"\n📰 2단계: AI 뉴스 수집 중...")
             articles = self.collector.collect_ai_news()
@@ -88,22 +141,38 @@ class NewsAgent:
 
             print(f"✅ {len(articles)}개 AI 뉴스 수집 완료")
 
-            # 3단계: Notion 저장
+            # 로컬 기사 아카이브 기록 (수집 직후 1회, Notion 전송/재전송과 무관)
+            archived = self.storage.archive_articles(articles)
+            if archived:
+                print(f"📚 로컬 아카이브에 {archived}개 기사 저장")
+
+            # 3단계: Notion 저장 (전송 대기함에 먼저 기록 → 실패해도 다음 점검에서 재전송)
             print(f"\n💾 3단계: Notion 저장 중...")
-            notion_url = self.storage.save_news_to_notion(articles)
+            notion_entry = self.outbox.enqueue('notion', {'articles': encode_articles(articles)})
 
-            if not notion_url:
-                error_msg = "Notion 저장에 실패했습니다"
+            if not self.outbox.deliver(notion_entry):
+                error_msg = "Notion 저장에 실패했습니다 (수집 결과는 전송 대기함에 보관, 다음 점검 시 재시도)"
                 print(f"❌ {error_msg}")
                 self.notifier.send_error_notification(error_msg)
                 return False
 
-            print(f"✅ Notion 저장 완료")
+            notion_url = self.last_notion_url
+
+            notion_stats = self.storage.get_api_stats()
+            print(f"✅ Notion 저장 완료 ({self.storage.last_save_seconds:.2f}초, "
+                  f"요청 {notion_stats['requests']}회, 재시도 {notion_stats['retries']}회)")
+            if self.storage.storage_mode == 'rows':
+                row_stats = self.storage.last_save_stats
+                print(f"   • 기사 행: 생성 {row_stats.get('created', 0)}, 갱신 {row_stats.get('updated', 0)}, "
+                      f"중복 {row_stats.get('unchanged', 0)}, 실패 {row_stats.get('failed', 0)}")
+            elif self.storage.storage_mode == 'daily':
+                daily_stats = self.storage.last_save_stats
+                print(f"   • 오늘 페이지: 새 기사 {daily_stats.get('appended', 0)}개 추가, 중복 {daily_stats.get('duplicates', 0)}개 제외")
             logger.info(f"Notion URL: {notion_url}")
 
-            # 4단계: Telegram 알림
+            # 4단계: Telegram 알림 (Notion 저장 직후 전송 대기함을 통해 전송됨)
             print(f"\n📱 4단계: Telegram 알림 전송 중...")
-            telegram_success = self.notifier.send_success_notification(articles, notion_url)
+            telegram_success = self.last_telegram_success
 
             # 실행 완료 요약
             end_time = time.time()
@@ -128,7 +197,7 @@ class NewsAgent:
             print(f"   • 발견된 키워드: {unique_keywords}개")
 
             print(f"   • 소요시간: {duration}초")
-            print(f"   • Notion 저장: ✅")
+            print(f"   • Notion 저장: ✅ ({self.storage.last_save_seconds:.2f}초)")
             print(f"   • Telegram 전송: {'✅' if telegram_success else '❌'}")
             print(f"   • 완료시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
             print(f"   • 💰 OpenAI API 비용: $0.00")
@@ -196,6 +265,7 @@ class NewsAgent:
 
             # 4. 뉴스 수집 테스트 (소량)
             print("4. 뉴스 수집 테스트...")
+            from news_collector import NewsCollector
             test_collector = NewsCollector(max_articles=3)
             test_articles = test_collector.collect_ai_news()
 
@@ -213,8 +283,23 @@ class NewsAgent:
             print(f"   ❌ 테스트 실패: {e}")
             return False
 
+    def shutdown(self):
+        """종료 전 백그라운드 작업 정리"""
+        if self._collector is not None:
+            self._collector.shutdown()
+
     def get_status(self) -> dict:
         """현재 상태 반환"""
+        collector = self._collector
+        keyword_manager = collector.keyword_manager if collector and collector.use_keyword_manager else None
+
+        if keyword_manager:
+            snapshot_age = keyword_manager.get_snapshot_age()
+        else:
+            # 수집기를 만들지 않고 로컬 스냅샷 파일만 확인
+            from keyword_manager import read_snapshot_age
+            snapshot_age = read_snapshot_age()
+
         return {
             'system_version': self.config.SYSTEM_VERSION,
             'is_running': self.is_running,
@@ -222,7 +307,10 @@ class NewsAgent:
             'success_count': self.success_count,
             'success_rate': f"{self.success_count/self.execution_count*100:.1f}%" if self.execution_count > 0 else "0%",
             'last_execution': self.last_execution.strftime('%Y-%m-%d %H:%M:%S') if self.last_execution else None,
-            'max_articles': self.config.MAX_ARTICLES
+            'max_articles': self.config.MAX_ARTICLES,
+            'keyword_writer': keyword_manager.get_writer_status() if keyword_manager else None,
+            'keyword_snapshot_age': snapshot_age,
+            'outbox': self.outbox.get_status()
         }
 
     def print_status(self):
@@ -241,6 +329,20 @@ class NewsAgent:
             print(f"🕐 마지막 실행: {status['last_execution']}")
 
         print(f"📊 수집 설정: 최대 {status['max_articles']}개 기사")
+
+        if status['keyword_snapshot_age'] is not None:
+            print(f"🗂️ 키워드 스냅샷: {status['keyword_snapshot_age'] / 60:.0f}분 전")
+
+        writer = status['keyword_writer']
+        if writer:
+            print(f"✍️ 키워드 통계 기록: 큐 {writer['queue_depth']}건, 지연 {writer['lag_seconds']}초")
+
+        outbox = status['outbox']
+        if outbox['pending'] or outbox['dead']:
+            oldest = outbox['oldest_age_seconds']
+            print(f"📮 전송 대기함: 대기 {outbox['pending']}건, 포기 {outbox['dead']}건"
+                  + (f" (가장 오래된 항목 {oldest / 60:.0f}분 전)" if oldest is not None else ""))
+
         print(f"💰 OpenAI API 비용: $0.00")
 
 
@@ -280,13 +382,52 @@ def run_scheduler(agent: NewsAgent):
 
         while True:
             schedule.run_pending()
+            agent.replay_outbox()  # 밀린 Notion/Telegram 전송 재시도
             time.sleep(60)  # 1분마다 체크
 
     except KeyboardInterrupt:
         print(f"\n⏹️ 스케줄러 종료")
+        agent.shutdown()
         agent.print_status()
 
 
+# import 비용 측정 대상 (외부 API 호출 없이 끝나는 명령)
+IMPORTTIME_COMMANDS = ['help', 'config', 'status']
+
+
+def measure_import_time(commands: Optional[list] = None, top: int = 5):
+    """서브커맨드별 import 비용 측정 (python -X importtime 결과 요약)"""
+    commands = commands or IMPORTTIME_COMMANDS
+    script = os.path.abspath(__file__)
+
+    print("⏱️ 서브커맨드별 import 시간 (python -X importtime)")
+    print("=" * 50)
+
+    for command in commands:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', script, command],
+            capture_output=True, text=True, cwd=os.getcwd()
+        )
+
+        # 형식: "import time: self [us] | cumulative | imported package" (들여쓰기 = 중첩 깊이)
+        top_level = []
+        for line in result.stderr.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            try:
+                _, cumulative, name = line[len('import time:'):].split('|', 2)
+                cumulative_us = int(cumulative)
+            except ValueError:
+                continue  # 헤더 행
+            if not name[1:].startswith(' '):
+                top_level.append((cumulative_us, name.strip()))
+
+        total_ms = sum(us for us, _ in top_level) / 1000
+        print(f"\n📦 {command}: {total_ms:.1f}ms (최상위 모듈 {len(top_level)}개)")
+        for us, name in sorted(top_level, reverse=True)[:top]:
+            print(f"  • {name}: {us / 1000:.1f}ms")
+
+
 def print_help():
     """도움말 출력"""
     print("Google News AI Agent v2.0 (Simplified)")
@@ -297,6 +438,8 @@ def print_help():
     print("  python3 main.py status    # 상태 정보")
     print("  python3 main.py schedule  # 스케줄러 시작")
     print("  python3 main.py config    # 설정 정보")
+    print("  python3 main.py search 검색어 [--since YYYY-MM-DD] [--until YYYY-MM-DD]  # 로컬 아카이브 검색")
+    print("  python3 main.py importtime [명령...]  # 명령별 import 시간 측정")
     print("  python3 main.py help      # 도움말")
     print("\n💰 특징:")
     print("  • OpenAI API 비용 없음!")
@@ -332,12 +475,20 @@ def main():
         elif command == "help":
             print_help()
 
+        elif command == "search":
+            from article_archive import main as archive_main
+            archive_main(['search'] + sys.argv[2:])
+
+        elif command == "importtime":
+            measure_import_time(sys.argv[2:])
+
         else:
             print(f"❌ 알 수 없는 명령어: {command}")
             print("도움말: python3 main.py help")
     else:
         # 메인 실행
         success = agent.run_collection()
+        agent.shutdown()
         sys.exit(0 if success else 1)
 
 
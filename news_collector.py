@@ -5,31 +5,182 @@
 Google News 검색 + 기사 크롤링 + 키워드 필터링을 하나의 모듈로 통합
 """
 
+import os
+import codecs
+import importlib.util
 import requests
 import feedparser
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait, FIRST_COMPLETED
 from datetime import datetime, timedelta
-from urllib.parse import quote, urljoin, urlparse
+from typing import Optional
+from urllib.parse import quote, urljoin, urlparse, urlunparse
 from bs4 import BeautifulSoup
 import re
 
-# 키워드 매니저 import (선택적)
-try:
-    from keyword_manager import KeywordManager
-    KEYWORD_MANAGER_AVAILABLE = True
-except ImportError:
-    KEYWORD_MANAGER_AVAILABLE = False
+from state_store import load_state, save_state
+
+# 키워드 매니저 (선택적, 수집기 생성 시점에 import)
+KEYWORD_MANAGER_AVAILABLE = importlib.util.find_spec('keyword_manager') is not None
 
 logger = logging.getLogger(__name__)
 
+CRAWL_STATE_FILE = 'crawl_state.json'
+
+# meta charset 탐색 범위 (문서 앞부분만 검사)
+CHARSET_SNIFF_BYTES = 4096
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?\s*([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+
+class LatencyHistogram:
+    """호스트별 응답 지연 히스토그램 (p95 등 분위수 추정용)"""
+
+    # 버킷 상한 (초) - 마지막 버킷은 상한 없음
+    BUCKETS = [0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 1.5, 2.0, 3.0, 5.0, 8.0, 12.0, 20.0]
+    MAX_SAMPLES = 1000  # 초과 시 절반으로 감쇠하여 최근 경향 반영
+
+    def __init__(self, counts: Optional[list] = None):
+        if counts and len(counts) == len(self.BUCKETS) + 1:
+            self.counts = [int(c) for c in counts]
+        else:
+            self.counts = [0] * (len(self.BUCKETS) + 1)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts)
+
+    def record(self, seconds: float):
+        """응답 시간 기록"""
+        index = len(self.BUCKETS)
+        for i, upper in enumerate(self.BUCKETS):
+            if seconds <= upper:
+                index = i
+                break
+        self.counts[index] += 1
+
+        if self.total > self.MAX_SAMPLES:
+            self.counts = [c // 2 for c in self.counts]
+
+    def percentile(self, q: float) -> Optional[float]:
+        """분위수 상한값 반환 (초). 상한 없는 버킷에 해당하면 None"""
+        total = self.total
+        if total == 0:
+            return None
+
+        threshold = q * total
+        cumulative = 0
+        for i, count in enumerate(self.counts):
+            cumulative += count
+            if cumulative >= threshold:
+                return self.BUCKETS[i] if i < len(self.BUCKETS) else None
+        return None
+
+    def to_list(self) -> list:
+        return list(self.counts)
+
+
+class AdaptiveConcurrencyLimiter:
+    """호스트별 AIMD 동시성 제어기 (빠른 성공 시 가산 증가, 혼잡 신호 시 승산 감소)"""
+
+    def __init__(self, initial_limit: float = 2, min_limit: float = 1, max_limit: float = 8,
+                 decrease_factor: float = 0.5, fast_threshold: float = 2.0):
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.fast_threshold = fast_threshold
+
+        self._limits = {}
+        self._in_flight = {}
+        self._condition = threading.Condition()
+
+    def _limit(self, host: str) -> float:
+        return self._limits.setdefault(host, float(self.initial_limit))
+
+    def acquire(self, host: str):
+        """호스트 동시 요청 슬롯 획득 (한도 도달 시 대기)"""
+        with self._condition:
+            while self._in_flight.get(host, 0) >= int(self._limit(host)):
+                self._condition.wait()
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+
+    def try_acquire(self, host: str) -> bool:
+        """대기 없이 슬롯 획득 시도"""
+        with self._condition:
+            if self._in_flight.get(host, 0) >= int(self._limit(host)):
+                return False
+            self._in_flight[host] = self._in_flight.get(host, 0) + 1
+            return True
+
+    def release(self, host: str):
+        """슬롯 반환"""
+        with self._condition:
+            self._in_flight[host] = max(0, self._in_flight.get(host, 0) - 1)
+            self._condition.notify_all()
+
+    def on_success(self, host: str, latency: float):
+        """빠른 성공 응답: 한도 1 만큼 증가하는 데 한 윈도우(현재 한도만큼의 응답)가 필요"""
+        if latency > self.fast_threshold:
+            return
+        with self._condition:
+            limit = self._limit(host)
+            self._limits[host] = min(self.max_limit, limit + 1.0 / limit)
+            self._condition.notify_all()
+
+    def on_congestion(self, host: str):
+        """타임아웃/429/5xx: 한도 승산 감소"""
+        with self._condition:
+            limit = self._limit(host)
+            self._limits[host] = max(self.min_limit, limit * self.decrease_factor)
+            logger.debug(f"동시성 한도 감소 ({host}): {limit:.2f} → {self._limits[host]:.2f}")
+
+    def get_limits(self) -> dict:
+        """호스트별 현재 한도 반환"""
+        with self._condition:
+            return {host: int(limit) for host, limit in self._limits.items()}
+
+
 class NewsCollector:
     """통합 뉴스 수집기 - Google News 검색부터 크롤링까지"""
 
     def __init__(self, max_articles=10, use_keyword_manager=True):
         self.max_articles = max_articles
+        self.max_candidates = int(os.getenv('CRAWL_MAX_CANDIDATES', str(max_articles * 5)))
         self.use_keyword_manager = use_keyword_manager and KEYWORD_MANAGER_AVAILABLE
         self.session = requests.Session()
+        self.request_timeout = int(os.getenv('REQUEST_TIMEOUT', '20'))
+
+        self.max_workers = int(os.getenv('CRAWL_MAX_WORKERS', '8'))
+
+        # 헤지 요청 설정 (p95 지연 초과 시 동일 요청 1회 추가 발송)
+        self.hedge_enabled = os.getenv('CRAWL_HEDGE_ENABLED', 'false').lower() == 'true'
+        self.hedge_max_ratio = float(os.getenv('CRAWL_HEDGE_MAX_RATIO', '0.1'))
+        self.hedge_min_samples = int(os.getenv('CRAWL_HEDGE_MIN_SAMPLES', '20'))
+        self._fetch_executor = None
+        self._hedge_executor = None
+        if self.hedge_enabled:
+            # 원 요청: 크롤링 워커당 진행 중 1개 + 헤지에 져서 타임아웃까지 남는 1개
+            self._fetch_executor = ThreadPoolExecutor(max_workers=self.max_workers * 2, thread_name_prefix='fetch')
+            # 헤지 요청은 별도 풀에서 발송 (느린 원 요청 뒤에 줄 서지 않도록)
+            self._hedge_executor = ThreadPoolExecutor(max_workers=max(2, self.max_workers // 2),
+                                                      thread_name_prefix='hedge')
+        self._lock = threading.Lock()
+
+        # 호스트별 적응형 동시성 제어 (AIMD)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            initial_limit=int(os.getenv('CRAWL_HOST_INITIAL_CONCURRENCY', '2')),
+            max_limit=int(os.getenv('CRAWL_HOST_MAX_CONCURRENCY', '8')),
+            fast_threshold=float(os.getenv('CRAWL_FAST_RESPONSE_SECONDS', '2.0'))
+        )
+
+        # 실행 간 유지되는 크롤링 상태 (호스트별 지연 히스토그램 등)
+        self.crawl_state = load_state(CRAWL_STATE_FILE, {}) or {}
+        self.latency_histograms = {
+            host: LatencyHistogram(counts)
+            for host, counts in self.crawl_state.get('latency', {}).items()
+        }
 
         # 공통 헤더 설정
         self.session.headers.update({
@@ -44,6 +195,7 @@ class NewsCollector:
         self.keyword_manager = None
         if self.use_keyword_manager:
             try:
+                from keyword_manager import KeywordManager
                 self.keyword_manager = KeywordManager()
                 logger.info("✅ 키워드 매니저 연결 성공")
             except Exception as e:
@@ -71,6 +223,33 @@ class NewsCollector:
             'mk.co.kr': ['.news_detail_text']
         }
 
+        # 경량(AMP/모바일) 페이지 설정
+        self.prefer_light_pages = os.getenv('CRAWL_PREFER_LIGHT_PAGES', 'true').lower() == 'true'
+
+        # 사이트별 경량 페이지 URL 변환 규칙 (netloc 교체, 경로 앞/뒤 추가, 쿼리 추가)
+        self.light_url_rules = {
+            'chosun.com': {'netloc': '', 'path_prefix': '', 'path_suffix': '', 'query': 'outputType=amp'}
+        }
+
+        # 경량 페이지 전용 본문 선택자 (없으면 기본 AMP 선택자 사용)
+        self.light_content_selectors = {
+            'chosun.com': ['.article-body', 'section.article-body'],
+        }
+        self.default_light_selectors = [
+            'article', '[itemprop="articleBody"]', '.article-body', '.article_body', '.news_body', 'main'
+        ]
+
+        # <link rel="amphtml">에서 학습한 호스트별 변환 규칙 (실행 간 유지)
+        self.learned_light_rules = self.crawl_state.get('light_rules', {})
+
+        # 호스트별 연속 경량 페이지 실패 횟수 (기본/학습 규칙 공통, N회 연속 실패 시 일정 시간 비활성화)
+        self.light_rule_max_misses = int(os.getenv('CRAWL_LIGHT_RULE_MAX_MISSES', '3'))
+        self.light_rule_retry_seconds = float(os.getenv('CRAWL_LIGHT_RULE_RETRY_HOURS', '24')) * 3600
+        self.light_rule_misses = self.crawl_state.get('light_rule_misses', {})
+
+        # 호스트별 확인된 문자 인코딩 (실행 간 유지)
+        self.domain_encodings = self.crawl_state.get('encodings', {})
+
         # 제거할 요소들
         self.remove_selectors = [
             'script', 'style', 'nav', 'header', 'footer', 'aside',
@@ -78,12 +257,24 @@ class NewsCollector:
             '.related-articles', '.comment', '.tag'
         ]
 
+        # 일별 압축 보관소 (장기 보관용, 선택)
+        self.daily_archive_enabled = os.getenv('DAILY_ARCHIVE_ENABLED', 'false').lower() == 'true'
+
         # 통계
         self.stats = {
             'searched_articles': 0,
             'crawled_articles': 0,
             'filtered_articles': 0,
             'failed_crawls': 0,
+            'fetch_requests': 0,
+            'hedged_requests': 0,
+            'hedge_wins': 0,
+            'host_concurrency': {},
+            'light_page_hits': 0,
+            'light_page_misses': 0,
+            'downloaded_bytes': 0,
+            'parse_seconds': 0.0,
+            'encoding_cache_hits': 0,
             'keyword_matches': {}
         }
 
@@ -125,69 +316,143 @@ class NewsCollector:
         """AI 뉴스 수집 메인 함수"""
         logger.info(f"AI 뉴스 수집 시작 (최대 {self.max_articles}개)")
 
-        # 1단계: Google News에서 AI 뉴스 검색
-        search_results = self._search_google_news()
-        if not search_results:
+        # 백그라운드에서 갱신된 키워드 반영 (메모리 조회)
+        self.ai_keywords = self._get_current_keywords()
+
+        # 1단계: Google News 후보를 지연 생성 (필요한 만큼만 꺼내 씀)
+        candidates = self.iter_candidates()
+
+        # 2단계: 목표 개수를 채울 때까지 병렬 크롤링 및 필터링 (호스트별 동시성은 AIMD 제어기가 조절)
+        collected_articles = []
+        in_flight = set()
+        pulled = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='crawl') as executor:
+            while True:
+                # 진행 중인 작업까지 합쳐 목표를 넘지 않을 만큼만 후보 투입
+                while (len(in_flight) < self.max_workers
+                       and len(collected_articles) + len(in_flight) < self.max_articles):
+                    article = next(candidates, None)
+                    if article is None:
+                        break
+                    pulled += 1
+                    in_flight.add(executor.submit(self._process_article, article, pulled))
+
+                if not in_flight:
+                    break
+
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    article = future.result()
+                    if article:
+                        collected_articles.append(article)
+
+        self.stats['searched_articles'] = pulled
+        self.stats['host_concurrency'] = self.concurrency.get_limits()
+
+        if not pulled:
             logger.warning("Google News 검색 결과가 없습니다")
             return []
 
-        self.stats['searched_articles'] = len(search_results)
-        logger.info(f"Google News 검색 완료: {len(search_results)}개 발견")
+        # 최신순 정렬
+        collected_articles.sort(key=lambda x: x['published'], reverse=True)
+
+        self._save_crawl_state()
 
-        # 2단계: 각 기사 크롤링 및 필터링
-        collected_articles = []
+        if self.daily_archive_enabled and collected_articles:
+            try:
+                from daily_archive import write_daily_archive
+                write_daily_archive(collected_articles)
+            except Exception as e:
+                logger.warning(f"일별 기사 보관 실패: {e}")
 
-        for i, article in enumerate(search_results[:self.max_articles], 1):
+        # 실행 중 누적된 키워드 사용량을 한 번에 기록
+        if self.use_keyword_manager and self.keyword_manager:
             try:
-                logger.info(f"기사 처리 중 ({i}/{min(len(search_results), self.max_articles)}): {article['title'][:50]}...")
+                self.keyword_manager.flush_usage()
+            except Exception as e:
+                logger.warning(f"키워드 사용량 기록 실패: {e}")
 
-                # 기사 본문 크롤링
-                content = self._crawl_article_content(article['url'])
+        logger.info(f"AI 뉴스 수집 완료: {len(collected_articles)}개")
+        self._print_statistics()
 
-                if content:
-                    article['content'] = content
-                    article['content_length'] = len(content)
+        return collected_articles
 
-                    # AI 관련성 필터링
-                    if self._is_ai_related(article):
-                        # 키워드 추출
-                        article['found_keywords'] = self._extract_keywords(article)
-                        collected_articles.append(article)
-                        self.stats['filtered_articles'] += 1
-                        logger.info(f"✅ AI 관련 기사 수집: {article['title'][:50]}...")
-                    else:
-                        logger.info(f"⏭️ AI 무관 기사 스킵: {article['title'][:50]}...")
+    def _process_article(self, article: dict, index: int) -> Optional[dict]:
+        """기사 1건 크롤링 및 필터링 (AI 관련 기사면 반환)"""
+        try:
+            logger.info(f"기사 처리 중 ({index}번째 후보): {article['title'][:50]}...")
 
+            # 원본 URL 확인 (후보 생성 시점이 아닌 처리 시점에 수행)
+            article['url'] = self._extract_original_url(article['url'])
+
+            # 기사 본문 크롤링
+            content = self._crawl_article_content(article['url'])
+
+            if content:
+                article['content'] = content
+                article['content_length'] = len(content)
+
+                with self._lock:
                     self.stats['crawled_articles'] += 1
-                else:
-                    # 크롤링 실패해도 요약으로 포함
-                    article['content'] = article.get('summary', '')
-                    article['content_length'] = len(article['content'])
-                    article['found_keywords'] = self._extract_keywords(article)
 
-                    if self._is_ai_related(article):
-                        collected_articles.append(article)
+                # AI 관련성 필터링
+                if self._is_ai_related(article):
+                    # 키워드 추출
+                    article['found_keywords'] = self._extract_keywords(article)
+                    with self._lock:
                         self.stats['filtered_articles'] += 1
+                    logger.info(f"✅ AI 관련 기사 수집: {article['title'][:50]}...")
+                    return article
 
-                    self.stats['failed_crawls'] += 1
+                logger.info(f"⏭️ AI 무관 기사 스킵: {article['title'][:50]}...")
+                return None
 
-                # 요청 간격 (서버 부하 방지)
-                time.sleep(1)
+            # 크롤링 실패해도 요약으로 포함
+            article['content'] = article.get('summary', '')
+            article['content_length'] = len(article['content'])
+            article['found_keywords'] = self._extract_keywords(article)
 
-            except Exception as e:
-                logger.error(f"기사 처리 중 오류: {e}")
+            with self._lock:
                 self.stats['failed_crawls'] += 1
-                continue
 
-        # 최신순 정렬
-        collected_articles.sort(key=lambda x: x['published'], reverse=True)
+            if self._is_ai_related(article):
+                with self._lock:
+                    self.stats['filtered_articles'] += 1
+                return article
 
-        logger.info(f"AI 뉴스 수집 완료: {len(collected_articles)}개")
-        self._print_statistics()
+            return None
 
-        return collected_articles
+        except Exception as e:
+            logger.error(f"기사 처리 중 오류: {e}")
+            with self._lock:
+                self.stats['failed_crawls'] += 1
+            return None
+
+    def iter_candidates(self):
+        """Google News 후보 기사 제너레이터 (원본 URL 확인과 크롤링은 소비 측에서 수행)"""
+        entries = self._fetch_google_news_entries()
+        logger.info(f"Google News 검색 완료: {len(entries)}개 발견")
+
+        for entry in entries[:self.max_candidates]:
+            try:
+                # 기사 기본 정보 추출
+                article = {
+                    'title': entry.title,
+                    'url': entry.link,
+                    'summary': getattr(entry, 'summary', '')[:300],
+                    'source': getattr(entry, 'source', {}).get('title', 'Unknown'),
+                    'published': self._parse_published_time(entry),
+                    'content': '',
+                    'found_keywords': []
+                }
+            except Exception as e:
+                logger.warning(f"RSS 엔트리 파싱 실패: {e}")
+                continue
+
+            yield article
 
-    def _search_google_news(self) -> list:
+    def _fetch_google_news_entries(self) -> list:
         """Google News RSS에서 AI 뉴스 검색"""
         try:
             # AI 핵심 키워드로 검색 쿼리 구성
@@ -206,30 +471,7 @@ class NewsCollector:
 
             # feedparser로 파싱
             feed = feedparser.parse(response.content)
-
-            if not feed.entries:
-                return []
-
-            articles = []
-            for entry in feed.entries[:self.max_articles * 2]:  # 여유분 확보
-                try:
-                    # 기사 기본 정보 추출
-                    article = {
-                        'title': entry.title,
-                        'url': self._extract_original_url(entry.link),
-                        'summary': getattr(entry, 'summary', '')[:300],
-                        'source': getattr(entry, 'source', {}).get('title', 'Unknown'),
-                        'published': self._parse_published_time(entry),
-                        'content': '',
-                        'found_keywords': []
-                    }
-                    articles.append(article)
-
-                except Exception as e:
-                    logger.warning(f"RSS 엔트리 파싱 실패: {e}")
-                    continue
-
-            return articles
+            return list(feed.entries)
 
         except Exception as e:
             logger.error(f"Google News 검색 실패: {e}")
@@ -257,37 +499,349 @@ class NewsCollector:
             pass
         return datetime.now()
 
+    def _timed_get(self, url: str, host: str) -> requests.Response:
+        """GET 요청 후 호스트별 지연 히스토그램에 기록"""
+        start = time.monotonic()
+        try:
+            return self.session.get(url, timeout=self.request_timeout)
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self.stats['fetch_requests'] += 1
+                histogram = self.latency_histograms.setdefault(host, LatencyHistogram())
+                histogram.record(elapsed)
+
+    def _get_hedge_delay(self, host: str) -> Optional[float]:
+        """헤지 요청 발송 대기시간 (호스트 p95). 표본이 부족하면 None"""
+        with self._lock:
+            histogram = self.latency_histograms.get(host)
+            if not histogram or histogram.total < self.hedge_min_samples:
+                return None
+            delay = histogram.percentile(0.95)
+
+        if delay is None or delay >= self.request_timeout:
+            return None
+        return delay
+
+    def _acquire_hedge_budget(self) -> bool:
+        """헤지 비율 상한 확인 (부하 증폭 방지)"""
+        with self._lock:
+            allowed = max(1, int(self.stats['fetch_requests'] * self.hedge_max_ratio))
+            if self.stats['hedged_requests'] >= allowed:
+                return False
+            self.stats['hedged_requests'] += 1
+            return True
+
+    def _fetch(self, url: str) -> requests.Response:
+        """기사 페이지 요청 (필요 시 헤지 요청으로 꼬리 지연 단축)"""
+        host = urlparse(url).netloc.lower()
+
+        hedge_delay = self._get_hedge_delay(host) if self.hedge_enabled else None
+        if hedge_delay is None:
+            return self._timed_get(url, host)
+
+        # 대기시간은 제출 시점부터 계산 (풀 대기열에서 기다린 시간도 p95 지연에 포함)
+        primary = self._fetch_executor.submit(self._timed_get, url, host)
+        try:
+            return primary.result(timeout=hedge_delay)
+        except FutureTimeoutError:
+            pass
+
+        # 원 요청이 아직 대기열에 있으면 헤지 대신 현재 스레드에서 바로 요청
+        if primary.cancel():
+            return self._timed_get(url, host)
+
+        # 헤지 요청도 호스트 동시성 한도를 지킴
+        if not self.concurrency.try_acquire(host):
+            return primary.result()
+
+        if not self._acquire_hedge_budget():
+            self.concurrency.release(host)
+            return primary.result()
+
+        logger.debug(f"헤지 요청 발송 ({host}, p95={hedge_delay}s): {url}")
+        hedge = self._hedge_executor.submit(self._timed_get, url, host)
+        hedge.add_done_callback(lambda _: self.concurrency.release(host))
+
+        pending = {primary, hedge}
+        last_error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    response = future.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+
+                if future is hedge:
+                    with self._lock:
+                        self.stats['hedge_wins'] += 1
+                return response
+
+        raise last_error
+
+    def _save_crawl_state(self):
+        """크롤링 상태 저장 (다음 실행에서 재사용)"""
+        with self._lock:
+            self.crawl_state['latency'] = {
+                host: histogram.to_list()
+                for host, histogram in self.latency_histograms.items()
+            }
+            self.crawl_state['light_rules'] = self.learned_light_rules
+            self.crawl_state['light_rule_misses'] = self.light_rule_misses
+            self.crawl_state['encodings'] = self.domain_encodings
+        save_state(CRAWL_STATE_FILE, self.crawl_state)
+
+    def _fetch_with_concurrency_control(self, url: str) -> requests.Response:
+        """호스트 동시성 슬롯 안에서 요청하고 응답 결과를 AIMD 제어기에 반영"""
+        host = urlparse(url).netloc.lower()
+
+        self.concurrency.acquire(host)
+        start = time.monotonic()
+        try:
+            response = self._fetch(url)
+        except (requests.Timeout, requests.ConnectionError):
+            self.concurrency.on_congestion(host)
+            raise
+        finally:
+            self.concurrency.release(host)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self.concurrency.on_congestion(host)
+        elif response.status_code < 400:
+            self.concurrency.on_success(host, time.monotonic() - start)
+
+        return response
+
+    def _find_light_rule(self, host: str) -> Optional[dict]:
+        """호스트에 적용할 경량 페이지 변환 규칙 (학습 규칙 우선)"""
+        learned = self.learned_light_rules.get(host)
+        if learned and learned.get('disabled'):
+            if time.time() < learned.get('retry_at', 0):
+                return None
+
+            # 비활성화 기간이 지나면 이전 규칙(없으면 기본 규칙/재학습)으로 다시 시도
+            with self._lock:
+                if learned.get('rule'):
+                    self.learned_light_rules[host] = learned['rule']
+                else:
+                    self.learned_light_rules.pop(host, None)
+            logger.info(f"경량 페이지 규칙 재시도 ({host})")
+            learned = learned.get('rule')
+
+        if learned:
+            return learned
+
+        for site_domain, rule in self.light_url_rules.items():
+            if site_domain in host:
+                return rule
+        return None
+
+    @staticmethod
+    def _apply_light_rule(url: str, rule: dict) -> str:
+        """변환 규칙으로 경량 페이지 URL 생성"""
+        parsed = urlparse(url)
+        query = parsed.query
+        if rule.get('query') and rule['query'] not in query:
+            query = f"{query}&{rule['query']}" if query else rule['query']
+
+        return urlunparse(parsed._replace(
+            netloc=rule.get('netloc') or parsed.netloc,
+            path=f"{rule.get('path_prefix', '')}{parsed.path}{rule.get('path_suffix', '')}",
+            query=query,
+            fragment=''
+        ))
+
+    def _derive_light_rule(self, url: str, light_url: str) -> Optional[dict]:
+        """원본/AMP URL 쌍에서 호스트 단위 변환 규칙 추출 (재현 가능한 경우만)"""
+        source = urlparse(url)
+        target = urlparse(urljoin(url, light_url))
+
+        if len(source.path) <= 1 or source.path not in target.path:
+            return None
+
+        start = target.path.index(source.path)
+        extra_query = '&'.join(
+            part for part in target.query.split('&')
+            if part and part not in source.query.split('&')
+        )
+        rule = {
+            'netloc': target.netloc if target.netloc != source.netloc else '',
+            'path_prefix': target.path[:start],
+            'path_suffix': target.path[start + len(source.path):],
+            'query': extra_query
+        }
+
+        if self._apply_light_rule(url, rule) != urlunparse(target._replace(fragment='')):
+            return None
+        if not any(rule.values()):
+            return None
+        return rule
+
+    def _learn_light_rule(self, url: str, soup: BeautifulSoup):
+        """데스크톱 페이지의 amphtml 힌트로 변환 규칙 학습"""
+        host = urlparse(url).netloc.lower()
+        if host in self.learned_light_rules:
+            return
+
+        link = soup.find('link', rel='amphtml')
+        if not link or not link.get('href'):
+            return
+
+        rule = self._derive_light_rule(url, link['href'])
+        if rule:
+            with self._lock:
+                self.learned_light_rules[host] = rule
+            logger.info(f"경량 페이지 규칙 학습 ({host}): {rule}")
+
     def _crawl_article_content(self, url: str) -> str:
-        """기사 본문 크롤링"""
+        """기사 본문 크롤링 (경량 페이지가 알려진 경우 우선 사용)"""
+        host = urlparse(url).netloc.lower()
+
+        if self.prefer_light_pages:
+            rule = self._find_light_rule(host)
+            if rule:
+                light_url = self._apply_light_rule(url, rule)
+                content = self._crawl_page(light_url, url, variant='light')
+                if content:
+                    with self._lock:
+                        self.stats['light_page_hits'] += 1
+                        self.light_rule_misses.pop(host, None)
+                    return content
+
+                # 규칙이 연속으로 통하지 않으면 (기본 규칙 포함) 호스트 단위로 비활성화하고 원본으로 폴백
+                with self._lock:
+                    self.stats['light_page_misses'] += 1
+                    misses = self.light_rule_misses.get(host, 0) + 1
+                    if misses >= self.light_rule_max_misses:
+                        previous = self.learned_light_rules.get(host)
+                        self.learned_light_rules[host] = {
+                            'disabled': True,
+                            'retry_at': time.time() + self.light_rule_retry_seconds,
+                            'rule': previous if previous and not previous.get('disabled') else None
+                        }
+                        self.light_rule_misses.pop(host, None)
+                        logger.info(f"경량 페이지 규칙 비활성화 ({host}): {misses}회 연속 실패, "
+                                    f"{self.light_rule_retry_seconds / 3600:g}시간 후 재시도")
+                    else:
+                        self.light_rule_misses[host] = misses
+
+        return self._crawl_page(url, url, variant='desktop')
+
+    def _crawl_page(self, fetch_url: str, article_url: str, variant: str) -> str:
+        """페이지 1건 다운로드 및 본문 추출"""
         try:
-            response = self.session.get(url, timeout=20)
+            response = self._fetch_with_concurrency_control(fetch_url)
             response.raise_for_status()
 
-            # 인코딩 설정
-            if response.encoding.lower() in ['iso-8859-1', 'ascii']:
-                response.encoding = 'utf-8'
+            parse_start = time.monotonic()
+
+            # 디코딩된 문자열을 넘겨 BeautifulSoup의 인코딩 재감지 생략
+            html_text = self._decode_response(response, urlparse(fetch_url).netloc.lower())
+            soup = BeautifulSoup(html_text, 'html.parser')
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            if variant == 'desktop' and self.prefer_light_pages:
+                self._learn_light_rule(article_url, soup)
 
             # 본문 추출
-            content = self._extract_main_content(soup, url)
+            content = self._extract_main_content(soup, article_url, variant)
+
+            with self._lock:
+                self.stats['downloaded_bytes'] += len(response.content)
+                self.stats['parse_seconds'] += time.monotonic() - parse_start
+
             return self._clean_text(content)
 
         except Exception as e:
-            logger.warning(f"크롤링 실패 ({url}): {e}")
+            logger.warning(f"크롤링 실패 ({fetch_url}): {e}")
             return ""
 
-    def _extract_main_content(self, soup: BeautifulSoup, url: str) -> str:
+    @staticmethod
+    def _normalize_encoding(name: str) -> Optional[str]:
+        """인코딩 이름 정규화 (EUC-KR은 상위 집합인 CP949로 처리)"""
+        try:
+            encoding = codecs.lookup(name.strip().strip('"\'')).name
+        except (LookupError, AttributeError):
+            return None
+
+        if encoding in ('euc_kr', 'ks_c_5601-1987'):
+            return 'cp949'
+        # 헤더 기본값(ISO-8859-1/ASCII)은 신뢰하지 않음
+        if encoding in ('latin-1', 'iso8859-1', 'ascii'):
+            return None
+        return encoding
+
+    def _header_encoding(self, response: requests.Response) -> Optional[str]:
+        """Content-Type 헤더에 명시된 charset (없거나 알 수 없으면 None)"""
+        content_type = response.headers.get('Content-Type', '').lower()
+        if 'charset=' not in content_type:
+            return None
+        return self._normalize_encoding(content_type.split('charset=')[-1].split(';')[0])
+
+    def _detect_encoding(self, response: requests.Response) -> str:
+        """응답 인코딩 판별: HTTP 헤더 → 앞부분 meta charset → UTF-8 검증 → CP949"""
+        encoding = self._header_encoding(response)
+        if encoding:
+            return encoding
+
+        match = META_CHARSET_PATTERN.search(response.content[:CHARSET_SNIFF_BYTES])
+        if match:
+            encoding = self._normalize_encoding(match.group(1).decode('ascii', 'ignore'))
+            if encoding:
+                return encoding
+
+        try:
+            response.content.decode('utf-8')
+            return 'utf-8'
+        except UnicodeDecodeError:
+            return 'cp949'
+
+    def _decode_response(self, response: requests.Response, host: str) -> str:
+        """응답 디코딩 (헤더 charset 우선, 헤더에 없으면 호스트별 캐시된 인코딩 사용)"""
+        raw = response.content
+        cached = self.domain_encodings.get(host)
+
+        # 헤더에 charset이 명시되면 캐시보다 우선 (다르면 캐시 갱신)
+        encoding = self._header_encoding(response)
+        if encoding:
+            with self._lock:
+                if encoding == cached:
+                    self.stats['encoding_cache_hits'] += 1
+                else:
+                    self.domain_encodings[host] = encoding
+            return raw.decode(encoding, errors='replace')
+
+        if cached:
+            try:
+                text = raw.decode(cached)
+            except UnicodeDecodeError:
+                logger.info(f"캐시된 인코딩 불일치 ({host}: {cached}) - 재판별")
+            else:
+                with self._lock:
+                    self.stats['encoding_cache_hits'] += 1
+                return text
+
+        encoding = self._detect_encoding(response)
+        with self._lock:
+            self.domain_encodings[host] = encoding
+        return raw.decode(encoding, errors='replace')
+
+    def _extract_main_content(self, soup: BeautifulSoup, url: str, variant: str = 'desktop') -> str:
         """메인 컨텐츠 추출"""
         domain = urlparse(url).netloc.lower()
 
-        # 사이트별 최적화된 선택자 사용
+        # 사이트별 최적화된 선택자 사용 (페이지 변형별로 분리)
+        selector_table = self.light_content_selectors if variant == 'light' else self.content_selectors
         selectors = []
-        for site_domain, site_selectors in self.content_selectors.items():
+        for site_domain, site_selectors in selector_table.items():
             if site_domain in domain:
                 selectors = site_selectors
                 break
 
+        if not selectors and variant == 'light':
+            selectors = self.default_light_selectors
+
         # 기본 선택자
         if not selectors:
             selectors = [
@@ -353,9 +907,10 @@ class NewsCollector:
                 found_keywords.append(keyword)
 
                 # 키워드 매치 통계 업데이트
-                if keyword not in self.stats['keyword_matches']:
-                    self.stats['keyword_matches'][keyword] = 0
-                self.stats['keyword_matches'][keyword] += 1
+                with self._lock:
+                    if keyword not in self.stats['keyword_matches']:
+                        self.stats['keyword_matches'][keyword] = 0
+                    self.stats['keyword_matches'][keyword] += 1
 
                 # 키워드 매니저에 사용량 업데이트
                 if self.use_keyword_manager and self.keyword_manager:
@@ -374,6 +929,17 @@ class NewsCollector:
         print(f"  • AI 관련 필터링: {self.stats['filtered_articles']}개")
         print(f"  • 크롤링 실패: {self.stats['failed_crawls']}개")
 
+        if self.hedge_enabled:
+            print(f"  • 헤지 요청: {self.stats['hedged_requests']}회 (승리 {self.stats['hedge_wins']}회)")
+
+        if self.prefer_light_pages:
+            print(f"  • 경량 페이지 사용: {self.stats['light_page_hits']}회 (실패 {self.stats['light_page_misses']}회)")
+        print(f"  • 다운로드: {self.stats['downloaded_bytes'] / 1024:.0f}KB, 파싱 {self.stats['parse_seconds']:.2f}초")
+
+        if self.stats['host_concurrency']:
+            limits = ', '.join(f"{host}={limit}" for host, limit in sorted(self.stats['host_concurrency'].items()))
+            print(f"  • 호스트별 동시성 한도: {limits}")
+
         if self.stats['searched_articles'] > 0:
             success_rate = (self.stats['crawled_articles'] / self.stats['searched_articles']) * 100
             print(f"  • 크롤링 성공률: {success_rate:.1f}%")
@@ -396,9 +962,23 @@ class NewsCollector:
         else:
             print(f"  • 매치된 키워드: 없음")
 
+    def shutdown(self):
+        """백그라운드 작업 정리 (키워드 통계 기록 마무리 포함)"""
+        if self.use_keyword_manager and self.keyword_manager:
+            try:
+                self.keyword_manager.shutdown()
+            except Exception as e:
+                logger.warning(f"키워드 매니저 종료 실패: {e}")
+
+        for executor in (self._fetch_executor, self._hedge_executor):
+            if executor:
+                executor.shutdown(wait=False)
+
     def get_statistics(self) -> dict:
         """통계 정보 반환"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        stats['host_concurrency'] = self.concurrency.get_limits()
+        return stats
 
 
 def test_collector():
@@ -10,10 +10,11 @@ import os
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
+
+from config import load_env
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +27,21 @@ class Notifier:
 
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
 
+    def is_configured(self) -> bool:
+        """Telegram 봇 설정 여부"""
+        return bool(self.bot_token and self.chat_id)
+
+    def build_success_message(self, articles: List[Dict], notion_url: Optional[str] = None) -> str:
+        """성공 알림 메시지 (전송 대기함에 저장 후 send_message로 전송)"""
+        return self._build_success_message(articles, notion_url)
+
+    def send_message(self, message: str) -> bool:
+        """미리 구성한 메시지 전송"""
+        if not self.is_configured():
+            logger.warning("Telegram 설정이 누락되어 알림을 보낼 수 없습니다")
+            return False
+        return self._send_message(message)
+
     def send_success_notification(self, articles: List[Dict], notion_url: Optional[str] = None) -> bool:
         """성공 알림 전송"""
         if not self.bot_token or not self.chat_id:
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Notion API 클라이언트
+연결 재사용 세션, 초당 요청 제한(토큰 버킷), 429/5xx 재시도, 엔드포인트별 지연 시간 집계
+"""
+
+import os
+import re
+import json
+import random
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+NOTION_VERSION = '2022-06-28'
+
+# 재시도 대상 상태 코드 (한도 초과, 일시적 서버 오류)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# 엔드포인트 집계 시 페이지/블록/데이터베이스 ID를 {id}로 치환
+ID_PATTERN = re.compile(r'^[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{12}$')
+
+
+class NotionClient:
+    """Notion 요청 한도(평균 초당 3회)를 지키며 API를 호출하는 클라이언트"""
+
+    def __init__(self, api_key: Optional[str] = None, requests_per_second: Optional[float] = None,
+                 max_retries: Optional[int] = None, timeout: float = 30, max_backoff: float = 30.0):
+        self.api_key = api_key if api_key is not None else os.getenv('NOTION_API_KEY')
+        self.base_url = os.getenv('NOTION_API_BASE_URL', 'https://api.notion.com/v1').rstrip('/')
+        self.requests_per_second = float(requests_per_second or os.getenv('NOTION_REQUESTS_PER_SECOND', '3'))
+        self.max_retries = int(max_retries if max_retries is not None else os.getenv('NOTION_MAX_RETRIES', '5'))
+        self.timeout = timeout
+        self.max_backoff = max_backoff
+
+        # 연결 재사용 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=10)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.api_key}',
+            'Content-Type': 'application/json',
+            'Notion-Version': NOTION_VERSION
+        })
+
+        # 토큰 버킷 (순간 최대 1초치 요청)
+        self._capacity = max(1.0, self.requests_per_second)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.endpoint_stats = {}
+        self.stats = {
+            'requests': 0,
+            'retries': 0,
+            'recovered': 0,
+            'throttled_seconds': 0.0
+        }
+
+    def get(self, path: str, **kwargs) -> requests.Response:
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path: str, payload: Optional[Dict] = None, **kwargs) -> requests.Response:
+        return self.request('POST', path, payload, **kwargs)
+
+    def patch(self, path: str, payload: Optional[Dict] = None, **kwargs) -> requests.Response:
+        return self.request('PATCH', path, payload, **kwargs)
+
+    def request(self, method: str, path: str, payload: Optional[Dict] = None,
+                timeout: Optional[float] = None,
+                recover: Optional[Callable[[], Optional[Dict]]] = None) -> requests.Response:
+        """
+        API 요청 실행 (한도 대기 → 호출 → 429/5xx이면 Retry-After 또는 지수 백오프 후 재시도)
+
+        Args:
+            recover: 중복 실행되면 안 되는 요청(페이지 생성, 블록 추가)이 반영 여부를 알 수 없게 실패했을 때
+                     (429·Retry-After 있는 503 외의 5xx, 연결 오류) 재전송 전에 호출.
+                     이미 반영된 결과(응답 본문)를 찾으면 그 내용의 200 응답을 반환하고, None이면 다시 전송.
+                     확인할 수 없으면 예외를 던지며, 이때와 recover가 없을 때는 재시도하지 않음
+
+        Returns:
+            마지막 응답 (4xx 등 재시도 대상이 아닌 오류는 호출자가 status_code로 판단)
+        """
+        url = f"{self.base_url}/{path.lstrip('/')}"
+        endpoint = self._endpoint_key(method, path)
+        idempotent = self._is_idempotent(method, path)
+        attempt = 0
+
+        while True:
+            self._acquire()
+            started = time.perf_counter()
+
+            try:
+                response = self.session.request(method, url, json=payload, timeout=timeout or self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self._record(endpoint, time.perf_counter() - started, error=True)
+                if attempt >= self.max_retries or not (idempotent or recover):
+                    raise
+                if not idempotent:
+                    known, recovered = self._recover(endpoint, recover)
+                    if not known:
+                        raise
+                    if recovered is not None:
+                        return recovered
+                delay = self._backoff(attempt)
+                logger.warning(f"Notion 연결 오류 ({endpoint}): {e} - {delay:.1f}초 후 재시도")
+            else:
+                retryable = self._is_retryable(method, path, response, recover is not None)
+                self._record(endpoint, time.perf_counter() - started, error=response.status_code >= 400)
+                if not retryable or attempt >= self.max_retries:
+                    return response
+
+                if not idempotent and not self._is_unprocessed(response):
+                    known, recovered = self._recover(endpoint, recover)
+                    if not known:
+                        return response
+                    if recovered is not None:
+                        return recovered
+
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.warning(f"Notion API {response.status_code} ({endpoint}) - {delay:.1f}초 후 재시도 "
+                               f"({attempt + 1}/{self.max_retries})")
+
+            attempt += 1
+            with self._stats_lock:
+                self.stats['retries'] += 1
+                self.stats['throttled_seconds'] += delay
+                self.endpoint_stats[endpoint]['retries'] += 1
+            time.sleep(delay)
+
+    @staticmethod
+    def _is_idempotent(method: str, path: str) -> bool:
+        """같은 요청을 다시 보내도 결과가 같은지 (GET, 데이터베이스 조회, 속성/블록 내용 PATCH)"""
+        path = path.split('?')[0].rstrip('/')
+        if method == 'GET' or (method == 'POST' and path.endswith('/query')):
+            return True
+        return method == 'PATCH' and not path.endswith('/children')
+
+    @staticmethod
+    def _is_unprocessed(response: requests.Response) -> bool:
+        """서버가 요청을 처리하지 않았음이 확실한 응답인지 (429, Retry-After가 있는 503)"""
+        return response.status_code == 429 or (response.status_code == 503 and 'Retry-After' in response.headers)
+
+    def _is_retryable(self, method: str, path: str, response: requests.Response, recoverable: bool = False) -> bool:
+        """
+        재시도 여부
+
+        페이지 생성/블록 추가처럼 중복 실행되면 안 되는 요청은 처리되지 않은 것이 확실한 응답이거나,
+        재전송 전에 반영 여부를 확인할 recover가 있을 때만 재시도 (없으면 한 번 더 보내 중복이 생길 수 있음)
+        """
+        if response.status_code not in RETRY_STATUS_CODES:
+            return False
+        return self._is_idempotent(method, path) or self._is_unprocessed(response) or recoverable
+
+    def _recover(self, endpoint: str, recover: Callable[[], Optional[Dict]]) -> Tuple[bool, Optional[requests.Response]]:
+        """
+        반영 여부 확인 → (확인 성공 여부, 이미 반영된 경우 그 내용의 200 응답)
+
+        확인에 실패하면 (False, None)이며 중복을 막기 위해 재시도하지 않음
+        """
+        try:
+            body = recover()
+        except Exception as e:
+            logger.warning(f"Notion 요청 반영 여부 확인 실패 ({endpoint}): {e} - 중복 방지를 위해 재시도하지 않음")
+            return False, None
+
+        if body is None:
+            return True, None
+
+        logger.info(f"Notion 요청이 이미 반영되어 있어 재전송 생략 ({endpoint})")
+        with self._stats_lock:
+            self.stats['recovered'] += 1
+
+        response = requests.Response()
+        response.status_code = 200
+        response.headers['Content-Type'] = 'application/json'
+        response._content = json.dumps(body).encode('utf-8')
+        return True, response
+
+    def _acquire(self):
+        """토큰 버킷에서 요청 1회분 획득 (부족하면 대기)"""
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self.requests_per_second)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.requests_per_second
+
+            with self._stats_lock:
+                self.stats['throttled_seconds'] += wait
+            time.sleep(wait)
+
+    def _backoff(self, attempt: int) -> float:
+        """지터를 더한 지수 백오프 (초)"""
+        return min(self.max_backoff, 2 ** attempt) * 0.5 + random.uniform(0, 0.5)
+
+    def _retry_after(self, response: requests.Response) -> Optional[float]:
+        """Retry-After 헤더 (초) 해석"""
+        value = response.headers.get('Retry-After')
+        try:
+            return min(self.max_backoff, max(0.0, float(value)))
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _endpoint_key(method: str, path: str) -> str:
+        """집계용 엔드포인트 이름 (예: PATCH /blocks/{id}/children)"""
+        segments = ['{id}' if ID_PATTERN.match(segment) else segment
+                    for segment in path.split('?')[0].strip('/').split('/')]
+        return f"{method} /{'/'.join(segments)}"
+
+    def _record(self, endpoint: str, elapsed: float, error: bool = False):
+        with self._stats_lock:
+            self.stats['requests'] += 1
+            stats = self.endpoint_stats.setdefault(endpoint, {
+                'count': 0, 'errors': 0, 'retries': 0, 'total_seconds': 0.0, 'max_seconds': 0.0
+            })
+            stats['count'] += 1
+            stats['total_seconds'] += elapsed
+            stats['max_seconds'] = max(stats['max_seconds'], elapsed)
+            if error:
+                stats['errors'] += 1
+
+    def get_stats(self) -> Dict:
+        """전체 요청/재시도 수와 엔드포인트별 평균·최대 지연 (ms)"""
+        with self._stats_lock:
+            endpoints = {
+                endpoint: {
+                    'count': stats['count'],
+                    'errors': stats['errors'],
+                    'retries': stats['retries'],
+                    'avg_ms': round(stats['total_seconds'] / stats['count'] * 1000, 1) if stats['count'] else 0,
+                    'max_ms': round(stats['max_seconds'] * 1000, 1)
+                }
+                for endpoint, stats in self.endpoint_stats.items()
+            }
+            return {
+                'requests': self.stats['requests'],
+                'retries': self.stats['retries'],
+                'recovered': self.stats['recovered'],
+                'throttled_seconds': round(self.stats['throttled_seconds'], 2),
+                'endpoints': endpoints
+            }
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 Notion API 대역 서버
+storage_manager.py가 사용하는 엔드포인트(databases, pages, blocks children)를 메모리로 흉내 내어
+실제 Notion 없이 저장 경로를 벤치마크/부하 테스트할 수 있게 함
+
+지원 엔드포인트:
+    GET   /v1/databases/{id}            (고정 스키마: Name, URL, Source, Published, Keywords)
+    POST  /v1/databases/{id}/query      (title/url equals 필터만)
+    POST  /v1/pages                     (children 최대 100개)
+    PATCH /v1/pages/{id}                (속성 갱신)
+    GET   /v1/blocks/{id}/children      (page_size, start_cursor)
+    PATCH /v1/blocks/{id}/children      (after 위치 삽입, 최대 100개)
+    PATCH /v1/blocks/{id}               (블록 내용 수정)
+
+사용법:
+    python notion_stub_server.py --port 8787 --latency-ms 100 --rate-limit 3
+    python notion_stub_server.py --server-error-rate 0.1   # 쓰기를 반영한 뒤 502 응답 (재시도 중복 확인용)
+    NOTION_API_BASE_URL=http://127.0.0.1:8787/v1 python main.py test
+"""
+
+import json
+import time
+import uuid
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from typing import Dict, List, Optional
+
+# Notion API 요청당 children 최대 개수
+MAX_CHILDREN = 100
+
+DEFAULT_DATABASE_PROPERTIES = {
+    'Name': 'title',
+    'URL': 'url',
+    'Source': 'select',
+    'Published': 'date',
+    'Keywords': 'multi_select'
+}
+
+
+class NotionStubState:
+    """대역 서버의 메모리 저장소와 요청 통계"""
+
+    def __init__(self, database_properties: Optional[Dict[str, str]] = None):
+        self.database_properties = dict(database_properties or DEFAULT_DATABASE_PROPERTIES)
+        self.lock = threading.Lock()
+        self.pages = {}
+        self.blocks = {}
+        self.children = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.stats = {
+            'requests': 0,
+            'rate_limited': 0,
+            'injected_errors': 0,
+            'server_errors': 0,
+            'pages_created': 0,
+            'pages_updated': 0,
+            'blocks_created': 0,
+            'blocks_updated': 0,
+            'endpoints': {}
+        }
+
+    def get_stats(self) -> Dict:
+        with self.lock:
+            stats = dict(self.stats)
+            stats['endpoints'] = dict(self.stats['endpoints'])
+            return stats
+
+    def database(self, database_id: str) -> Dict:
+        return {
+            'object': 'database',
+            'id': database_id,
+            'title': [{'plain_text': 'Notion Stub'}],
+            'properties': {
+                name: {'id': name, 'name': name, 'type': prop_type}
+                for name, prop_type in self.database_properties.items()
+            }
+        }
+
+    def validate_properties(self, properties: Dict) -> Optional[str]:
+        for name, value in properties.items():
+            prop_type = self.database_properties.get(name)
+            if prop_type is None:
+                return f"{name} is not a property that exists."
+            if prop_type not in value:
+                return f"{name} is expected to be {prop_type}."
+        return None
+
+    def create_page(self, parent: Dict, properties: Dict, children: List[Dict]) -> Dict:
+        page_id = str(uuid.uuid4())
+        with self.lock:
+            self.pages[page_id] = {'parent': parent, 'properties': properties}
+            self.children[page_id] = []
+            self._insert_blocks(page_id, children, None)
+            self.stats['pages_created'] += 1
+        return self._page_object(page_id)
+
+    def query_pages(self, database_id: str, page_filter: Dict) -> List[Dict]:
+        """데이터베이스 페이지 중 필터(title/url equals)에 맞는 페이지"""
+        name = page_filter.get('property')
+        condition = page_filter.get('title') or page_filter.get('url') or {}
+        with self.lock:
+            matched = []
+            for page_id, page in self.pages.items():
+                if page['parent'].get('database_id') != database_id:
+                    continue
+                value = page['properties'].get(name, {})
+                if 'title' in value:
+                    value = ''.join(part.get('text', {}).get('content', '') for part in value['title'])
+                else:
+                    value = value.get('url')
+                if 'equals' in condition and value == condition['equals']:
+                    matched.append(page_id)
+        return [self._page_object(page_id) for page_id in matched]
+
+    def update_page(self, page_id: str, properties: Dict) -> Optional[Dict]:
+        with self.lock:
+            page = self.pages.get(page_id)
+            if page is None:
+                return None
+            page['properties'].update(properties)
+            self.stats['pages_updated'] += 1
+        return self._page_object(page_id)
+
+    def append_children(self, block_id: str, children: List[Dict], after: Optional[str]) -> Optional[List[Dict]]:
+        with self.lock:
+            if block_id not in self.children:
+                return None
+            if after and after not in self.children[block_id]:
+                return None
+            return self._insert_blocks(block_id, children, after)
+
+    def list_children(self, block_id: str, page_size: int = MAX_CHILDREN,
+                      start_cursor: Optional[str] = None) -> Optional[Dict]:
+        with self.lock:
+            if block_id not in self.children:
+                return None
+            child_ids = self.children[block_id]
+            start = child_ids.index(start_cursor) if start_cursor in child_ids else 0
+            page = child_ids[start:start + page_size]
+            has_more = start + page_size < len(child_ids)
+            return {
+                'object': 'list',
+                'results': [self.blocks[child_id] for child_id in page],
+                'has_more': has_more,
+                'next_cursor': child_ids[start + page_size] if has_more else None
+            }
+
+    def update_block(self, block_id: str, content: Dict) -> Optional[Dict]:
+        with self.lock:
+            block = self.blocks.get(block_id)
+            if block is None:
+                return None
+            block.update(content)
+            self.stats['blocks_updated'] += 1
+            return block
+
+    def _insert_blocks(self, parent_id: str, children: List[Dict], after: Optional[str]) -> List[Dict]:
+        created = []
+        for child in children:
+            block = dict(child, object='block', id=str(uuid.uuid4()), has_children=False)
+            self.blocks[block['id']] = block
+            self.children[block['id']] = []
+            created.append(block)
+
+        siblings = self.children[parent_id]
+        position = siblings.index(after) + 1 if after else len(siblings)
+        siblings[position:position] = [block['id'] for block in created]
+        self.stats['blocks_created'] += len(created)
+        return created
+
+    def _page_object(self, page_id: str) -> Dict:
+        return {
+            'object': 'page',
+            'id': page_id,
+            'url': f"https://www.notion.so/{page_id.replace('-', '')}",
+            'properties': self.pages[page_id]['properties']
+        }
+
+
+class NotionStubServer:
+    """로컬 Notion API 대역 (지연, 429 주입, 초당 요청 한도 설정 가능)"""
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, latency_ms: float = 0.0,
+                 quota_error_rate: float = 0.0, rate_limit: float = 0.0, retry_after: float = 1.0,
+                 database_properties: Optional[Dict[str, str]] = None, server_error_rate: float = 0.0):
+        """
+        Args:
+            latency_ms: 요청당 추가 지연 (ms)
+            quota_error_rate: 무작위 429 응답 비율 (0~1)
+            rate_limit: 초당 평균 요청 한도 (0이면 제한 없음, 초과 시 429)
+            retry_after: 429 응답의 Retry-After (초)
+            server_error_rate: 쓰기(페이지 생성/블록 추가)를 반영한 뒤 502로 응답하는 비율 (0~1)
+        """
+        self.latency_ms = latency_ms
+        self.quota_error_rate = quota_error_rate
+        self.server_error_rate = server_error_rate
+        self.rate_limit = rate_limit
+        self.retry_after = retry_after
+        self.state = NotionStubState(database_properties)
+
+        # 서버 측 토큰 버킷 (Notion처럼 순간 최대 1초치 요청 허용)
+        self._capacity = max(1.0, rate_limit)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'NotionStubServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='notion-stub', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _take_token(self) -> bool:
+        if self.rate_limit <= 0:
+            return True
+
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self.rate_limit)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # 헤더/본문이 나뉘어 전송될 때 Nagle 알고리즘으로 생기는 지연 방지
+            disable_nagle_algorithm = True
+
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                self._handle()
+
+            def do_POST(self):
+                self._handle()
+
+            def do_PATCH(self):
+                self._handle()
+
+            def _send(self, status: int, body: Dict, headers: Optional[Dict] = None):
+                # 처리는 끝났지만 응답이 게이트웨이에서 유실된 상황 흉내
+                if (status == 200 and self.command != 'GET' and not self.path.split('?')[0].endswith('/query')
+                        and server.server_error_rate and random.random() < server.server_error_rate):
+                    with server.state.lock:
+                        server.state.stats['server_errors'] += 1
+                    status, body = 502, {'object': 'error', 'status': 502, 'code': 'bad_gateway',
+                                         'message': 'Bad Gateway'}
+
+                data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _error(self, status: int, code: str, message: str, headers: Optional[Dict] = None):
+                self._send(status, {'object': 'error', 'status': status, 'code': code, 'message': message}, headers)
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                segments = self.path.split('?')[0].strip('/').split('/')
+
+                endpoint = self._endpoint(segments)
+                state = server.state
+                with state.lock:
+                    state.stats['requests'] += 1
+                    state.stats['endpoints'][endpoint] = state.stats['endpoints'].get(endpoint, 0) + 1
+
+                if server.latency_ms:
+                    time.sleep(server.latency_ms / 1000)
+
+                if not self.headers.get('Authorization', '').startswith('Bearer '):
+                    return self._error(401, 'unauthorized', 'API token is invalid.')
+
+                retry_headers = {'Retry-After': f'{server.retry_after:g}'}
+                if not server._take_token():
+                    with state.lock:
+                        state.stats['rate_limited'] += 1
+                    return self._error(429, 'rate_limited', 'Rate limited', retry_headers)
+                if server.quota_error_rate and random.random() < server.quota_error_rate:
+                    with state.lock:
+                        state.stats['injected_errors'] += 1
+                    return self._error(429, 'rate_limited', 'Rate limited', retry_headers)
+
+                try:
+                    body = json.loads(raw) if raw else {}
+                except ValueError:
+                    return self._error(400, 'invalid_json', 'Error parsing JSON body.')
+
+                self._route(segments, body)
+
+            @staticmethod
+            def _endpoint(segments: List[str]) -> str:
+                # 통계용: v1/blocks/{id}/children → blocks/{id}/children
+                parts = segments[1:] if segments and segments[0] == 'v1' else segments
+                return '/'.join('{id}' if i == 1 else part for i, part in enumerate(parts))
+
+            def _route(self, segments: List[str], body: Dict):
+                if not segments or segments[0] != 'v1':
+                    return self._error(404, 'invalid_request_url', 'Invalid request URL.')
+
+                resource, rest = segments[1] if len(segments) > 1 else '', segments[2:]
+                method = self.command
+                state = server.state
+
+                if resource == 'databases' and method == 'GET' and len(rest) == 1:
+                    return self._send(200, state.database(rest[0]))
+
+                if resource == 'databases' and method == 'POST' and len(rest) == 2 and rest[1] == 'query':
+                    results = state.query_pages(rest[0], body.get('filter', {}))
+                    page_size = body.get('page_size', MAX_CHILDREN)
+                    return self._send(200, {'object': 'list', 'results': results[:page_size],
+                                            'has_more': len(results) > page_size, 'next_cursor': None})
+
+                if resource == 'pages' and method == 'POST' and not rest:
+                    children = body.get('children', [])
+                    if len(children) > MAX_CHILDREN:
+                        return self._error(400, 'validation_error',
+                                           f'body.children.length should be ≤ `{MAX_CHILDREN}`')
+                    # 행 모드(기사 데이터베이스)는 같은 스키마로 검증
+                    message = state.validate_properties(body.get('properties', {}))
+                    if message:
+                        return self._error(400, 'validation_error', message)
+                    return self._send(200, state.create_page(body.get('parent', {}), body.get('properties', {}), children))
+
+                if resource == 'pages' and method == 'PATCH' and len(rest) == 1:
+                    message = state.validate_properties(body.get('properties', {}))
+                    if message:
+                        return self._error(400, 'validation_error', message)
+                    page = state.update_page(rest[0], body.get('properties', {}))
+                    if page is None:
+                        return self._error(404, 'object_not_found', f'Could not find page with ID: {rest[0]}.')
+                    return self._send(200, page)
+
+                if resource == 'blocks' and len(rest) == 2 and rest[1] == 'children':
+                    if method == 'GET':
+                        query = parse_qs(urlparse(self.path).query)
+                        page_size = min(MAX_CHILDREN, int(query.get('page_size', [MAX_CHILDREN])[0]))
+                        listing = state.list_children(rest[0], page_size, query.get('start_cursor', [None])[0])
+                        if listing is None:
+                            return self._error(404, 'object_not_found', f'Could not find block with ID: {rest[0]}.')
+                        return self._send(200, listing)
+
+                    if method == 'PATCH':
+                        children = body.get('children', [])
+                        if len(children) > MAX_CHILDREN:
+                            return self._error(400, 'validation_error',
+                                               f'body.children.length should be ≤ `{MAX_CHILDREN}`')
+                        results = state.append_children(rest[0], children, body.get('after'))
+                        if results is None:
+                            return self._error(404, 'object_not_found', f'Could not find block with ID: {rest[0]}.')
+                        return self._send(200, {'object': 'list', 'results': results})
+
+                if resource == 'blocks' and method == 'PATCH' and len(rest) == 1:
+                    block = state.update_block(rest[0], body)
+                    if block is None:
+                        return self._error(404, 'object_not_found', f'Could not find block with ID: {rest[0]}.')
+                    return self._send(200, block)
+
+                self._error(404, 'invalid_request_url', 'Invalid request URL.')
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로컬 Notion API 대역 서버')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8787)
+    parser.add_argument('--latency-ms', type=float, default=0, help='요청당 지연 (ms)')
+    parser.add_argument('--quota-error-rate', type=float, default=0.0, help='무작위 429 비율 (0~1)')
+    parser.add_argument('--rate-limit', type=float, default=0, help='초당 요청 한도 (0이면 제한 없음)')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='429 응답의 Retry-After (초)')
+    parser.add_argument('--server-error-rate', type=float, default=0.0,
+                        help='쓰기를 반영한 뒤 502로 응답하는 비율 (0~1)')
+    args = parser.parse_args()
+
+    server = NotionStubServer(args.host, args.port, args.latency_ms, args.quota_error_rate,
+                              args.rate_limit, args.retry_after, server_error_rate=args.server_error_rate)
+    print(f"🧪 Notion 대역 서버 실행 중: {server.base_url}")
+    print(f"   NOTION_API_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n📊 요청 통계: {server.state.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
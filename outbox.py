@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전송 대기함 (Outbox)
+Notion 저장/Telegram 메시지를 전송 전에 디스크에 기록하고, 실패하면 백오프 후 재전송
+수집(크롤링)과 전송을 분리하여 일시적인 API 장애로 수집 결과를 잃지 않도록 함
+"""
+
+import os
+import uuid
+import socket
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from state_store import load_state, update_state
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_FILE = 'outbox.json'
+
+
+class Outbox:
+    """
+    디스크 기반 전송 대기함 (종류별 전송 함수 등록 후 enqueue → deliver/replay)
+
+    스케줄러와 단발 실행처럼 여러 프로세스가 같은 대기함을 쓰므로 모든 갱신은 파일 잠금(update_state) 안에서
+    하고, 전송 전에 항목을 점유(in_flight, 소유자, 점유 만료 시각)해 같은 항목을 두 번 보내지 않습니다.
+    점유한 프로세스가 비정상 종료하면 점유 만료 후 다른 실행이 다시 가져갑니다.
+    """
+
+    def __init__(self, base_delay: Optional[float] = None, max_delay: Optional[float] = None,
+                 max_attempts: Optional[int] = None):
+        self.base_delay = float(base_delay or os.getenv('OUTBOX_RETRY_BASE_SECONDS', '60'))
+        self.max_delay = float(max_delay or os.getenv('OUTBOX_RETRY_MAX_SECONDS', '3600'))
+        self.max_attempts = int(max_attempts or os.getenv('OUTBOX_MAX_ATTEMPTS', '20'))
+
+        # 포기(dead) 항목은 기사 본문을 담고 있으므로 보관 기간과 개수를 제한
+        self.dead_ttl = timedelta(hours=float(os.getenv('OUTBOX_DEAD_TTL_HOURS', '168')))
+        self.max_dead = int(os.getenv('OUTBOX_MAX_DEAD', '20'))
+
+        # 전송 중 점유 유지 시간 (가장 긴 전송보다 길게)
+        self.lease = timedelta(seconds=float(os.getenv('OUTBOX_LEASE_SECONDS', '900')))
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self._lock = threading.RLock()
+        self._handlers = {}
+
+    def register(self, kind: str, handler: Callable[[Dict], bool]):
+        """
+        전송 함수 등록 (payload를 받아 성공 여부 반환)
+
+        실패 시 전송 함수가 payload에 남긴 진행 정보(예: 생성한 페이지 ID)는 함께 저장되어
+        재전송 때 그대로 전달되므로, 이미 반영된 작업을 반복하지 않을 수 있습니다.
+        """
+        self._handlers[kind] = handler
+
+    def enqueue(self, kind: str, payload: Dict) -> str:
+        """전송 항목을 디스크에 기록하고 ID 반환 (전송은 deliver/replay에서)"""
+        entry = {
+            'id': uuid.uuid4().hex,
+            'kind': kind,
+            'payload': payload,
+            'status': 'pending',
+            'attempts': 0,
+            'created_at': datetime.now().isoformat(),
+            'next_attempt_at': datetime.now().isoformat(),
+            'last_error': None
+        }
+
+        self._update(lambda entries: entries + [entry])
+        return entry['id']
+
+    def deliver(self, entry_id: str) -> bool:
+        """항목 1개 즉시 전송 (점유 후 전송, 성공 시 삭제, 실패 시 백오프 일정 기록)"""
+        claimed = {}
+
+        def claim(entries):
+            entry = next((item for item in entries if item['id'] == entry_id), None)
+            if entry is None:
+                claimed['status'] = 'done'
+            elif entry['status'] == 'dead' or (entry['status'] == 'in_flight' and not self._lease_expired(entry)):
+                claimed['status'] = entry['status']
+            else:
+                entry.update({
+                    'status': 'in_flight',
+                    'owner': self.owner,
+                    'lease_until': (datetime.now() + self.lease).isoformat()
+                })
+                claimed.update(status='claimed', entry=dict(entry))
+            return entries
+
+        self._update(claim)
+
+        if claimed['status'] == 'done':
+            return True  # 이미 전송 완료
+        if claimed['status'] != 'claimed':
+            logger.info(f"전송 대기 항목 건너뜀 ({entry_id[:8]}, {claimed['status']})")
+            return False
+
+        entry = claimed['entry']
+        handler = self._handlers.get(entry['kind'])
+        if not handler:
+            logger.warning(f"전송 함수가 등록되지 않은 항목: {entry['kind']}")
+            self._release(entry_id, entry['payload'], False, '전송 함수 없음', count_attempt=False)
+            return False
+
+        # 전송 중에는 파일 잠금을 풀어 두어 전송 함수나 다른 프로세스가 항목을 enqueue할 수 있게 함
+        error = None
+        try:
+            success = bool(handler(entry['payload']))
+        except Exception as e:
+            success = False
+            error = str(e)
+
+        self._release(entry_id, entry['payload'], success, error)
+        return success
+
+    def _release(self, entry_id: str, payload: Dict, success: bool, error: Optional[str],
+                 count_attempt: bool = True):
+        """점유 해제 (성공 시 삭제, 실패 시 진행 정보와 다음 재시도 시각 기록)"""
+        def release(entries):
+            current = next((item for item in entries if item['id'] == entry_id), None)
+            if current is None or current.get('owner') != self.owner:
+                # 점유가 만료되어 다른 실행이 가져간 항목은 그쪽 결과를 따름
+                logger.warning(f"전송 대기 항목 점유가 만료되어 결과를 기록하지 않음 ({entry_id[:8]})")
+                return entries
+
+            if success:
+                return [item for item in entries if item['id'] != entry_id]
+
+            current.pop('owner', None)
+            current.pop('lease_until', None)
+            current['status'] = 'pending'
+            current['payload'] = payload
+            current['last_error'] = error or '전송 실패'
+            if not count_attempt:
+                return entries
+
+            current['attempts'] += 1
+            if current['attempts'] >= self.max_attempts:
+                current['status'] = 'dead'
+                current['dead_at'] = datetime.now().isoformat()
+                logger.error(f"전송 대기 항목 포기 ({current['kind']}, {current['attempts']}회 실패)")
+            else:
+                delay = min(self.max_delay, self.base_delay * 2 ** (current['attempts'] - 1))
+                current['next_attempt_at'] = (datetime.now() + timedelta(seconds=delay)).isoformat()
+                logger.warning(f"{current['kind']} 전송 실패 - {delay:.0f}초 후 재시도 "
+                               f"({current['attempts']}/{self.max_attempts})")
+            return entries
+
+        self._update(release)
+
+    def replay(self) -> Dict[str, int]:
+        """재시도 시각이 지난 항목(점유가 만료된 항목 포함)을 생성 순서대로 재전송"""
+        now = datetime.now().isoformat()
+        due = []
+
+        def collect(entries):
+            kept = self._prune_dead(entries)
+            due.extend(
+                item['id'] for item in kept
+                if (item['status'] == 'pending' and item['next_attempt_at'] <= now)
+                or (item['status'] == 'in_flight' and self._lease_expired(item))
+            )
+            return kept
+
+        self._update(collect)
+
+        result = {'delivered': 0, 'failed': 0}
+        for entry_id in due:
+            if self.deliver(entry_id):
+                result['delivered'] += 1
+            else:
+                result['failed'] += 1
+
+        if due:
+            logger.info(f"전송 대기함 재전송: 성공 {result['delivered']}건, 실패 {result['failed']}건")
+        return result
+
+    def get_status(self) -> Dict:
+        """대기(전송 중 포함)/포기 항목 수와 가장 오래된 대기 항목 나이 (초)"""
+        entries = self._load()
+
+        pending = [item for item in entries if item['status'] != 'dead']
+        oldest = min((item['created_at'] for item in pending), default=None)
+        return {
+            'pending': len(pending),
+            'in_flight': sum(1 for item in pending if item['status'] == 'in_flight'),
+            'dead': len(entries) - len(pending),
+            'oldest_age_seconds': (datetime.now() - datetime.fromisoformat(oldest)).total_seconds() if oldest else None
+        }
+
+    @staticmethod
+    def _lease_expired(entry: Dict) -> bool:
+        return entry.get('lease_until', '') <= datetime.now().isoformat()
+
+    def _prune_dead(self, entries: List[Dict]) -> List[Dict]:
+        """보관 기간이 지났거나 개수 제한을 넘은 포기 항목 제거 (최근 항목 우선 유지)"""
+        cutoff = (datetime.now() - self.dead_ttl).isoformat()
+        dead = [
+            item for item in entries
+            if item['status'] == 'dead' and item.get('dead_at', item['created_at']) >= cutoff
+        ]
+        dead.sort(key=lambda item: item.get('dead_at', item['created_at']), reverse=True)
+        keep_ids = {item['id'] for item in dead[:self.max_dead]}
+
+        kept = [item for item in entries if item['status'] != 'dead' or item['id'] in keep_ids]
+        if len(kept) != len(entries):
+            logger.info(f"전송 대기함 포기 항목 {len(entries) - len(kept)}건 정리")
+        return kept
+
+    def _load(self) -> List[Dict]:
+        return load_state(OUTBOX_FILE, []) or []
+
+    def _update(self, updater: Callable[[List[Dict]], List[Dict]]):
+        """파일 잠금 안에서 최신 대기함을 읽어 갱신 (프로세스 간 덮어쓰기 방지)"""
+        with self._lock:
+            if not update_state(OUTBOX_FILE, lambda entries: updater(entries or []), []):
+                logger.error("전송 대기함 저장 실패")
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Google Sheets API 호출 래퍼
+요청 속도 제한, 동일 읽기 요청 병합, 429 백오프, 메서드별 호출 수 집계
+"""
+
+import os
+import inspect
+import random
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# 동시에 들어온 동일 요청을 한 번으로 병합할 읽기 메서드
+READ_METHODS = {
+    'get_all_records', 'get_all_values', 'get', 'batch_get', 'col_values', 'row_values',
+    'acell', 'cell', 'values_get', 'worksheet', 'worksheets', 'get_lastUpdateTime',
+    'open', 'open_by_key'
+}
+
+# 반환 시 같은 클라이언트로 감쌀 객체 타입 (gspread 및 가짜 백엔드)
+WRAPPED_TYPES = {'Spreadsheet', 'Worksheet', 'FakeSpreadsheet', 'FakeWorksheet'}
+
+# 이미 받아 둔 메타데이터에서 읽는 속성 (API 호출이 없으므로 한도 적용 제외)
+LOCAL_PROPERTIES = {'id', 'title', 'url', 'index', 'row_count', 'col_count'}
+
+
+class _InFlightCall:
+    """진행 중인 읽기 요청 (병합 대기자에게 결과 공유)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SheetsQuotaClient:
+    """분당 요청 한도를 지키며 gspread 호출을 실행하는 클라이언트"""
+
+    def __init__(self, requests_per_minute: Optional[float] = None,
+                 max_retries: Optional[int] = None, max_backoff: float = 64.0):
+        self.requests_per_minute = float(requests_per_minute or os.getenv('SHEETS_REQUESTS_PER_MINUTE', '50'))
+        self.max_retries = int(max_retries if max_retries is not None else os.getenv('SHEETS_MAX_RETRIES', '5'))
+        self.max_backoff = max_backoff
+
+        # 토큰 버킷 (최대 10초치 요청까지 순간 허용)
+        self._rate = self.requests_per_minute / 60.0
+        self._capacity = max(1.0, self.requests_per_minute / 6)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'calls': {},
+            'coalesced': 0,
+            'quota_errors': 0,
+            'throttled_seconds': 0.0
+        }
+
+    def wrap(self, target: Any) -> Any:
+        """gspread Client/Spreadsheet/Worksheet 객체를 한도 관리 프록시로 감싸기"""
+        if target is None or isinstance(target, QuotaAwareProxy):
+            return target
+        return QuotaAwareProxy(target, self)
+
+    def call(self, method: str, func: Callable, *args, coalesce_key: Optional[tuple] = None, **kwargs) -> Any:
+        """API 호출 실행 (읽기 요청은 coalesce_key 기준으로 병합)"""
+        if coalesce_key is None:
+            return self._call_with_retries(method, func, *args, **kwargs)
+
+        with self._in_flight_lock:
+            in_flight = self._in_flight.get(coalesce_key)
+            owner = in_flight is None
+            if owner:
+                in_flight = _InFlightCall()
+                self._in_flight[coalesce_key] = in_flight
+
+        if not owner:
+            with self._stats_lock:
+                self.stats['coalesced'] += 1
+            in_flight.done.wait()
+            if in_flight.error:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            in_flight.result = self._call_with_retries(method, func, *args, **kwargs)
+            return in_flight.result
+        except Exception as e:
+            in_flight.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(coalesce_key, None)
+            in_flight.done.set()
+
+    def _call_with_retries(self, method: str, func: Callable, *args, **kwargs) -> Any:
+        """한도 대기 후 호출, 429이면 지터를 더한 지수 백오프로 재시도"""
+        attempt = 0
+        while True:
+            self._acquire()
+            with self._stats_lock:
+                self.stats['calls'][method] = self.stats['calls'].get(method, 0) + 1
+
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                if not self._is_quota_error(e) or attempt >= self.max_retries:
+                    raise
+
+                delay = min(self.max_backoff, 2 ** attempt) + random.uniform(0, 1)
+                attempt += 1
+                with self._stats_lock:
+                    self.stats['quota_errors'] += 1
+                    self.stats['throttled_seconds'] += delay
+
+                logger.warning(f"Sheets API 한도 초과 ({method}) - {delay:.1f}초 후 재시도 ({attempt}/{self.max_retries})")
+                time.sleep(delay)
+
+    def _acquire(self):
+        """토큰 버킷에서 요청 1회분 획득 (부족하면 대기)"""
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+
+            with self._stats_lock:
+                self.stats['throttled_seconds'] += wait
+            time.sleep(wait)
+
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        """429 / RESOURCE_EXHAUSTED 여부"""
+        response = getattr(error, 'response', None)
+        if getattr(response, 'status_code', None) == 429:
+            return True
+        if getattr(error, 'code', None) == 429:
+            return True
+        message = str(error)
+        return '429' in message and ('Quota' in message or 'RESOURCE_EXHAUSTED' in message)
+
+    def reset_stats(self):
+        """통계 초기화 (벤치마크 구간 측정용)"""
+        with self._stats_lock:
+            self.stats = {'calls': {}, 'coalesced': 0, 'quota_errors': 0, 'throttled_seconds': 0.0}
+
+    def get_stats(self) -> Dict:
+        """메서드별 호출 수와 한도 관련 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+            stats['calls'] = dict(self.stats['calls'])
+            stats['total_calls'] = sum(stats['calls'].values())
+            stats['throttled_seconds'] = round(stats['throttled_seconds'], 2)
+            return stats
+
+
+class QuotaAwareProxy:
+    """메서드 호출을 SheetsQuotaClient를 통해 실행하는 gspread 객체 프록시"""
+
+    def __init__(self, target: Any, client: SheetsQuotaClient):
+        self._target = target
+        self._client = client
+        self._scope = f"{type(target).__name__}:{getattr(target, 'id', '')}"
+
+    @property
+    def unwrapped(self) -> Any:
+        return self._target
+
+    def get_lastUpdateTime(self) -> Any:
+        """
+        스프레드시트 수정 시각 (Drive API 1회 호출)
+
+        get_lastUpdateTime이 없는 구버전 gspread(5.12 미만)의 lastUpdateTime 속성은
+        시트를 열 때 값이 고정되므로 사용하지 않고 None 반환
+        """
+        if not hasattr(self._target, 'get_lastUpdateTime'):
+            return None
+        return self._client.call('get_lastUpdateTime', self._target.get_lastUpdateTime,
+                                 coalesce_key=(self._scope, 'get_lastUpdateTime'))
+
+    def _wrap_result(self, result: Any) -> Any:
+        """스프레드시트/워크시트(목록 포함)를 같은 클라이언트로 감싸기"""
+        if type(result).__name__ in WRAPPED_TYPES:
+            return self._client.wrap(result)
+        if isinstance(result, (list, tuple)) and any(type(item).__name__ in WRAPPED_TYPES for item in result):
+            return type(result)(self._wrap_result(item) for item in result)
+        return result
+
+    def __getattr__(self, name: str) -> Any:
+        # sheet1처럼 읽는 순간 API를 호출하는 프로퍼티는 평가 자체를 한도/백오프 안에서 실행
+        if name not in LOCAL_PROPERTIES and isinstance(
+                inspect.getattr_static(type(self._target), name, None), property):
+            return self._wrap_result(self._client.call(name, lambda: getattr(self._target, name)))
+
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            # worksheet.spreadsheet 같은 일반 속성은 반환 객체만 감싸기
+            return self._wrap_result(attr)
+
+        def call(*args, **kwargs):
+            coalesce_key = None
+            if name in READ_METHODS:
+                coalesce_key = (self._scope, name, repr(args), repr(sorted(kwargs.items())))
+
+            result = self._client.call(name, attr, *args, coalesce_key=coalesce_key, **kwargs)
+            return self._wrap_result(result)
+
+        return call
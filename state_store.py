@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로컬 상태 저장소
+실행 간에 유지해야 하는 캐시/통계를 data 디렉토리의 JSON 파일로 관리
+"""
+
+import os
+import json
+import logging
+import tempfile
+from typing import Any, Callable
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+def get_data_dir() -> str:
+    """상태 파일 디렉토리 경로 반환 (없으면 생성)"""
+    data_dir = os.getenv('NEWS_AGENT_DATA_DIR', 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    return data_dir
+
+
+def get_state_path(filename: str) -> str:
+    """상태 파일 전체 경로 반환"""
+    return os.path.join(get_data_dir(), filename)
+
+
+def load_state(filename: str, default: Any = None) -> Any:
+    """JSON 상태 파일 로드 (없거나 손상된 경우 기본값 반환)"""
+    path = get_state_path(filename)
+
+    if not os.path.exists(path):
+        return default
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"상태 파일 로드 실패 ({path}): {e}")
+        return default
+
+
+def save_state(filename: str, data: Any) -> bool:
+    """JSON 상태 파일 저장 (임시 파일 작성 후 교체하여 부분 쓰기 방지)"""
+    path = get_state_path(filename)
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, path)
+        return True
+
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"상태 파일 저장 실패 ({path}): {e}")
+        try:
+            os.remove(tmp_path)
+        except (OSError, UnboundLocalError):
+            pass
+        return False
+
+
+def update_state(filename: str, updater: Callable[[Any], Any], default: Any = None) -> bool:
+    """
+    파일 잠금 상태에서 로드 → 갱신 → 저장 (여러 프로세스가 같은 상태 파일을 갱신할 때 사용)
+
+    Args:
+        updater: 현재 파일 내용을 받아 저장할 내용을 반환하는 함수
+    """
+    path = get_state_path(filename)
+
+    with open(f'{path}.lock', 'a') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            return save_state(filename, updater(load_state(filename, default)))
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
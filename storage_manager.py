@@ -5,18 +5,41 @@
 복잡한 블록 구조 없이 효율적인 Notion 페이지 생성
 """
 
-import requests
 import os
+import json
+import time
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Optional
-from dotenv import load_dotenv
+
+from config import load_env
+from notion_api import NotionClient
+from state_store import load_state, save_state
 
 # Load environment variables
-load_dotenv()
+load_env()
 
 logger = logging.getLogger(__name__)
 
+NOTION_SCHEMA_FILE = 'notion_schema.json'
+
+NOTION_URL_INDEX_FILE = 'notion_url_index.json'
+NOTION_DAILY_PAGE_FILE = 'notion_daily_page.json'
+
+# 요청 1회에 담을 수 있는 최대 블록 수 (페이지 생성/블록 추가 공통)
+NOTION_MAX_CHILDREN = 100
+
+# 행 모드: 기사 필드 → 데이터베이스 속성 이름 후보 (스키마에 있는 속성만 기록)
+ROW_PROPERTY_NAMES = {
+    'url': ('URL', 'Url', 'Link', '링크'),
+    'source': ('Source', '언론사', '출처'),
+    'published': ('Published', 'Date', '발행일', '날짜'),
+    'keywords': ('Keywords', 'Tags', '키워드')
+}
+
 class StorageManager:
     """간소화된 Notion 저장 관리자"""
 
@@ -24,25 +47,65 @@ class StorageManager:
         self.api_key = os.getenv('NOTION_API_KEY')
         self.database_id = os.getenv('NOTION_DATABASE_ID')
 
-        self.headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json',
-            'Notion-Version': '2022-06-28'
-        }
+        # 모든 페이지/블록 요청은 한도 관리 클라이언트를 거침
+        self.notion = NotionClient(self.api_key)
 
-    def save_news_to_notion(self, articles: List[Dict]) -> Optional[str]:
-        """뉴스 기사들을 Notion에 저장"""
-        if not self.api_key or not self.database_id:
-            logger.error("Notion API 설정이 누락되었습니다")
-            return None
+        # 데이터베이스 스키마 (제목 속성 이름, 속성 타입) - 로컬 캐시, 스키마 오류 시 재조회
+        self._schemas = {}
+
+        # 마지막 저장의 Notion 구간 소요 시간 (페이지 생성 ~ 마지막 블록 추가)
+        self.last_save_seconds = None
+
+        # 저장 방식 (page: 실행마다 기사 모음 페이지 1개, daily: 하루 1페이지에 새 기사만 추가,
+        #           rows: 기사마다 데이터베이스 행 1개)
+        self.storage_mode = os.getenv('NOTION_STORAGE_MODE', 'page').strip().lower()
+        self.articles_database_id = os.getenv('NOTION_ARTICLES_DATABASE_ID') or self.database_id
+        self.write_workers = int(os.getenv('NOTION_WRITE_WORKERS', '3'))
 
+        # 로컬 SQLite 기사 아카이브 (전문 검색용, 선택)
+        self.archive_enabled = os.getenv('ARCHIVE_ENABLED', 'false').lower() == 'true'
+        self._archive = None
+
+        # 기사 블록 레이아웃 (standard: 기사당 제목/메타/미리보기/북마크/구분선, compact: 기사당 문단 1개)
+        self.page_layout = os.getenv('NOTION_PAGE_LAYOUT', 'standard').strip().lower()
+
+        # 행 모드 중복 확인용 URL → 페이지 ID 로컬 인덱스 (Notion 조회 없이 upsert 판단)
+        self._url_index = None
+        self._url_index_lock = threading.Lock()
+        self.last_save_stats = {}
+
+        # 페이지는 만들었지만 내용 추가가 끝나지 않은 경우의 이어쓰기 정보 (전송 대기함에 기록)
+        self.last_checkpoint = None
+
+        # 마지막 블록 추가 결과 (중간 실패 시 그때까지 추가된 블록 ID, 대상 페이지가 삭제/보관됐는지)
+        self.last_appended_ids = []
+        self.last_append_missing = False
+
+    def save_news_to_notion(self, articles: List[Dict], resume: Optional[Dict] = None) -> Optional[str]:
+        """
+        뉴스 기사들을 Notion에 저장
+
+        Args:
+            resume: 이전 시도의 last_checkpoint (기사 모음 페이지 모드에서 새 페이지 대신 남은 블록만 추가)
+        """
+        self.last_checkpoint = None
         if not articles:
             logger.warning("저장할 기사가 없습니다")
             return None
 
+        if not self.api_key or not self.database_id:
+            logger.error("Notion API 설정이 누락되었습니다")
+            return None
+
+        started = time.perf_counter()
         try:
-            # 페이지 생성
-            page_url = self._create_news_page(articles)
+            # 기사별 행 또는 기사 모음 페이지 생성
+            if self.storage_mode == 'rows':
+                page_url = self._save_article_rows(articles)
+            elif self.storage_mode == 'daily':
+                page_url = self._save_daily_page(articles)
+            else:
+                page_url = self._create_news_page(articles, resume)
 
             if page_url:
                 logger.info(f"Notion 저장 완료: {page_url}")
@@ -55,192 +118,699 @@ class StorageManager:
             logger.error(f"Notion 저장 중 오류: {e}")
             return None
 
-    def _create_news_page(self, articles: List[Dict]) -> Optional[str]:
-        """뉴스 페이지 생성"""
+        finally:
+            self.last_save_seconds = time.perf_counter() - started
+            logger.info(f"Notion 저장 소요 시간: {self.last_save_seconds:.2f}초")
+
+    def archive_articles(self, articles: List[Dict]) -> int:
+        """로컬 SQLite 아카이브에 기사 저장 (실행당 트랜잭션 1회) → 저장 건수"""
+        if not self.archive_enabled:
+            return 0
+
         try:
-            today = datetime.now().strftime('%Y-%m-%d')
-            current_time = datetime.now().strftime('%H:%M')
-
-            # 페이지 제목
-            title = f"🤖 AI News - {today} {current_time}"
-
-            # Title 속성으로 먼저 시도
-            page_data = {
-                "parent": {"database_id": self.database_id},
-                "properties": {
-                    "Title": {
-                        "title": [
-                            {
-                                "type": "text",
-                                "text": {"content": title}
-                            }
-                        ]
-                    }
-                }
-            }
+            if self._archive is None:
+                from article_archive import ArticleArchive
+                self._archive = ArticleArchive()
+            return self._archive.save_articles(articles)
+        except Exception as e:
+            logger.warning(f"기사 아카이브 저장 실패: {e}")
+            return 0
 
-            # 페이지 생성 API 호출
-            url = "https://api.notion.com/v1/pages"
-            response = requests.post(url, headers=self.headers, json=page_data, timeout=30)
+    def _create_news_page(self, articles: List[Dict], resume: Optional[Dict] = None) -> Optional[str]:
+        """뉴스 페이지 생성 (resume가 있으면 이미 만든 페이지에 남은 블록만 추가)"""
+        try:
+            blocks = self._build_content_blocks(articles)
 
-            # Title이 실패하면 Name으로 시도
-            if response.status_code != 200:
-                logger.warning(f"Title 속성 실패: {response.status_code} - {response.text}")
-                logger.info("Name 속성으로 재시도...")
-
-                page_data["properties"] = {
-                    "Name": {
-                        "title": [
-                            {
-                                "type": "text",
-                                "text": {"content": title}
-                            }
-                        ]
+            if resume and resume.get('page_id'):
+                page_id, page_url, blocks_done = resume['page_id'], resume.get('url', ''), resume.get('blocks_done', 0)
+                logger.info(f"이전에 생성한 페이지에 남은 블록 {len(blocks) - blocks_done}개 추가")
+            else:
+                today = datetime.now().strftime('%Y-%m-%d')
+                current_time = datetime.now().strftime('%H:%M')
+
+                # 페이지 제목
+                title = f"🤖 AI News - {today} {current_time}"
+
+                # 첫 100개 블록은 페이지 생성 요청에 함께 전송
+                page_result = self._post_page(title, blocks[:NOTION_MAX_CHILDREN])
+                if not page_result:
+                    return None
+                page_id, page_url = page_result.get('id'), page_result.get('url', '')
+                blocks_done = min(len(blocks), NOTION_MAX_CHILDREN)
+
+            # 나머지 블록 추가 (중간에 실패하면 다음 시도에서 같은 페이지에 이어서 추가)
+            if page_id and blocks_done < len(blocks):
+                if self._add_page_content(page_id, blocks[blocks_done:]) is None:
+                    self.last_checkpoint = {
+                        'page_id': page_id,
+                        'url': page_url,
+                        'blocks_done': blocks_done + len(self.last_appended_ids)
                     }
-                }
+                    return None
 
-                response = requests.post(url, headers=self.headers, json=page_data, timeout=30)
+            return page_url
 
-            if response.status_code == 200:
-                page_result = response.json()
-                page_url = page_result.get('url', '')
-
-                # 페이지 내용 추가
-                if page_result.get('id'):
-                    self._add_page_content(page_result['id'], articles)
+        except Exception as e:
+            logger.error(f"페이지 생성 중 오류: {e}")
+            return None
 
-                return page_url
+    def _post_page(self, title: str, children: List[Dict]) -> Optional[Dict]:
+        """데이터베이스에 페이지 생성 (스키마 불일치 시 1회 재시도) → 페이지 객체"""
+        page_data = {
+            "parent": {"database_id": self.database_id},
+            "properties": self._build_title_property(title)
+        }
+        if children:
+            page_data["children"] = children
+
+        def find_created_page():
+            # 응답을 받지 못한 생성 요청이 실제로 처리됐는지 같은 제목의 페이지로 확인
+            title_property = next(iter(page_data["properties"]))
+            return self._find_page(self.database_id, {"property": title_property, "title": {"equals": title}})
+
+        # 페이지 생성 API 호출 (스키마의 제목 속성 사용, 1회)
+        response = self.notion.post('pages', page_data, recover=find_created_page)
+
+        # 스키마가 바뀌었으면 캐시를 버리고 다시 조회한 제목 속성으로 1회 재시도
+        if self._is_schema_error(response):
+            logger.warning(f"Notion 스키마 불일치: {response.status_code} - {response.text}")
+            previous_property = self._get_title_property()
+            if self._get_database_schema(force_refresh=True):
+                title_property = self._get_title_property()
             else:
-                logger.error(f"페이지 생성 실패: {response.status_code} - {response.text}")
-                return None
+                # 스키마 조회도 실패하면 기존 방식대로 Name 속성으로 시도
+                title_property = 'Name' if previous_property == 'Title' else 'Title'
+
+            if title_property != previous_property:
+                logger.info(f"제목 속성 {previous_property} → {title_property} 로 재시도...")
+                page_data["properties"] = self._build_title_property(title, title_property)
+                response = self.notion.post('pages', page_data, recover=find_created_page)
+
+        if response.status_code == 200:
+            return response.json()
+
+        logger.error(f"페이지 생성 실패: {response.status_code} - {response.text}")
+        return None
+
+    def _save_daily_page(self, articles: List[Dict]) -> Optional[str]:
+        """오늘 페이지가 있으면 새 기사만 이어 붙이고, 없으면 생성 (페이지 ID는 로컬 저장)"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        state = load_state(NOTION_DAILY_PAGE_FILE, {})
+        entry = state.get(self.database_id)
+
+        if entry and entry.get('date') == today:
+            if entry.get('complete', True):
+                page_url = self._append_to_daily_page(entry, articles)
+
+                # 페이지가 삭제/보관된 경우만 새로 생성하고, 그 밖의 실패(한도 초과, 서버 오류 등)는
+                # 추가된 데까지 기록한 뒤 실패로 반환해 전송 대기함이 같은 페이지에 이어서 재시도하게 함
+                if page_url or not self.last_append_missing:
+                    state[self.database_id] = entry
+                    save_state(NOTION_DAILY_PAGE_FILE, state)
+                    return page_url
+                logger.warning("오늘 페이지가 삭제/보관되어 새 페이지로 저장합니다")
+            else:
+                # 이전 실행에서 내용 추가가 중간에 실패한 페이지는 보관 처리 후 새로 생성
+                logger.warning("오늘 페이지가 불완전하게 저장되어 있어 보관 처리 후 다시 생성합니다")
+                self._archive_page(entry['page_id'])
+
+        entry = self._create_daily_page(today, articles)
+        if entry:
+            # 불완전한 페이지도 ID를 기록해 다음 실행에서 같은 날 페이지가 겹치지 않게 함
+            state[self.database_id] = entry
+            save_state(NOTION_DAILY_PAGE_FILE, state)
+
+        if not entry or not entry['complete']:
+            self.last_save_stats = {'appended': 0, 'duplicates': 0, 'failed': len(articles)}
+            return None
+        return entry['url']
+
+    def _create_daily_page(self, today: str, articles: List[Dict]) -> Optional[Dict]:
+        """
+        오늘 페이지 생성 (첫 100개 블록은 생성 요청에 포함) → 상태 항목
+
+        생성 응답에는 블록 ID가 없으므로 헤더/요약/마지막 기사 블록 ID는 하위 블록 목록 1회 조회로 확인합니다.
+        나머지 블록 추가나 ID 확인에 실패하면 complete=False로 표시합니다.
+        """
+        unique_articles = self._unique_articles(articles, set())
+
+        article_blocks = self._build_article_list_blocks(unique_articles)
+        header_blocks = [
+            self._build_heading_block(len(unique_articles)),
+            self._build_summary_block(unique_articles),
+            self._build_divider_block()
+        ]
+        blocks = header_blocks + article_blocks + self._build_footer_blocks()
+
+        page_result = self._post_page(f"🤖 AI News - {today}", blocks[:NOTION_MAX_CHILDREN])
+        if not page_result:
+            return None
+
+        entry = {
+            'date': today,
+            'page_id': page_result['id'],
+            'url': page_result.get('url', ''),
+            'complete': False
+        }
 
+        rest_ids = []
+        if len(blocks) > NOTION_MAX_CHILDREN:
+            rest_ids = self._add_page_content(page_result['id'], blocks[NOTION_MAX_CHILDREN:])
+        inline_ids = self._list_child_block_ids(page_result['id'], min(len(blocks), NOTION_MAX_CHILDREN))
+
+        if rest_ids is None or inline_ids is None or len(inline_ids) + len(rest_ids) != len(blocks):
+            logger.warning("오늘 페이지 내용 추가 또는 블록 ID 확인 실패 - 불완전한 페이지로 기록합니다")
+            return entry
+
+        block_ids = inline_ids + rest_ids
+        self.last_save_stats = {'appended': len(unique_articles), 'duplicates': len(articles) - len(unique_articles)}
+        entry.update({
+            'complete': True,
+            'heading_block_id': block_ids[0],
+            'summary_block_id': block_ids[1],
+            'last_article_block_id': block_ids[len(header_blocks) + len(article_blocks) - 1],
+            'urls': [self._normalize_url(article.get('url', '')) for article in unique_articles],
+            'articles': [self._summary_fields(article) for article in unique_articles]
+        })
+        return entry
+
+    def _list_child_block_ids(self, page_id: str, count: int) -> Optional[List[str]]:
+        """페이지 첫 하위 블록 ID 목록 (최대 100개, 실패 시 None)"""
+        try:
+            response = self.notion.get(f"blocks/{page_id}/children?page_size={count}")
+            if response.status_code == 200:
+                return [block.get('id') for block in response.json().get('results', [])][:count]
+            logger.warning(f"하위 블록 조회 실패: {response.status_code}")
         except Exception as e:
-            logger.error(f"페이지 생성 중 오류: {e}")
+            logger.warning(f"하위 블록 조회 중 오류: {e}")
+        return None
+
+    def _archive_page(self, page_id: str):
+        """페이지 보관 처리 (휴지통으로 이동)"""
+        try:
+            response = self.notion.patch(f"pages/{page_id}", {"archived": True})
+            if response.status_code not in (200, 404):
+                logger.warning(f"페이지 보관 처리 실패: {response.status_code}")
+        except Exception as e:
+            logger.warning(f"페이지 보관 처리 중 오류: {e}")
+
+    def _append_to_daily_page(self, entry: Dict, articles: List[Dict]) -> Optional[str]:
+        """
+        오늘 페이지에 새 기사 블록만 추가하고 헤더/요약 블록 갱신
+
+        중간에 실패하면 끝까지 추가된 기사의 URL과 마지막 블록 ID, 일부만 추가된 기사의 블록 ID(partial)를
+        entry에 기록해 다음 시도가 그 뒤부터 이어서 추가합니다.
+        """
+        self.last_append_missing = False
+        known_urls = set(entry.get('urls', []))
+        new_articles = self._unique_articles(articles, known_urls)
+        duplicates = len(articles) - len(new_articles)
+        self.last_save_stats = {'appended': len(new_articles), 'duplicates': duplicates}
+
+        # 이전 시도에서 일부 블록만 추가된 기사: 같은 기사면 남은 블록만, 아니면 남은 조각을 보관 처리
+        partial = entry.pop('partial', None)
+        skip_blocks = 0
+        if partial:
+            first_url = self._normalize_url(new_articles[0].get('url', '')) if new_articles else None
+            if first_url == partial['url']:
+                skip_blocks = len(partial['block_ids'])
+                entry['last_article_block_id'] = partial['block_ids'][-1]
+            else:
+                for block_id in partial['block_ids']:
+                    try:
+                        self.notion.patch(f"blocks/{block_id}", {"archived": True})
+                    except Exception as e:
+                        logger.warning(f"일부만 추가된 기사 블록 보관 처리 실패: {e}")
+
+        if not new_articles:
+            logger.info("오늘 페이지에 추가할 새 기사가 없습니다")
+            return entry['url']
+
+        # 마지막 기사 블록 뒤(푸터 앞)에 구분선 + 기사 블록 삽입 (기사별 블록 끝 위치 기록)
+        number = len(entry.get('articles', [])) + 1
+        blocks = []
+        article_ends = []
+        for offset, article in enumerate(new_articles):
+            blocks.extend(self._build_article_list_blocks([article], start=number + offset))
+            article_ends.append(len(blocks))
+
+        block_ids = self._add_page_content(entry['page_id'], blocks[skip_blocks:], after=entry['last_article_block_id'])
+        appended_ids = (partial['block_ids'] if skip_blocks else []) + list(block_ids or self.last_appended_ids)
+
+        # 끝까지 추가된 기사만 목록에 반영
+        done = sum(1 for end in article_ends if end <= len(appended_ids))
+        if appended_ids:
+            entry['last_article_block_id'] = appended_ids[-1]
+        entry['urls'] = entry.get('urls', []) + [self._normalize_url(article.get('url', '')) for article in new_articles[:done]]
+        entry['articles'] = entry.get('articles', []) + [self._summary_fields(article) for article in new_articles[:done]]
+
+        if block_ids is None:
+            finished = article_ends[done - 1] if done else 0
+            if len(appended_ids) > finished:
+                entry['partial'] = {
+                    'url': self._normalize_url(new_articles[done].get('url', '')),
+                    'block_ids': appended_ids[finished:]
+                }
+            self.last_save_stats = {'appended': done, 'duplicates': duplicates, 'failed': len(new_articles) - done}
+            logger.warning(f"오늘 페이지 기사 추가 중단: {done}/{len(new_articles)}개 반영 (다음 시도에서 이어서 추가)")
+            return None
+
+        # 헤더 기사 수와 요약 블록을 제자리에서 갱신
+        for block_id, block in (
+            (entry['heading_block_id'], self._build_heading_block(len(entry['articles']))),
+            (entry['summary_block_id'], self._build_summary_block(entry['articles']))
+        ):
+            response = self.notion.patch(f"blocks/{block_id}", {block['type']: block[block['type']]})
+            if response.status_code != 200:
+                logger.warning(f"오늘 페이지 헤더/요약 갱신 실패: {response.status_code}")
+
+        logger.info(f"오늘 페이지에 기사 {len(new_articles)}개 추가 (총 {len(entry['articles'])}개)")
+        return entry['url']
+
+    def _unique_articles(self, articles: List[Dict], known_urls: set) -> List[Dict]:
+        """이미 저장된 URL과 같은 실행 내 중복 URL 제외"""
+        unique = []
+        seen = set(known_urls)
+        for article in articles:
+            url = self._normalize_url(article.get('url', ''))
+            if url and url in seen:
+                continue
+            seen.add(url)
+            unique.append(article)
+        return unique
+
+    @staticmethod
+    def _summary_fields(article: Dict) -> Dict:
+        """요약 재계산에 필요한 기사 필드만 보관"""
+        return {
+            'source': article.get('source', 'Unknown'),
+            'found_keywords': article.get('found_keywords', []),
+            'content_length': article.get('content_length', 0)
+        }
+
+    def _save_article_rows(self, articles: List[Dict]) -> Optional[str]:
+        """기사마다 데이터베이스 행 upsert (URL 기준, 로컬 인덱스로 중복 판단)"""
+        schema = self._get_database_schema(database_id=self.articles_database_id)
+        if not schema:
+            logger.error("기사 데이터베이스 스키마를 확인할 수 없습니다")
             return None
 
+        index = self._load_url_index()
+        stats = {'created': 0, 'updated': 0, 'unchanged': 0, 'failed': 0}
+
+        # 같은 URL은 한 번만
+        unique_articles = {}
+        for article in articles:
+            url = self._normalize_url(article.get('url', ''))
+            if url and url not in unique_articles:
+                unique_articles[url] = article
+
+        results = self._run_row_jobs(self._build_row_jobs(unique_articles, schema, index, stats))
+
+        # 스키마가 바뀌어 거부된 행은 스키마를 다시 조회해 1회 재시도
+        rejected = {url: unique_articles[url] for url, outcome, _, _ in results if outcome == 'schema_error'}
+        if rejected:
+            logger.warning(f"Notion 스키마 불일치로 거부된 기사 행 {len(rejected)}개 - 스키마 재조회 후 재시도")
+            schema = self._get_database_schema(force_refresh=True, database_id=self.articles_database_id)
+            results = [result for result in results if result[1] != 'schema_error']
+            if schema:
+                results += self._run_row_jobs(self._build_row_jobs(rejected, schema, index, stats))
+            else:
+                stats['failed'] += len(rejected)
+
+        for url, outcome, page_id, fingerprint in results:
+            stats['failed' if outcome == 'schema_error' else outcome] += 1
+            if page_id:
+                index[url] = {
+                    'page_id': page_id,
+                    'fingerprint': fingerprint,
+                    'updated_at': datetime.now().isoformat()
+                }
+
+        if stats['created'] or stats['updated']:
+            with self._url_index_lock:
+                all_indexes = load_state(NOTION_URL_INDEX_FILE, {})
+                all_indexes[self.articles_database_id] = index
+                save_state(NOTION_URL_INDEX_FILE, all_indexes)
+
+        self.last_save_stats = stats
+        logger.info(f"Notion 기사 행 저장: 생성 {stats['created']}, 갱신 {stats['updated']}, "
+                    f"변경 없음 {stats['unchanged']}, 실패 {stats['failed']}")
+
+        if stats['failed'] and not (stats['created'] or stats['updated'] or stats['unchanged']):
+            return None
+        return f"https://www.notion.so/{self.articles_database_id.replace('-', '')}"
+
+    def _build_row_jobs(self, articles: Dict[str, Dict], schema: Dict, index: Dict, stats: Dict) -> List[tuple]:
+        """{URL: 기사} → 행 저장 작업 목록 (내용이 같은 기존 행은 요청 없이 건너뜀)"""
+        jobs = []
+        for url, article in articles.items():
+            properties = self._build_row_properties(article, schema)
+            fingerprint = hashlib.sha1(
+                json.dumps(properties, sort_keys=True, ensure_ascii=False).encode('utf-8')
+            ).hexdigest()
+
+            entry = index.get(url)
+            if entry and entry.get('fingerprint') == fingerprint:
+                stats['unchanged'] += 1
+                continue
+
+            jobs.append((url, properties, fingerprint, entry))
+        return jobs
+
+    def _run_row_jobs(self, jobs: List[tuple]) -> List[tuple]:
+        """행 저장 작업 동시 실행 (요청 속도는 NotionClient 한도가 제어하고, 응답 대기만 겹침)"""
+        with ThreadPoolExecutor(max_workers=max(1, self.write_workers)) as executor:
+            return list(executor.map(self._upsert_article_row, jobs))
+
+    def _upsert_article_row(self, job: tuple) -> tuple:
+        """기사 행 1개 갱신 또는 생성 → (URL, 결과, 페이지 ID, 지문)"""
+        url, properties, fingerprint, entry = job
 
-    def _add_page_content(self, page_id: str, articles: List[Dict]):
-        """페이지에 기사 내용 추가"""
         try:
-            blocks = self._build_content_blocks(articles)
+            if entry:
+                response = self.notion.patch(f"pages/{entry['page_id']}", {"properties": properties})
+                if response.status_code == 200:
+                    return url, 'updated', entry['page_id'], fingerprint
+
+                # 삭제/보관된 행이면 새로 생성, 그 밖의 실패(한도 초과, 서버 오류 등)는 기존 행을 유지하고 다음에 재시도
+                if not self._is_missing_page(response):
+                    if self._is_schema_error(response):
+                        return url, 'schema_error', None, fingerprint
+                    logger.warning(f"기존 기사 행 갱신 실패: {response.status_code} - {response.text}")
+                    return url, 'failed', None, fingerprint
+                logger.info(f"기존 기사 행이 삭제/보관됨 ({response.status_code}), 새 행 생성: {url}")
+
+            response = self.notion.post('pages', {
+                "parent": {"database_id": self.articles_database_id},
+                "properties": properties
+            }, recover=lambda: self._find_article_row(properties))
+            if response.status_code == 200:
+                return url, 'created', response.json().get('id'), fingerprint
+            if self._is_schema_error(response):
+                return url, 'schema_error', None, fingerprint
 
-            # 블록을 100개씩 나누어 추가
-            chunk_size = 100
-            for i in range(0, len(blocks), chunk_size):
-                chunk = blocks[i:i + chunk_size]
-                self._add_blocks_to_page(page_id, chunk)
+            logger.warning(f"기사 행 생성 실패: {response.status_code} - {response.text}")
 
         except Exception as e:
-            logger.warning(f"페이지 내용 추가 중 오류: {e}")
+            logger.warning(f"기사 행 저장 중 오류 ({url}): {e}")
+
+        return url, 'failed', None, fingerprint
+
+    def _find_article_row(self, properties: Dict) -> Optional[Dict]:
+        """응답을 받지 못한 행 생성 요청이 실제로 처리됐는지 URL 속성으로 확인"""
+        url_property = next(((name, value['url']) for name, value in properties.items() if 'url' in value), None)
+        if not url_property:
+            raise RuntimeError("URL 속성이 없어 기사 행 생성 여부를 확인할 수 없습니다")
+        name, url = url_property
+        return self._find_page(self.articles_database_id, {"property": name, "url": {"equals": url}})
+
+    def _find_page(self, database_id: str, page_filter: Dict) -> Optional[Dict]:
+        """데이터베이스에서 조건에 맞는 페이지 1개 조회 (없으면 None, 조회 실패 시 예외)"""
+        response = self.notion.post(f"databases/{database_id}/query", {"filter": page_filter, "page_size": 1})
+        if response.status_code != 200:
+            raise RuntimeError(f"데이터베이스 조회 실패: {response.status_code}")
+        results = response.json().get('results', [])
+        return results[0] if results else None
+
+    def _load_url_index(self) -> Dict[str, Dict]:
+        """URL → 페이지 ID 인덱스 (기사 데이터베이스별)"""
+        with self._url_index_lock:
+            if self._url_index is None:
+                self._url_index = load_state(NOTION_URL_INDEX_FILE, {}).get(self.articles_database_id, {})
+            return self._url_index
+
+    @staticmethod
+    def _normalize_url(url: str) -> str:
+        """중복 판단용 URL (앞뒤 공백, #fragment 제거)"""
+        return url.strip().split('#', 1)[0]
+
+    def _build_row_properties(self, article: Dict, schema: Dict) -> Dict:
+        """기사 → 데이터베이스 행 속성 (스키마에 있는 속성만, 타입에 맞춰 변환)"""
+        properties = self._build_title_property(article.get('title', ''), schema.get('title_property') or 'Title')
+
+        published = article.get('published')
+        values = {
+            'url': article.get('url'),
+            'source': article.get('source'),
+            'published': published.isoformat() if isinstance(published, datetime) else published,
+            'keywords': article.get('found_keywords', [])
+        }
 
-    def _build_content_blocks(self, articles: List[Dict]) -> List[Dict]:
-        """콘텐츠 블록 구성"""
-        blocks = []
+        types = schema.get('properties', {})
+        for field, candidates in ROW_PROPERTY_NAMES.items():
+            name = next((candidate for candidate in candidates if candidate in types), None)
+            if not name or not values[field]:
+                continue
+
+            value = self._format_property_value(types[name], values[field])
+            if value is not None:
+                properties[name] = value
+
+        return properties
+
+    @staticmethod
+    def _format_property_value(prop_type: str, value) -> Optional[Dict]:
+        """속성 타입별 Notion 값 형식"""
+        items = value if isinstance(value, list) else [value]
+        text = ', '.join(str(item) for item in items)
+
+        if prop_type == 'url':
+            return {"url": text}
+        if prop_type == 'rich_text':
+            return {"rich_text": [{"type": "text", "text": {"content": text}}]}
+        if prop_type == 'select':
+            return {"select": {"name": str(items[0]).replace(',', ' ')}}
+        if prop_type == 'multi_select':
+            return {"multi_select": [{"name": str(item).replace(',', ' ')} for item in items]}
+        if prop_type == 'date':
+            return {"date": {"start": str(items[0])}}
+        return None
+
+    def _get_database_schema(self, force_refresh: bool = False, database_id: Optional[str] = None) -> Optional[Dict]:
+        """데이터베이스 스키마 반환 (메모리 → 로컬 파일 → databases API 순)"""
+        database_id = database_id or self.database_id
+        if self._schemas.get(database_id) and not force_refresh:
+            return self._schemas[database_id]
+
+        cache = load_state(NOTION_SCHEMA_FILE, {})
+        if not force_refresh and cache.get(database_id):
+            self._schemas[database_id] = cache[database_id]
+            return self._schemas[database_id]
+
+        response = self.notion.get(f"databases/{database_id}")
+        if response.status_code != 200:
+            logger.warning(f"Notion 데이터베이스 스키마 조회 실패: {response.status_code}")
+            if force_refresh:
+                # 스키마 오류로 다시 조회한 경우 낡은 캐시를 재사용하지 않도록 폐기
+                self._invalidate_schema(database_id)
+            return self._schemas.get(database_id)
+
+        return self._cache_schema(response.json(), database_id)
+
+    def _invalidate_schema(self, database_id: str):
+        """메모리/로컬 파일의 스키마 캐시 폐기"""
+        self._schemas.pop(database_id, None)
+        cache = load_state(NOTION_SCHEMA_FILE, {})
+        if cache.pop(database_id, None) is not None:
+            save_state(NOTION_SCHEMA_FILE, cache)
+
+    def _cache_schema(self, db_info: Dict, database_id: Optional[str] = None) -> Dict:
+        """databases API 응답에서 스키마 추출 후 로컬 파일에 저장"""
+        database_id = database_id or self.database_id
+        properties = {name: prop.get('type') for name, prop in db_info.get('properties', {}).items()}
+        title_property = next((name for name, prop_type in properties.items() if prop_type == 'title'), None)
+
+        schema = {
+            'title_property': title_property,
+            'properties': properties,
+            'fetched_at': datetime.now().isoformat()
+        }
+        self._schemas[database_id] = schema
 
-        # 헤더
-        blocks.append({
-            "object": "block",
-            "type": "heading_1",
-            "heading_1": {
-                "rich_text": [
+        cache = load_state(NOTION_SCHEMA_FILE, {})
+        cache[database_id] = schema
+        save_state(NOTION_SCHEMA_FILE, cache)
+
+        logger.info(f"Notion 스키마 캐시 갱신: 제목 속성 '{title_property}', 속성 {len(properties)}개")
+        return schema
+
+    def _get_title_property(self, database_id: Optional[str] = None) -> str:
+        """제목(title) 속성 이름 (스키마를 알 수 없으면 'Title')"""
+        schema = self._get_database_schema(database_id=database_id)
+        return (schema or {}).get('title_property') or 'Title'
+
+    def _build_title_property(self, title: str, title_property: Optional[str] = None) -> Dict:
+        return {
+            title_property or self._get_title_property(): {
+                "title": [
                     {
                         "type": "text",
-                        "text": {"content": f"🤖 AI 뉴스 모음 ({len(articles)}개)"}
+                        "text": {"content": title}
                     }
                 ]
             }
-        })
+        }
 
-        # 요약 정보
-        summary_text = self._generate_summary(articles)
-        blocks.append({
+    @staticmethod
+    def _is_missing_page(response) -> bool:
+        """페이지가 삭제(404)되었거나 보관(archived)되어 수정할 수 없다는 응답인지"""
+        if response.status_code == 404:
+            return True
+        if response.status_code != 400:
+            return False
+        try:
+            error = response.json()
+        except ValueError:
+            return False
+        return error.get('code') == 'object_not_found' or 'archived' in error.get('message', '')
+
+    @staticmethod
+    def _is_schema_error(response) -> bool:
+        """속성 이름/타입 불일치로 인한 요청 거부 여부"""
+        if response.status_code != 400:
+            return False
+        try:
+            return response.json().get('code') == 'validation_error'
+        except ValueError:
+            return False
+
+    def _add_page_content(self, page_id: str, blocks: List[Dict], after: Optional[str] = None) -> Optional[List[str]]:
+        """
+        페이지 생성 요청에 담지 못한 블록 추가 → 추가된 블록 ID 목록 (실패 시 None)
+
+        블록 추가는 페이지 끝(after 지정 시 해당 블록 뒤)에 붙으므로 순서를 지키기 위해
+        100개씩 차례로 요청하고, 중간에 실패하면 뒤 블록이 앞에 끼어들지 않도록 중단합니다.
+        """
+        block_ids = []
+        self.last_appended_ids = block_ids
+        self.last_append_missing = False
+        try:
+            for i in range(0, len(blocks), NOTION_MAX_CHILDREN):
+                chunk = blocks[i:i + NOTION_MAX_CHILDREN]
+                chunk_ids = self._add_blocks_to_page(page_id, chunk, after)
+                if chunk_ids is None:
+                    logger.warning(f"블록 추가 중단: {len(blocks) - i}개 미반영")
+                    return None
+
+                block_ids.extend(chunk_ids)
+                if after and chunk_ids:
+                    after = chunk_ids[-1]
+
+            return block_ids
+
+        except Exception as e:
+            logger.warning(f"페이지 내용 추가 중 오류: {e}")
+            return None
+
+    def _build_content_blocks(self, articles: List[Dict]) -> List[Dict]:
+        """콘텐츠 블록 구성"""
+        blocks = [
+            self._build_heading_block(len(articles)),  # 헤더
+            self._build_summary_block(articles),       # 요약 정보
+            self._build_divider_block()                # 구분선
+        ]
+
+        # 각 기사 추가
+        blocks.extend(self._build_article_list_blocks(articles))
+
+        # 푸터
+        blocks.extend(self._build_footer_blocks())
+
+        return blocks
+
+    @staticmethod
+    def _text_block(block_type: str, content: str) -> Dict:
+        return {
             "object": "block",
-            "type": "paragraph",
-            "paragraph": {
+            "type": block_type,
+            block_type: {
                 "rich_text": [
                     {
                         "type": "text",
-                        "text": {"content": summary_text}
+                        "text": {"content": content}
                     }
                 ]
             }
-        })
+        }
 
-        # 구분선
-        blocks.append({
+    @staticmethod
+    def _build_divider_block() -> Dict:
+        return {
             "object": "block",
             "type": "divider",
             "divider": {}
-        })
+        }
 
-        # 각 기사 추가
-        for i, article in enumerate(articles, 1):
-            # 기사 제목
-            blocks.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": f"{i}. {article['title']}"}
-                        }
-                    ]
-                }
-            })
+    def _build_heading_block(self, article_count: int) -> Dict:
+        return self._text_block("heading_1", f"🤖 AI 뉴스 모음 ({article_count}개)")
 
-            # 메타 정보
-            meta_text = f"📰 {article['source']} | ⏰ {article['published'].strftime('%Y-%m-%d %H:%M')} | 🏷️ {', '.join(article.get('found_keywords', []))}"
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": meta_text}
-                        }
-                    ]
-                }
-            })
+    def _build_summary_block(self, articles: List[Dict]) -> Dict:
+        return self._text_block("paragraph", self._generate_summary(articles))
+
+    def _build_article_list_blocks(self, articles: List[Dict], start: int = 1) -> List[Dict]:
+        """기사 목록 블록 (start번부터 번호, 기본 레이아웃은 기사 사이에 구분선)"""
+        blocks = []
+        for number, article in enumerate(articles, start):
+            if number > 1 and self.page_layout != 'compact':
+                blocks.append(self._build_divider_block())
+            blocks.extend(self._build_article_blocks(article, number))
+        return blocks
+
+    def _build_article_blocks(self, article: Dict, number: int) -> List[Dict]:
+        """기사 1개 블록 (제목, 메타 정보, 미리보기, 링크)"""
+        if self.page_layout == 'compact':
+            return [self._build_compact_article_block(article, number)]
+
+        blocks = []
+
+        # 기사 제목
+        blocks.append(self._text_block("heading_2", f"{number}. {article['title']}"))
+
+        # 메타 정보
+        meta_text = f"📰 {article['source']} | ⏰ {article['published'].strftime('%Y-%m-%d %H:%M')} | 🏷️ {', '.join(article.get('found_keywords', []))}"
+        blocks.append(self._text_block("paragraph", meta_text))
 
-            # 첫 문장 또는 요약
-            preview_text = self._get_article_preview(article)
+        # 첫 문장 또는 요약
+        preview_text = self._get_article_preview(article)
+        blocks.append(self._text_block("paragraph", f"💡 {preview_text}"))
+
+        # 기사 링크 (북마크)
+        if article.get('url'):
             blocks.append({
                 "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": f"💡 {preview_text}"}
-                        }
-                    ]
+                "type": "bookmark",
+                "bookmark": {
+                    "url": article['url']
                 }
             })
 
-            # 기사 링크 (북마크)
-            if article.get('url'):
-                blocks.append({
-                    "object": "block",
-                    "type": "bookmark",
-                    "bookmark": {
-                        "url": article['url']
-                    }
-                })
+        return blocks
 
-            # 기사 간 구분선 (마지막 기사 제외)
-            if i < len(articles):
-                blocks.append({
-                    "object": "block",
-                    "type": "divider",
-                    "divider": {}
-                })
+    def _build_compact_article_block(self, article: Dict, number: int) -> Dict:
+        """
+        압축 레이아웃: 기사 1개 = 문단 블록 1개
 
-        # 푸터
-        blocks.extend(self._build_footer_blocks())
+        기본 레이아웃과 같은 정보(제목·링크, 언론사, 발행 시각, 키워드, 미리보기)를
+        서식 있는 텍스트 조각으로 담고, 링크는 북마크 대신 제목에 연결합니다.
+        """
+        meta_text = f"📰 {article['source']} | ⏰ {article['published'].strftime('%Y-%m-%d %H:%M')} | 🏷️ {', '.join(article.get('found_keywords', []))}"
 
-        return blocks
+        title = {"type": "text", "text": {"content": f"{number}. {article['title']}"}, "annotations": {"bold": True}}
+        if article.get('url'):
+            title["text"]["link"] = {"url": article['url']}
+
+        return {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [
+                    title,
+                    {"type": "text", "text": {"content": f"\n{meta_text}"}, "annotations": {"color": "gray"}},
+                    {"type": "text", "text": {"content": f"\n💡 {self._get_article_preview(article)}"}}
+                ]
+            }
+        }
 
     def _generate_summary(self, articles: List[Dict]) -> str:
         """기사 모음 요약 생성"""
@@ -332,24 +902,84 @@ class StorageManager:
 
         return blocks
 
-    def _add_blocks_to_page(self, page_id: str, blocks: List[Dict]):
-        """페이지에 블록 추가"""
+    def _add_blocks_to_page(self, page_id: str, blocks: List[Dict], after: Optional[str] = None) -> Optional[List[str]]:
+        """페이지에 블록 추가 → 추가된 블록 ID 목록 (실패 시 None)"""
         try:
-            url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-            response = requests.patch(
-                url,
-                headers=self.headers,
-                json={"children": blocks},
-                timeout=30
-            )
+            payload = {"children": blocks}
+            if after:
+                payload["after"] = after
+            response = self.notion.patch(f"blocks/{page_id}/children", payload,
+                                         recover=lambda: self._find_appended_blocks(page_id, blocks, after))
 
             if response.status_code == 200:
                 logger.info(f"블록 {len(blocks)}개 추가 성공")
-            else:
-                logger.warning(f"블록 추가 실패: {response.status_code}")
+                return [block.get('id') for block in response.json().get('results', [])]
+
+            self.last_append_missing = self._is_missing_page(response)
+            logger.warning(f"블록 추가 실패: {response.status_code}")
+            return None
 
         except Exception as e:
             logger.warning(f"블록 추가 중 오류: {e}")
+            return None
+
+    def _find_appended_blocks(self, page_id: str, blocks: List[Dict], after: Optional[str] = None) -> Optional[Dict]:
+        """
+        응답을 받지 못한 블록 추가 요청이 실제로 처리됐는지 하위 블록 목록으로 확인
+
+        after 블록 바로 뒤(after가 없으면 페이지 끝)에 같은 내용의 블록이 같은 순서로 있으면
+        추가된 것으로 보고 블록 추가 응답 형식으로 반환 (없으면 None, 조회 실패 시 예외)
+        """
+        children = self._list_all_children(page_id)
+        child_ids = [child.get('id') for child in children]
+
+        if after:
+            if after not in child_ids:
+                raise RuntimeError(f"기준 블록을 찾을 수 없습니다: {after}")
+            start = child_ids.index(after) + 1
+        else:
+            start = len(children) - len(blocks)
+
+        candidates = children[start:start + len(blocks)] if start >= 0 else []
+        if len(candidates) == len(blocks) and all(
+            self._block_fingerprint(child) == self._block_fingerprint(block)
+            for child, block in zip(candidates, blocks)
+        ):
+            return {'object': 'list', 'results': candidates}
+        return None
+
+    def _list_all_children(self, page_id: str) -> List[Dict]:
+        """페이지의 하위 블록 전체 (100개씩 페이지 단위 조회, 실패 시 예외)"""
+        children = []
+        cursor = None
+        while True:
+            path = f"blocks/{page_id}/children?page_size={NOTION_MAX_CHILDREN}"
+            if cursor:
+                path += f"&start_cursor={cursor}"
+            response = self.notion.get(path)
+            if response.status_code != 200:
+                raise RuntimeError(f"하위 블록 조회 실패: {response.status_code}")
+
+            data = response.json()
+            children.extend(data.get('results', []))
+            if not data.get('has_more') or not data.get('next_cursor'):
+                return children
+            cursor = data['next_cursor']
+
+    @staticmethod
+    def _block_fingerprint(block: Dict) -> tuple:
+        """블록 비교용 (타입, 본문 텍스트, 링크) - 요청 형식과 응답 형식 공통"""
+        block_type = block.get('type')
+        content = block.get(block_type) or {}
+        text = ''.join(
+            part.get('plain_text') or part.get('text', {}).get('content', '')
+            for part in content.get('rich_text', [])
+        )
+        return block_type, text, content.get('url')
+
+    def get_api_stats(self) -> Dict:
+        """Notion API 요청 통계 (엔드포인트별 호출 수/지연, 재시도)"""
+        return self.notion.get_stats()
 
     def test_connection(self) -> bool:
         """Notion 연결 테스트"""
@@ -359,11 +989,11 @@ class StorageManager:
 
         try:
             # 데이터베이스 정보 조회
-            url = f"https://api.notion.com/v1/databases/{self.database_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.notion.get(f"databases/{self.database_id}", timeout=10)
 
             if response.status_code == 200:
                 db_info = response.json()
+                self._cache_schema(db_info)
                 print(f"✅ Notion 연결 성공: {db_info.get('title', [{}])[0].get('plain_text', 'Unknown')}")
                 return True
             else: